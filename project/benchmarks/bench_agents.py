@@ -0,0 +1,229 @@
+"""Routing and handler benchmarks for utils/ai_agents.py
+
+Run from the project directory:
+
+    python -m benchmarks.bench_agents --output bench_agents.json
+
+Results are a single JSON document so runs can be diffed or tracked over
+time. By default handlers run against a fixture executor with canned
+command output, so the numbers measure agent code rather than the host;
+pass --live to execute real commands through the runners.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List
+
+from utils.agent_registry import AgentRegistry
+from utils.ai_agents import AgentRouter
+from utils.command_executor import ProcessTable
+
+CORPUS_PATH = Path(__file__).parent / "agent_routing_corpus.jsonl"
+
+# Canned command output used when not running --live
+FIXTURE_OUTPUTS = {
+    "ls -la": "total 24\ndrwxr-xr-x 5 user user 4096 Dec  1 10:30 .\n-rw-r--r-- 1 user user  156 Dec  1 10:30 app.py",
+    "pwd": "/home/user/commandhub",
+    "whoami": "commandhub-user",
+    "date": "Mon Dec  1 10:35:42 UTC 2025",
+    "df -h": "Filesystem      Size  Used Avail Use% Mounted on\n/dev/sda1        20G  8.5G   11G  44% /",
+    "free -h": (
+        "               total        used        free      shared  buff/cache   available\n"
+        "Mem:           8.0Gi       2.1Gi       4.2Gi       256Mi       1.7Gi       5.5Gi\n"
+        "Swap:          2.0Gi          0B       2.0Gi"
+    ),
+    "ps aux": (
+        "USER       PID %CPU %MEM    VSZ   RSS TTY      STAT START   TIME COMMAND\n"
+        "root      1234 12.5  3.2 123456 65536 ?        S    10:00   0:05 python3 app.py\n"
+        "www-data  5678  8.1  2.1  98765 43210 ?        S    09:30   0:12 nginx: worker\n"
+        "postgres  9012  4.3  1.8  87654 32109 ?        S    09:00   0:08 postgres: server\n"
+        "user      3456  2.1  0.8  45678 16384 pts/0    S+   10:15   0:02 bash"
+    )
+}
+
+FIXTURE_CONTAINERS = [
+    {"name": "web-server", "image": "nginx:latest", "status": "running", "ports": ["80:80"]},
+    {"name": "database", "image": "postgres:13", "status": "running", "ports": ["5432:5432"]},
+    {"name": "cache", "image": "redis:alpine", "status": "running", "ports": ["6379:6379"]}
+]
+
+class FixtureExecutor:
+    """Executor stand-in that serves canned output without touching the host"""
+
+    def __init__(self):
+        self.table = ProcessTable.parse(FIXTURE_OUTPUTS["ps aux"])
+
+    def run(self, command: str, timeout: int = 30, use_cache: bool = True) -> Dict[str, Any]:
+        output = FIXTURE_OUTPUTS.get(command, f"output of {command}")
+        return {"success": True, "output": output, "error": "", "exit_code": 0, "cached": True}
+
+    def process_table(self, use_cache: bool = True) -> ProcessTable:
+        return self.table
+
+    def docker_containers(self, all_containers: bool = False) -> List[Dict[str, Any]]:
+        return FIXTURE_CONTAINERS
+
+def load_corpus(path: Path) -> List[Dict[str, str]]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def make_router(live: bool) -> AgentRouter:
+    router = AgentRouter(AgentRegistry())
+    if not live:
+        executor = FixtureExecutor()
+        for name in router.registry.keys():
+            router.registry.get(name).executor = executor
+    return router
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        "count": len(samples),
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": percentile(samples, 50) * 1e6,
+        "p99_us": percentile(samples, 99) * 1e6,
+        "max_us": max(samples) * 1e6
+    }
+
+def bench_routing_throughput(router: AgentRouter, corpus: List[Dict[str, str]], iterations: int) -> Dict[str, Any]:
+    """Requests per second through _select_agent and route_many"""
+    requests = [item["request"] for item in corpus]
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for request in requests:
+            router._select_agent(request)
+    select_elapsed = time.perf_counter() - started
+    total = iterations * len(requests)
+
+    batch = requests * max(1, iterations // 10)
+    started = time.perf_counter()
+    router.route_many(batch)
+    batch_elapsed = time.perf_counter() - started
+
+    for name in router.registry.loaded():
+        router.clear_agent_history(name)
+
+    return {
+        "select_agent": {"requests": total, "seconds": select_elapsed, "requests_per_sec": total / select_elapsed},
+        "route_many": {"requests": len(batch), "seconds": batch_elapsed, "requests_per_sec": len(batch) / batch_elapsed}
+    }
+
+def bench_handler_latency(router: AgentRouter, corpus: List[Dict[str, str]], repeats: int) -> Dict[str, Any]:
+    """Per-agent process_request latency distribution"""
+    samples = defaultdict(list)
+    for item in corpus:
+        agent = router.agents[router._select_agent(item["request"])]
+        for _ in range(repeats):
+            started = time.perf_counter()
+            agent.process_request(item["request"])
+            samples[agent.name].append(time.perf_counter() - started)
+        agent.clear_history()
+
+    return {name: latency_summary(values) for name, values in sorted(samples.items())}
+
+def bench_history_memory(router: AgentRouter, corpus: List[Dict[str, str]], total_requests: int,
+                         samples: int = 10) -> Dict[str, Any]:
+    """Traced memory growth of conversation_history while routing requests"""
+    requests = [item["request"] for item in corpus]
+    checkpoint = max(1, total_requests // samples)
+    curve = []
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for index in range(total_requests):
+        router.route_request(requests[index % len(requests)])
+        if (index + 1) % checkpoint == 0:
+            current, _ = tracemalloc.get_traced_memory()
+            curve.append({"requests": index + 1, "bytes": current - baseline})
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    history_entries = {name: len(agent.conversation_history) for name, agent in router.registry.loaded().items()}
+    for name in history_entries:
+        router.clear_agent_history(name)
+
+    growth = current - baseline
+    return {
+        "requests": total_requests,
+        "bytes_total": growth,
+        "bytes_per_request": growth / total_requests,
+        "peak_bytes": peak - baseline,
+        "history_entries": history_entries,
+        "curve": curve
+    }
+
+def bench_accuracy(router: AgentRouter, corpus: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Routing accuracy and per-agent precision/recall against the labels"""
+    confusion = defaultdict(lambda: defaultdict(int))
+    misroutes = []
+    for item in corpus:
+        predicted = router._select_agent(item["request"])
+        confusion[item["agent"]][predicted] += 1
+        if predicted != item["agent"]:
+            misroutes.append({"request": item["request"], "expected": item["agent"], "predicted": predicted})
+
+    per_agent = {}
+    for name in router.registry.keys():
+        true_positive = confusion[name][name]
+        predicted_total = sum(row[name] for row in confusion.values())
+        actual_total = sum(confusion[name].values())
+        per_agent[name] = {
+            "precision": true_positive / predicted_total if predicted_total else 0.0,
+            "recall": true_positive / actual_total if actual_total else 0.0,
+            "support": actual_total
+        }
+
+    return {
+        "accuracy": (len(corpus) - len(misroutes)) / len(corpus),
+        "total": len(corpus),
+        "per_agent": per_agent,
+        "misroutes": misroutes
+    }
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Benchmark agent routing and handlers")
+    parser.add_argument("--corpus", default=str(CORPUS_PATH), help="Labelled JSONL corpus ({request, agent})")
+    parser.add_argument("--routing-iterations", type=int, default=2000, help="Passes over the corpus for routing throughput")
+    parser.add_argument("--handler-repeats", type=int, default=200, help="Calls per corpus request for handler latency")
+    parser.add_argument("--history-requests", type=int, default=100_000, help="Requests routed for the history memory test")
+    parser.add_argument("--live", action="store_true", help="Execute real commands instead of fixture output")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus(Path(args.corpus))
+    router = make_router(args.live)
+
+    results = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "live": args.live,
+        "corpus_size": len(corpus),
+        "routing_throughput": bench_routing_throughput(router, corpus, args.routing_iterations),
+        "handler_latency": bench_handler_latency(router, corpus, args.handler_repeats),
+        "history_memory": bench_history_memory(router, corpus, args.history_requests),
+        "routing_accuracy": bench_accuracy(router, corpus)
+    }
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+        print(f"Wrote benchmark results to {args.output}", file=sys.stderr)
+    else:
+        print(report)
+
+if __name__ == "__main__":
+    main()
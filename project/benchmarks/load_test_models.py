@@ -0,0 +1,151 @@
+"""Load test for the model inference service (utils/model_server.py)
+
+Run from the project directory:
+
+    python -m benchmarks.load_test_models --clients 32 --duration 10
+
+Without --url an in-process server is started on a free port. Each client
+keeps one HTTP/1.1 connection open and sends single-record /predict
+requests back to back; a final phase posts /batch requests. Results are a
+single JSON document with throughput and latency percentiles.
+"""
+
+import argparse
+import http.client
+import json
+import platform
+import random
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List
+from urllib.parse import urlparse
+
+SAMPLE_RECORDS = {
+    "titanic": lambda rng: {
+        "Pclass": rng.choice([1, 2, 3]), "Sex": rng.choice(["male", "female"]), "Age": rng.randint(1, 80),
+        "SibSp": rng.randint(0, 4), "Parch": rng.randint(0, 3), "Fare": round(rng.uniform(5, 250), 2),
+        "Embarked": rng.choice(["S", "C", "Q"])
+    },
+    "salary": lambda rng: {"YearsExperience": round(rng.uniform(1, 25), 1)}
+}
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def summarize(latencies: List[float], errors: int, seconds: float, records_per_request: int = 1) -> Dict[str, Any]:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(seconds, 3),
+        "requests_per_sec": round(len(latencies) / seconds, 1) if seconds else 0.0,
+        "records_per_sec": round(len(latencies) * records_per_request / seconds, 1) if seconds else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 3) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50), 3),
+            "p99": round(percentile(latencies, 99), 3),
+            "max": round(max(latencies), 3) if latencies else 0.0
+        }
+    }
+
+def run_phase(host: str, port: int, path: str, make_body, clients: int, duration: float,
+              records_per_request: int = 1) -> Dict[str, Any]:
+    """Drive ``clients`` keep-alive connections for ``duration`` seconds"""
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client(seed: int):
+        rng = random.Random(seed)
+        connection = http.client.HTTPConnection(host, port, timeout=30)
+        local, failed = [], 0
+        while time.perf_counter() < stop_at:
+            body = json.dumps(make_body(rng))
+            started = time.perf_counter()
+            try:
+                connection.request("POST", path, body, {"Content-Type": "application/json"})
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    failed += 1
+                    continue
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                connection.close()
+                connection = http.client.HTTPConnection(host, port, timeout=30)
+                continue
+            local.append((time.perf_counter() - started) * 1000)
+        connection.close()
+        with lock:
+            latencies.extend(local)
+            errors[0] += failed
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(seed,)) for seed in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(latencies, errors[0], time.perf_counter() - started, records_per_request)
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Load test the model inference service")
+    parser.add_argument("--url", help="Existing service URL (default: start one in-process)")
+    parser.add_argument("--model", default="titanic", choices=sorted(SAMPLE_RECORDS))
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per phase")
+    parser.add_argument("--batch-size", type=int, default=256, help="Records per /batch request")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    server = service = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        from utils.model_server import ModelService, create_server
+
+        service = ModelService()
+        server = create_server("127.0.0.1", 0, service)
+        host, port = server.server_address
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    make_record = SAMPLE_RECORDS[args.model]
+    try:
+        results = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "model": args.model,
+            "clients": args.clients,
+            "single": run_phase(host, port, f"/predict/{args.model}", make_record, args.clients, args.duration),
+            "batch": run_phase(
+                host, port, f"/batch/{args.model}",
+                lambda rng: {"rows": [make_record(rng) for _ in range(args.batch_size)]},
+                max(1, args.clients // 4), args.duration, args.batch_size
+            )
+        }
+        if service is not None:
+            results["micro_batching"] = service.stats()
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+        print(f"Wrote load test results to {args.output}", file=sys.stderr)
+    else:
+        print(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Cold-start import benchmark for the Streamlit pages
+
+Run from the project directory:
+
+    python -m benchmarks.startup_bench --output startup.json
+    python -m benchmarks.startup_bench --baseline startup.json --tolerance 0.2
+
+Each page's module-level imports are executed in a fresh interpreter
+(``-X importtime``) several times after one discarded warm-up run; the
+median wall time, minus a bare interpreter start, is the page's import
+cost. With --budget-ms or --baseline the run exits non-zero when a page
+gets slower, so it can guard against a heavy import creeping back to the
+top of a page. Gating always uses at least MIN_GATE_REPEATS runs, and a
+flagged page is measured again and judged on the median of all its runs
+before the check fails.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List
+
+from utils.lazy_imports import page_import_statements, parse_importtime, top_level_costs
+
+DEFAULT_PAGES = [
+    "pages/streamlit_titanic_model.py",
+    "pages/streamlit_salary_predict.py",
+    "pages/Ai_agent_streamlit.py",
+    "pages/Medicine_info_chatbot.py",
+    "pages/Chatbot.py"
+]
+
+# A single cold sample swings well past any useful tolerance
+MIN_GATE_REPEATS = 5
+# Slowdowns smaller than this are within process-start jitter on a quick page
+DEFAULT_MIN_DELTA_MS = 10.0
+
+def time_run(code: str) -> Dict[str, Any]:
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+    elapsed = (time.perf_counter() - started) * 1000
+    return {"ms": elapsed, "ok": completed.returncode == 0, "stderr": completed.stderr}
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "samples_ms": [round(sample, 2) for sample in samples]
+    }
+
+def bench_page(page: str, repeats: int, baseline_ms: float, top: int) -> Dict[str, Any]:
+    code = "\n".join(page_import_statements(page))
+    time_run(code)  # warm the OS file cache so the first sample isn't an outlier
+    runs = [time_run(code) for _ in range(repeats)]
+    failed = [run for run in runs if not run["ok"]]
+    if failed:
+        lines = failed[0]["stderr"].strip().splitlines()
+        return {"error": lines[-1] if lines else "import failed"}
+    result = summarize([max(0.0, run["ms"] - baseline_ms) for run in runs])
+    result["heaviest_imports"] = top_level_costs(parse_importtime(runs[-1]["stderr"]), top)
+    return result
+
+def remeasure(results: Dict[str, Any], pages: List[str], repeats: int, top: int):
+    """Add another batch of runs to flagged pages and re-take the median over all samples"""
+    for page in pages:
+        extra = bench_page(page, repeats, results["interpreter_ms"], top)
+        if "error" in extra:
+            continue
+        combined = summarize(results["pages"][page]["samples_ms"] + extra["samples_ms"])
+        results["pages"][page].update(combined)
+
+def check_regressions(results: Dict[str, Any], budget_ms: float = None, baseline: Dict[str, Any] = None,
+                      tolerance: float = 0.2, min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> List[str]:
+    flagged = flagged_pages(results, budget_ms, baseline, tolerance, min_delta_ms)
+    return [problem for problems in flagged.values() for problem in problems]
+
+def flagged_pages(results: Dict[str, Any], budget_ms: float = None, baseline: Dict[str, Any] = None,
+                  tolerance: float = 0.2, min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> Dict[str, List[str]]:
+    flagged: Dict[str, List[str]] = {}
+    for page, result in results["pages"].items():
+        if "error" in result:
+            continue
+        problems = []
+        runs = len(result.get("samples_ms", []))
+        if budget_ms is not None and result["median_ms"] > budget_ms:
+            problems.append(f"{page}: median {result['median_ms']:.0f} ms of {runs} runs "
+                            f"exceeds budget of {budget_ms:.0f} ms")
+        previous = (baseline or {}).get("pages", {}).get(page, {})
+        if "median_ms" in previous and result["median_ms"] > max(previous["median_ms"] * (1 + tolerance),
+                                                                 previous["median_ms"] + min_delta_ms):
+            problems.append(f"{page}: median {result['median_ms']:.0f} ms of {runs} runs "
+                            f"vs baseline {previous['median_ms']:.0f} ms")
+        if problems:
+            flagged[page] = problems
+    return flagged
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Benchmark cold-start import time of the pages")
+    parser.add_argument("pages", nargs="*", default=DEFAULT_PAGES)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="Heaviest imports to report per page")
+    parser.add_argument("--budget-ms", type=float, help="Fail if any page's median exceeds this")
+    parser.add_argument("--baseline", help="Earlier JSON result to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown vs baseline (0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="Ignore slowdowns vs baseline smaller than this many ms")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    gating = args.budget_ms is not None or args.baseline is not None
+    if gating and args.repeats < MIN_GATE_REPEATS:
+        print(f"Using {MIN_GATE_REPEATS} repeats instead of {args.repeats}: a regression check "
+              f"needs a median of several runs", file=sys.stderr)
+        args.repeats = MIN_GATE_REPEATS
+
+    time_run("pass")
+    interpreter_ms = statistics.median(time_run("pass")["ms"] for _ in range(args.repeats))
+    results = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "interpreter_ms": round(interpreter_ms, 2),
+        "pages": {page: bench_page(page, args.repeats, interpreter_ms, args.top) for page in args.pages}
+    }
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8")) if args.baseline else None
+    flagged = flagged_pages(results, args.budget_ms, baseline, args.tolerance, args.min_delta_ms)
+    if flagged:
+        print(f"Re-measuring {len(flagged)} flagged page(s) before failing", file=sys.stderr)
+        remeasure(results, list(flagged), args.repeats, args.top)
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+        print(f"Wrote startup benchmark to {args.output}", file=sys.stderr)
+    else:
+        print(report)
+
+    problems = check_regressions(results, args.budget_ms, baseline, args.tolerance, args.min_delta_ms)
+    for problem in problems:
+        print(f"REGRESSION {problem}", file=sys.stderr)
+    if problems:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
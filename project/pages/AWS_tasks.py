@@ -3,6 +3,8 @@ import json
 import streamlit.components.v1 as components
 from pathlib import Path
 
+from utils.catalog import render_section
+
 # Page config
 st.set_page_config(
     page_title="CommandHub - Multi-Platform Interface",
@@ -72,78 +74,4 @@ load_css()
 
 
 # Feature Cards
-st.markdown("## ------ AWS Tasks--------")
-
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown("""
-    <div class="feature-card">
-        <h3># a blog on the AWS user case studies</h3>
-        <a href="https://www.linkedin.com/posts/lakshya-chalana-886306285_generativeai-adobefirefly-aws-activity-7348980563728359424-cZYW?utm_source=social_share_send&utm_medium=member_desktop_web&rcm=ACoAAEVHYWYBuyhNONblNN_cYP0KU9JSzwHJAjE">
-            <button style='margin-top: 10px; width: 100%; padding: 0.5em; border: none; border-radius: 5px;
-                           background-color: #00B2FF; color: white; font-weight: bold; cursor: pointer;'>
-                 View On Linkedin
-            </button>
-        </a>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
-    <div class="feature-card">
-        <h3># With the help of Boto3, launch and terminate EC2 instance</h3>
-        <a href="https://www.linkedin.com/posts/lakshya-chalana-886306285_cloudops-cloudcomputing-pythonautomation-activity-7349493851738296320-XS4s?utm_source=social_share_send&utm_medium=member_desktop_web&rcm=ACoAAEVHYWYBuyhNONblNN_cYP0KU9JSzwHJAjE">
-            <button style='margin-top: 10px; width: 100%; padding: 0.5em; border: none; border-radius: 5px;
-                           background-color: #00B2FF; color: white; font-weight: bold; cursor: pointer;'>
-                 View On Linkedin
-            </button>
-        </a>
-    </div>
-    """, unsafe_allow_html=True)
-
-
-col3, col4 = st.columns(2)
-
-with col3:
-    st.markdown("""
-    <div class="feature-card">
-        <h3># event-driven architecture</h3>
-        <a href="https://www.linkedin.com/posts/lakshya-chalana-886306285_aws-eventdrivenarchitecture-s3-activity-7353468381674512385-SLRm?utm_source=social_share_send&utm_medium=member_desktop_web&rcm=ACoAAEVHYWYBuyhNONblNN_cYP0KU9JSzwHJAjE">
-            <button style='margin-top: 10px; width: 100%; padding: 0.5em; border: none; border-radius: 5px;
-                           background-color: #00B2FF; color: white; font-weight: bold; cursor: pointer;'>
-                 View On Linkedin
-            </button>
-        </a>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col4:
-    st.markdown("""
-    <div class="feature-card">
-        <h3># Connect Python to MongoDB service of AWS using Lambda</h3>
-        <a href="https://www.linkedin.com/posts/lakshya-chalana-886306285_reactjs-microservices-eda-activity-7351646233880375296-kU6d?utm_source=social_share_send&utm_medium=member_desktop_web&rcm=ACoAAEVHYWYBuyhNONblNN_cYP0KU9JSzwHJAjE">
-            <button style='margin-top: 10px; width: 100%; padding: 0.5em; border: none; border-radius: 5px;
-                           background-color: #00B2FF; color: white; font-weight: bold; cursor: pointer;'>
-                 View On Linkedin
-            </button>
-        </a>
-    </div>
-    """, unsafe_allow_html=True)
-
-col3, col4 = st.columns(2)
-
-with col3:
-    st.markdown("""
-    <div class="feature-card">
-        <h3># Find a way to upload an object to an S3 bucket without logging into AWS</h3>
-        <a href="https://www.linkedin.com/posts/lakshya-chalana-886306285_aws-eventdrivenarchitecture-s3-activity-7353468381674512385-SLRm?utm_source=social_share_send&utm_medium=member_desktop_web&rcm=ACoAAEVHYWYBuyhNONblNN_cYP0KU9JSzwHJAjE">
-            <button style='margin-top: 10px; width: 100%; padding: 0.5em; border: none; border-radius: 5px;
-                           background-color: #00B2FF; color: white; font-weight: bold; cursor: pointer;'>
-                 View On Linkedin
-            </button>
-        </a>
-    </div>
-    """, unsafe_allow_html=True)
-
-
+render_section("aws_tasks")
@@ -2,14 +2,19 @@ import streamlit as st
 import subprocess
 import platform
 import os
-import google.generativeai as genai
-from langchain.agents import tool
+import uuid
 from dotenv import load_dotenv
+from utils.agent_pipeline import AgentPipeline
+from utils.lazy_imports import lazy_import
+
+# langchain is imported only when a command is actually run
+langchain_agents = lazy_import("langchain.agents")
 
 load_dotenv()
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
 
-@tool
+# Deadline for one agent request, including parallel diagnostic sub-tasks
+AGENT_TIMEOUT = 30.0
+
 def get_date(_: str = "") -> str:
     """Returns the current system date."""
     try:
@@ -19,7 +24,6 @@ def get_date(_: str = "") -> str:
     except Exception as e:
         return f"Failed to get date: {e}"
 
-@tool
 def get_calendar(_: str = "") -> str:
     """Returns the current calendar (Linux only)."""
     if platform.system() != "Linux":
@@ -30,7 +34,6 @@ def get_calendar(_: str = "") -> str:
     except Exception as e:
         return f"Failed to get calendar: {e}"
 
-@tool
 def get_ip_config(_: str = "") -> str:
     """Shows network configuration."""
     try:
@@ -47,7 +50,6 @@ def get_ip_config(_: str = "") -> str:
     except Exception as e:
         return f"Failed to get IP config: {e}"
 
-@tool
 def list_files(_: str = "") -> str:
     """Lists files in the current directory."""
     try:
@@ -57,7 +59,6 @@ def list_files(_: str = "") -> str:
     except Exception as e:
         return f"Failed to list files: {e}"
 
-@tool
 def make_directory(dir_name: str) -> str:
     """Creates a directory with the given name."""
     try:
@@ -66,6 +67,16 @@ def make_directory(dir_name: str) -> str:
     except Exception as e:
         return f"Failed to create directory: {e}"
 
+@st.cache_resource
+def as_tool(fn):
+    """Wrap a command function as a langchain tool (built once per function)"""
+    return langchain_agents.tool(fn)
+
+@st.cache_resource
+def get_agent_pipeline():
+    """One agent pipeline (event loop thread and agents) shared by all sessions"""
+    return AgentPipeline(default_timeout=AGENT_TIMEOUT)
+
 def get_tool_from_query(query: str):
     tool_map = {
         "date": get_date,
@@ -114,7 +125,29 @@ if user_input:
         else:
             if tool_fn == make_directory:
                 folder_name = extract_directory_name(user_input)
-                result = tool_fn.run(folder_name)
+                result = as_tool(tool_fn).run(folder_name)
             else:
-                result = tool_fn.run("")
+                result = as_tool(tool_fn).run("")
             st.code(result, language="bash")
+
+# Agents run on the pipeline's event loop with a deadline. Each browser session has
+# one in-flight request: a rerun with a new question supersedes the previous one,
+# and clearing the question cancels it.
+st.header("Ask the Agents")
+if "agent_session_id" not in st.session_state:
+    st.session_state["agent_session_id"] = uuid.uuid4().hex
+agent_session_id = st.session_state["agent_session_id"]
+
+question = st.text_input("Ask about Docker, Linux, code or commands:",
+                         placeholder="e.g., why is my container slow?")
+
+if question:
+    with st.spinner("Asking the agents..."):
+        answer = get_agent_pipeline().run(question, timeout=AGENT_TIMEOUT, session_id=agent_session_id)
+    st.caption(f"{answer['agent']} · {answer['latency_ms']:.0f} ms")
+    if answer["success"]:
+        st.markdown(answer["response"])
+    else:
+        st.warning(answer["response"])
+else:
+    get_agent_pipeline().cancel(agent_session_id)
@@ -1,7 +1,11 @@
 import streamlit as st
-import requests
 import os
+import time
 from dotenv import load_dotenv
+from utils.chat_history import ChatSession
+from utils.llm_clients import get_client
+from utils.model_router import ModelRouter, ModelUnavailableError
+from utils.response_cache import ResponseCache
 
 # Load environment variables from .env
 load_dotenv()
@@ -13,80 +17,128 @@ if not API_KEY:
     st.error(" GEMINI_API_KEY not found in environment variables. Please set it in your .env file.")
     st.stop()
 
-# Gemini Client
-class GeminiClient:
-    def __init__(self, api_key):
-        self.api_key = api_key
-        self.url = "https://generativelanguage.googleapis.com/v1beta"
-        self.chat = self.Chat(self)
-
-    class Chat:
-        def __init__(self, parent):
-            self.parent = parent
-            self.completions = self.Completions(parent)
-
-        class Completions:
-            def __init__(self, parent):
-                self.parent = parent
-
-            def create(self, model, messages):
-                contents = []
-                for m in messages:
-                    role = "user" if m["role"] != "assistant" else "model"
-                    contents.append({"role": role, "parts": [{"text": m["content"]}]})
-
-                r = requests.post(
-                    f"{self.parent.url}/models/{model}:generateContent?key={self.parent.api_key}",
-                    json={
-                        "contents": contents,
-                        "generationConfig": {"temperature": 0.7, "maxOutputTokens": 500}
-                    }
-                )
-
-                r.raise_for_status()
-                data = r.json()
-                st.write("🔍 Gemini API Raw Response:", data)
-
-                try:
-                    text = data["candidates"][0]["content"]["parts"][0]["text"]
-                except (KeyError, IndexError):
-                    text = data.get("promptFeedback", {}).get("blockReason", "⚠️ No valid response.")
-
-                class Msg: content = text
-                class Choice: message = Msg()
-                class Response: choices = [Choice()]
-                return Response()
-
-
-def suggest(domain, query):
-    messages = [
-        {"role": "user", "content": f"You are a domain expert in {domain}. Keep advice crisp, practical, and in bullet points.\n\n{query}"}
-    ]
-    try:
-        response = client.chat.completions.create("gemini-2.5-flash", messages)
-    except requests.exceptions.HTTPError:
-        st.warning("⚠️ gemini-2.5-flash failed, trying gemini-1.5-flash...")
-        response = client.chat.completions.create("gemini-1.5-flash", messages)
-
+@st.cache_resource
+def get_response_cache():
+    """Answer cache shared by all sessions and persisted across restarts"""
+    return ResponseCache(path=".cache/chatbot_responses.json", ttl=24 * 3600, max_entries=2000)
+
+
+@st.cache_resource
+def get_model_router():
+    """Model router shared by all sessions, so breaker state and latency stats accumulate"""
+    return ModelRouter(["gemini-2.5-flash", "gemini-1.5-flash"], hedge_min_delay=2.0)
+
+
+def get_chat(domain):
+    """Per-domain conversation for this browser session"""
+    chats = st.session_state.setdefault("chat_sessions", {})
+    if domain not in chats:
+        chats[domain] = ChatSession(
+            system_prompt=f"You are a domain expert in {domain}. Keep advice crisp, practical, and in bullet points.",
+            token_budget=2000,
+            summary_budget=300
+        )
+    return chats[domain]
+
+
+def suggest(chat, stream=False, hedge=False):
+    """Return the advice text, or an iterator of text chunks when streaming"""
+    messages = chat.build_messages()
+    response, model = model_router.call(
+        lambda model: client.chat.completions.create(model, messages, stream=stream),
+        hedge=hedge,
+        stream=stream
+    )
+    if model != model_router.models[0]:
+        st.caption(f"Answered by {model}")
+
+    if stream:
+        st.session_state.pop("last_raw_response", None)
+        return response
+    # Keep only a reference; it is rendered only when the debug panel is on
+    st.session_state["last_raw_response"] = response.raw
     return response.choices[0].message.content
 
 
 st.set_page_config(page_title="Gemini Expert Advisor", layout="centered")
 st.title("Gemini Expert Advisor")
 
-# Initialize Gemini client
-client = GeminiClient(api_key=API_KEY)
+# Shared Gemini client (one warm connection pool per process, reused across reruns and pages)
+client = get_client("gemini", API_KEY)
+response_cache = get_response_cache()
+model_router = get_model_router()
 
-# Domain & Question Input
+# Domain & Conversation
 domain = st.selectbox("Choose your domain", ["Health", "Sports", "Tech", "Non-Tech", "Startup", "Education"])
-question = st.text_area("Ask your question", placeholder="e.g. How can I build a strong startup team?")
-
-# Button Action
-if st.button("Get Expert Suggestion"):
-    if question.strip():
-        with st.spinner("Thinking..."):
-            answer = suggest(domain, question)
-        st.markdown("### 💡 Expert Advice")
-        st.markdown(answer)
+stream = st.toggle("Stream response", value=True)
+hedge = st.sidebar.checkbox("Hedge slow requests", help="Ask a second model when the first is slower than usual")
+debug = st.sidebar.checkbox("Show raw API response", help="Debug panel with the last Gemini payload")
+
+chat = get_chat(domain)
+if st.sidebar.button("New conversation"):
+    chat.clear()
+
+for turn in chat.transcript:
+    with st.chat_message(turn.role):
+        st.markdown(turn.content)
+
+question = st.chat_input("Ask your question (e.g. How can I build a strong startup team?)")
+
+if question and question.strip():
+    # Only the opening question of a conversation is context-free enough to cache
+    first_turn = not chat.transcript
+    with st.chat_message("user"):
+        st.markdown(question)
+    chat.add("user", question)
+
+    cached_answer = response_cache.get(domain, question) if first_turn else None
+    with st.chat_message("assistant"):
+        if cached_answer is not None:
+            st.session_state.pop("last_raw_response", None)
+            answer = cached_answer
+            st.markdown(answer)
+            st.caption("⚡ Served from cache")
+        else:
+            answer = None
+            started = time.perf_counter()
+            try:
+                if stream:
+                    with st.spinner("Thinking..."):
+                        chunks = suggest(chat, stream=True, hedge=hedge)
+                    answer = st.write_stream(chunks)
+                else:
+                    with st.spinner("Thinking..."):
+                        answer = suggest(chat, hedge=hedge)
+                    st.markdown(answer)
+            except ModelUnavailableError as e:
+                st.error(f"⚠️ Gemini is unavailable right now: {e}")
+            if answer and first_turn:
+                response_cache.put(domain, question, answer, time.perf_counter() - started)
+
+    if answer:
+        chat.add("assistant", answer)
     else:
-        st.warning("Please enter a question.")
+        # Drop the unanswered question so the next attempt starts clean
+        chat.discard_last()
+
+st.sidebar.caption(f"Prompt size: ~{chat.prompt_tokens} tokens ({len(chat.turns)} recent turns)")
+
+# Debug panel, only built when requested
+if debug:
+    raw = st.session_state.get("last_raw_response")
+    with st.expander("🔍 Gemini API Raw Response"):
+        if raw is None:
+            st.caption("No raw payload yet (cached and streamed answers have none).")
+        else:
+            st.json(raw, expanded=False)
+
+# Cache statistics
+stats = response_cache.stats()
+with st.sidebar.expander("Response cache"):
+    st.metric("Hit rate", f"{stats['hit_rate']:.0%}", help=f"{stats['hits']} of {stats['lookups']} questions")
+    st.metric("API time saved", f"{stats['saved_seconds']:.1f}s")
+    st.caption(f"{stats['entries']} cached answers · {stats['near_hits']} near-duplicate hits")
+
+with st.sidebar.expander("Model health"):
+    for model, model_stats in model_router.stats().items():
+        st.caption(f"**{model}**: {model_stats['state']} · p50 {model_stats['p50']:.2f}s · p95 {model_stats['p95']:.2f}s")
@@ -1,9 +1,16 @@
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
-from openai import OpenAI
 import os
 from dotenv import load_dotenv
+from utils.lazy_imports import lazy_import
+from utils.llm_clients import OPENAI_COMPAT_GEMINI_URL, get_client
+from utils.medicine_catalog import DEFAULT_CATALOG_PATH, CatalogStore
+from utils.medicine_lookup import MedicineLookup, records_from_soup
+from utils.scrape_cache import ScrapeCache
+from utils.text_index import BM25Index, chunk_text, extract_visible_text
+
+# bs4 is only needed when a new page version has to be parsed
+bs4 = lazy_import("bs4")
 
 # Load environment variables from .env file
 load_dotenv()
@@ -16,31 +23,95 @@ if not gemini_api_key:
     st.error("⚠️ GEMINI_API_KEY not found. Please add it to your .env file or Streamlit secrets.")
     st.stop()
 
-# Get content from 1mg
-response = requests.get("https://www.1mg.com")
-htmlaicontent = response.text
-mysoup = BeautifulSoup(markup=htmlaicontent, features="html.parser")
+SOURCE_URL = "https://www.1mg.com"
 
-# Set up the Gemini model through OpenAI interface
-gemini_model = OpenAI(
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
-    api_key=gemini_api_key
-)
+@st.cache_resource
+def get_scrape_cache():
+    """Scrape cache shared across reruns; revalidates in the background"""
+    return ScrapeCache(ttl=6 * 3600, refresh_interval=300)
+
+@st.cache_resource(max_entries=2)
+def parse_page(content_hash, _html):
+    """Parse each distinct page version once"""
+    return bs4.BeautifulSoup(markup=_html, features="html.parser")
+
+# Get content from 1mg (network only on a cold cache or once per TTL)
+try:
+    page = get_scrape_cache().get(SOURCE_URL)
+except requests.exceptions.RequestException as e:
+    st.error(f"⚠️ Could not fetch {SOURCE_URL}: {e}")
+    st.stop()
+htmlaicontent = page.text
+mysoup = parse_page(page.content_hash, htmlaicontent)
+
+@st.cache_resource
+def get_retrieval_index():
+    """BM25 index over the scraped text, updated incrementally per page version"""
+    return BM25Index()
+
+@st.cache_resource(max_entries=2)
+def build_chunks(content_hash, _soup):
+    return chunk_text(extract_visible_text(_soup), chunk_words=120, overlap=30)
+
+retrieval_index = get_retrieval_index()
+retrieval_index.sync(page.content_hash, build_chunks(page.content_hash, mysoup))
+
+@st.cache_resource
+def get_catalog():
+    """Crawled medicine catalog (python -m utils.medicine_crawler), if one has been built"""
+    if not DEFAULT_CATALOG_PATH.exists():
+        return None
+    return CatalogStore()
+
+def format_catalog_rows(rows):
+    lines = []
+    for row in rows:
+        status = "available" if row["available"] else "not available"
+        details = [f"salts: {row['salts'] or 'unknown'}", status]
+        if row["manufacturer"]:
+            details.append(f"by {row['manufacturer']}")
+        if row["price"]:
+            details.append(f"MRP ₹{row['price']}")
+        lines.append(f"- {row['name']} ({', '.join(details)}) {row['url']}")
+    return "\n".join(lines)
+
+@st.cache_resource
+def get_medicine_lookup():
+    """Structured name → salts/availability table for answering without the LLM"""
+    return MedicineLookup(min_score=0.75)
+
+catalog = get_catalog()
+medicine_lookup = get_medicine_lookup()
+lookup_version = f"{page.content_hash}:{catalog.count() if catalog is not None else 0}"
+if medicine_lookup.version != lookup_version:
+    lookup_records = catalog.all_medicines() if catalog is not None else []
+    medicine_lookup.build(lookup_version, lookup_records + records_from_soup(mysoup, SOURCE_URL))
+
+def get_gemini_model():
+    """Gemini through the OpenAI interface; shared client, built (and openai imported) on first LLM call"""
+    return get_client("openai", gemini_api_key, base_url=OPENAI_COMPAT_GEMINI_URL)
 
 # Define the chatbot function
-def chatbot(userprompt):
+def chatbot(userprompt, top_k=5):
+    # Send only the excerpts relevant to this question, not the whole page
+    excerpts = [chunk for _, chunk in retrieval_index.search(userprompt, k=top_k)]
+    if catalog is not None:
+        rows = catalog.search(userprompt, limit=top_k)
+        if rows:
+            excerpts.insert(0, "Catalog entries:\n" + format_catalog_rows(rows))
+    context = "\n\n---\n\n".join(excerpts) if excerpts else "(no relevant content found)"
     my_msg = [
         {
             "role": "system",
             "content": (
                 "You are an AI assistant. Your duty is to give information about medicines "
-                "available or not and their salts, based on the following content:\n\n"
-                f"{htmlaicontent}"
+                "available or not and their salts, based on the following excerpts from 1mg.com:\n\n"
+                f"{context}"
             )
         },
         {"role": "user", "content": userprompt}
     ]
-    response = gemini_model.chat.completions.create(
+    response = get_gemini_model().chat.completions.create(
         model="gemini-2.5-flash",
         messages=my_msg
     )
@@ -55,7 +126,14 @@ user_input = st.text_input(
 )
 
 if user_input:
-    with st.spinner("Thinking..."):
-        answer = chatbot(user_input)
+    # Fast path: confident exact/fuzzy name match answers straight from the table
+    hit = medicine_lookup.lookup(user_input)
+    if hit is not None:
+        answer = hit["answer"]
+    else:
+        with st.spinner("Thinking..."):
+            answer = chatbot(user_input)
     st.markdown("### Answer:")
     st.write(answer)
+    if hit is not None:
+        st.caption(f"Answered from the medicine catalog (match score {hit['score']:.2f}) — {hit['record']['url']}")
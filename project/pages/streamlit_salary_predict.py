@@ -1,7 +1,22 @@
 import streamlit as st
-import joblib
+import plotly.graph_objects as go
+from utils.batch_scoring import read_chunks, salary_scorer, score_to_csv, take_download
+from utils.datasets import load_dataset
+from utils.model_registry import get_default_registry
+from utils.salary_model import FEATURE, MODEL_NAME, curve_lookup, prediction_curve
 
-model = joblib.load("my_salary_model.pkl")
+@st.cache_data(max_entries=4)
+def get_salary_curve(model_version, start=0.0, stop=25.0, step=0.1):
+    """Whole what-if curve in one vectorized predict, computed once per model version"""
+    return prediction_curve(get_default_registry().get(MODEL_NAME), start, stop, step)
+
+@st.cache_data
+def load_salary_data():
+    return load_dataset("salary")
+
+# Loaded once per process; reruns read it from memory
+registry = get_default_registry()
+model = registry.get(MODEL_NAME)
 st.title("Employee Salary Prediction Based On Experience")
 st.write("Enter your Experience:")
 
@@ -10,3 +25,45 @@ Exp = st.number_input("Enter your Experience:", min_value=1, max_value=25 )
 if st.button("Predict"):
     result = model.predict([[Exp]])
     st.write(f"Your salary is ₹{result[0]:,.2f}")
+
+# What-if sweep: the slider reads from the cached curve, no model call per move
+st.header("What-if: Salary vs Experience")
+curve = get_salary_curve(registry.version(MODEL_NAME))
+what_if = st.slider("Years of experience", 0.0, 25.0, 5.0, 0.1)
+what_if_salary = curve_lookup(curve, what_if)
+st.metric("Predicted salary", f"₹{what_if_salary:,.2f}")
+
+figure = go.Figure()
+figure.add_trace(go.Scatter(x=curve[FEATURE], y=curve["Salary"], mode="lines", name="Prediction"))
+salary_data = load_salary_data()
+figure.add_trace(go.Scatter(x=salary_data[FEATURE], y=salary_data["Salary"], mode="markers", name="Training data",
+                            marker={"size": 6, "opacity": 0.6}))
+figure.add_trace(go.Scatter(x=[what_if], y=[what_if_salary], mode="markers", name="Selected",
+                            marker={"size": 12, "color": "crimson"}))
+figure.update_layout(xaxis_title="Years of experience", yaxis_title="Salary (₹)", height=380,
+                     margin={"l": 10, "r": 10, "t": 30, "b": 10})
+st.plotly_chart(figure, use_container_width=True)
+
+# Batch scoring
+st.header("Batch Scoring")
+uploaded = st.file_uploader("Experience file with a YearsExperience column (CSV or Parquet)", type=["csv", "parquet"])
+chunk_rows = st.number_input("Rows per chunk", 1_000, 1_000_000, 50_000, step=10_000)
+
+if uploaded is not None and st.button("Score file"):
+    status = st.empty()
+    try:
+        report = score_to_csv(
+            read_chunks(uploaded, uploaded.name, int(chunk_rows)),
+            salary_scorer(model),
+            progress=lambda rows, seconds: status.write(f"Scored {rows:,} rows in {seconds:.1f}s")
+        )
+    except (ValueError, ImportError) as e:
+        st.error(f"Could not score file: {e}")
+    else:
+        status.success(f"Scored {report['rows']:,} rows at {report['rows_per_sec']:,.0f} rows/sec")
+        data = take_download(report["path"])
+        if data is None:
+            st.warning(f"Predictions are {report['bytes'] / 1e6:,.0f} MB compressed, over the download limit. "
+                       f"They are kept on the server at {report['path']} for an hour.")
+        else:
+            st.download_button("Download predictions", data, file_name="salary_predictions.csv.gz", mime="application/gzip")
@@ -1,46 +1,55 @@
 # pages/Titanic Survival Predictor.py
 
+import json
 import streamlit as st
-import pandas as pd
-from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score
+from utils.batch_scoring import read_chunks, score_to_csv, take_download, titanic_scorer
+from utils.datasets import load_dataset
+from utils.experiments import SEARCH_SPACES, ExperimentRunner, grid_candidates, random_candidates
+from utils.lazy_imports import lazy_import
+from utils.model_cache import ModelCache, fingerprint
+from utils.model_registry import get_default_registry
+from utils import titanic_model
+
+# Only the experiments leaderboard builds a DataFrame here
+pd = lazy_import("pandas")
 
 st.set_page_config(page_title="Titanic Predictor", layout="centered")
 st.title("🚢 Titanic Survival Predictor")
 
-# Load CSV
+# Typed load; memory-maps a Parquet copy after the first run
 @st.cache_data
-def load_data():
-    return pd.read_csv("titanic (1).csv")  
+def load_data(data_version):
+    return load_dataset("titanic")
+
+@st.cache_resource
+def get_model_cache():
+    """Trained artifacts shared by all sessions and persisted under .cache/models"""
+    return ModelCache()
+
+@st.cache_resource(show_spinner="Training model...")
+def get_model_path(data_version, params_json):
+    """Train once per (dataset, hyperparameters); reruns only do inference"""
+    return str(titanic_model.ensure_trained(get_model_cache(), load_data(data_version), json.loads(params_json)))
 
-df = load_data()
+# Served from the process-wide registry (loaded once, hot-reloaded if the artifact changes).
+# The dataset version and promoted params are re-checked on the registry's interval, so
+# reruns in between do no disk I/O.
+registry = get_default_registry()
+data_version, model_params = titanic_model.get_training_inputs(registry.check_interval).get()
+df = load_data(data_version)
 
 # Show dataset
 if st.checkbox("Show Data"):
     st.dataframe(df)
 
-# Preprocessing
-df["Age"].fillna(df["Age"].mean(), inplace=True)
-df["Embarked"].fillna(df["Embarked"].mode()[0], inplace=True)
-df["Sex"] = df["Sex"].map({"male": 0, "female": 1})
-df["Embarked"] = df["Embarked"].map({"S": 0, "C": 1, "Q": 2})
-
-# Features and labels
-X = df[["Pclass", "Sex", "Age", "SibSp", "Parch", "Fare", "Embarked"]]
-y = df["Survived"]
-
-# Train-test split
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=1)
-
-# Train model
-model = LogisticRegression(max_iter=200)
-model.fit(X_train, y_train)
+registry.register("titanic", get_model_path(data_version, json.dumps(model_params, sort_keys=True)))
+artifact = registry.get("titanic")
+model = artifact["model"]
 
 # Accuracy
-y_pred = model.predict(X_test)
-accuracy = accuracy_score(y_test, y_pred)
-st.write(f"✅ Model Accuracy: **{accuracy:.2f}**")
+st.write(f"✅ Model Accuracy: **{artifact['accuracy']:.2f}**")
+if "model_type" in model_params:
+    st.caption(f"Promoted model: {model_params['model_type']} {model_params['model_params']}")
 
 # User input
 st.header("🎯 Try Predicting Your Survival")
@@ -53,13 +62,68 @@ parch = st.slider("Parents/Children", 0, 5, 0)
 fare = st.number_input("Fare Paid", 0.0, 300.0, 50.0)
 embarked = st.selectbox("Port", ["S", "C", "Q"])
 
-# Encode input
-sex_val = 0 if sex == "male" else 1
-embarked_val = {"S": 0, "C": 1, "Q": 2}[embarked]
-
-input_data = [[pclass, sex_val, age, sibsp, parch, fare, embarked_val]]
+# Raw input; the fitted pipeline applies the same encoding used in training
+input_data = titanic_model.passenger_frame(pclass, sex, age, sibsp, parch, fare, embarked)
 
 if st.button("Predict"):
     result = model.predict(input_data)[0]
     msg = "🎉 You would have **Survived**!" if result == 1 else "❌ You would **Not have survived.**"
     st.success(msg)
+
+# Batch scoring
+st.header("📦 Batch Scoring")
+uploaded = st.file_uploader("Passenger file (CSV or Parquet)", type=["csv", "parquet"])
+chunk_rows = st.number_input("Rows per chunk", 1_000, 1_000_000, 50_000, step=10_000)
+
+if uploaded is not None and st.button("Score file"):
+    status = st.empty()
+    try:
+        report = score_to_csv(
+            read_chunks(uploaded, uploaded.name, int(chunk_rows)),
+            titanic_scorer(model),
+            progress=lambda rows, seconds: status.write(f"Scored {rows:,} rows in {seconds:.1f}s")
+        )
+    except (ValueError, ImportError) as e:
+        st.error(f"Could not score file: {e}")
+    else:
+        status.success(f"Scored {report['rows']:,} rows at {report['rows_per_sec']:,.0f} rows/sec")
+        data = take_download(report["path"])
+        if data is None:
+            st.warning(f"Predictions are {report['bytes'] / 1e6:,.0f} MB compressed, over the download limit. "
+                       f"They are kept on the server at {report['path']} for an hour.")
+        else:
+            st.download_button("Download predictions", data, file_name="titanic_predictions.csv.gz", mime="application/gzip")
+
+# Experiments
+st.header("🔬 Experiments")
+with st.expander("Cross-validated model search"):
+    model_types = st.multiselect("Model types", list(SEARCH_SPACES), default=list(SEARCH_SPACES))
+    search = st.radio("Search", ["Grid", "Random"], horizontal=True)
+    n_iter = st.slider("Candidates per model (random search)", 1, 12, 4, disabled=search == "Grid")
+    folds = st.slider("Folds", 3, 10, 5)
+
+    if model_types and st.button("Run experiments"):
+        candidates = grid_candidates(model_types) if search == "Grid" else random_candidates(model_types, n_iter)
+        data_key = fingerprint(df, {"artifact_version": titanic_model.ARTIFACT_VERSION})
+        runner = ExperimentRunner(df[titanic_model.FEATURES], df[titanic_model.TARGET], data_key,
+                                  titanic_model.make_pipeline, k=folds)
+        bar = st.progress(0.0)
+        leaderboard = runner.run(candidates, progress=lambda done, total: bar.progress(done / total))
+        bar.progress(1.0)
+        st.session_state["titanic_leaderboard"] = leaderboard
+        st.caption(
+            f"{runner.last_run['candidates']} candidates, {runner.last_run['fold_fits']} fold fits "
+            f"({runner.last_run['cached_folds']} cached) in {runner.last_run['seconds']:.1f}s"
+        )
+
+    leaderboard = st.session_state.get("titanic_leaderboard")
+    if leaderboard:
+        st.dataframe(pd.DataFrame([
+            {"model": row["model_type"], "params": json.dumps(row["params"]),
+             "cv accuracy": round(row["mean_accuracy"], 4), "std": round(row["std_accuracy"], 4)}
+            for row in leaderboard
+        ]), use_container_width=True)
+        best = leaderboard[0]
+        if st.button(f"Promote best ({best['model_type']}, {best['mean_accuracy']:.3f})"):
+            titanic_model.promote(best["model_type"], best["params"], best["mean_accuracy"])
+            st.rerun()
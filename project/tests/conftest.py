@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Pages and utils import as top-level packages from the project directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
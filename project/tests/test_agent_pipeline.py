@@ -0,0 +1,54 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utils.agent_pipeline import AgentPipeline
+
+@pytest.fixture
+def pipeline():
+    pipeline = AgentPipeline(default_timeout=2.0)
+
+    async def slow_handle(request, context=None, timeout=None):
+        await asyncio.sleep(1.0)
+        return {"success": True, "response": "done", "agent": "CommandRunner", "latency_ms": 1000.0}
+
+    pipeline.handle = slow_handle
+    yield pipeline
+    pipeline.shutdown()
+
+def test_superseded_request_returns_result(pipeline):
+    results = {}
+    thread = threading.Thread(target=lambda: results.update(first=pipeline.run("ls", session_id="s")))
+    thread.start()
+    time.sleep(0.2)
+    pipeline.submit("ls", session_id="s")
+    thread.join(timeout=5)
+    assert results["first"]["superseded"] is True
+    assert results["first"]["success"] is False
+    assert "latency_ms" in results["first"]
+
+def test_timeout_result_has_latency(pipeline):
+    result = pipeline.run("ls", timeout=0.1)
+    assert result["timed_out"] is True
+    assert result["latency_ms"] >= 100
+
+def test_finished_sessions_are_forgotten(pipeline):
+    async def quick_handle(request, context=None, timeout=None):
+        return {"success": True, "response": "done", "agent": "CommandRunner", "latency_ms": 0.0}
+
+    pipeline.handle = quick_handle
+    for index in range(20):
+        assert pipeline.run("ls", session_id=f"session-{index}")["success"]
+    pipeline.submit("ls", session_id="last").result(timeout=2)
+    time.sleep(0.05)
+    assert pipeline._sessions == {}
+
+def test_newer_request_keeps_its_session_entry(pipeline):
+    first = pipeline.submit("ls", session_id="s")
+    second = pipeline.submit("ls", session_id="s")
+    time.sleep(0.05)
+    assert first.cancelled()
+    assert pipeline._sessions["s"][0] is second
+    assert pipeline.cancel("s") is True
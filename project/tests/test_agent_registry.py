@@ -0,0 +1,63 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from utils.agent_registry import BUILTIN_AGENTS, AgentRegistry, AgentSpec, builtin_spec
+from utils.ai_agents import BUILTIN_AGENT_CLASSES, AgentRouter
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+def test_empty_registry_is_kept():
+    registry = AgentRegistry(specs=[], discover=False)
+    assert AgentRouter(registry).registry is registry
+
+def test_metadata_index_does_not_import_agent_modules():
+    code = ("import sys; from utils.agent_registry import AgentRegistry; "
+            "registry = AgentRegistry(discover=False); registry.metadata(); registry.select('docker ps'); "
+            "print('utils.ai_agents' in sys.modules)")
+    completed = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == "False"
+
+def test_builtin_specs_match_agent_classes():
+    assert [agent_class.SPEC for agent_class in BUILTIN_AGENT_CLASSES] == BUILTIN_AGENTS
+    for spec in BUILTIN_AGENTS:
+        agent_class = spec.load_class()
+        assert agent_class.SPEC is spec
+        assert agent_class.__name__ == spec.target.partition(":")[2]
+
+def test_builtin_spec_unknown_name():
+    with pytest.raises(KeyError):
+        builtin_spec("Nope")
+
+def test_selection_uses_keywords_and_priority():
+    registry = AgentRegistry(discover=False)
+    assert registry.select("restart the docker container") == "DockerAssistant"
+    assert registry.select("debug this python code in docker") == "DockerAssistant"
+    assert registry.select("check system memory") == "LinuxExpert"
+    assert registry.select("hello") == "CommandRunner"
+
+def test_agent_is_imported_only_when_selected():
+    registry = AgentRegistry(discover=False)
+    assert registry.loaded() == {}
+    agent = registry["CodeExplainer"]
+    assert agent.name == "CodeExplainer"
+    assert list(registry.loaded()) == ["CodeExplainer"]
+
+def test_empty_registry_selects_nothing():
+    registry = AgentRegistry(specs=[], discover=False)
+    assert registry.select("hello") is None
+
+def test_missing_default_agent_selects_nothing():
+    spec = AgentSpec("Docs", "utils.ai_agents:CodeExplainerAgent", keywords=["docs"])
+    registry = AgentRegistry(specs=[spec], discover=False)
+    assert registry.select("read the docs") == "Docs"
+    assert registry.select("hello") is None
+
+def test_router_with_empty_registry_reports_no_agent():
+    router = AgentRouter(AgentRegistry(specs=[], discover=False))
+
+    result = router.route_request("hello")
+    assert result == {"success": False, "response": "No agent is registered to handle this request.", "agent": None}
+    assert router.route_many(["hello", "docker ps"])[1]["agent"] is None
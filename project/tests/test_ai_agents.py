@@ -0,0 +1,167 @@
+import json
+
+import pytest
+
+from utils.agent_registry import AgentRegistry, AgentSpec
+from utils.ai_agents import AgentRouter, BaseAgent, load_requests_jsonl, parse_free_output, parse_size
+
+FREE_H = """               total        used        free      shared  buff/cache   available
+Mem:           7.7Gi       3.2Gi       1.1Gi       512Mi       3.4Gi       4.1Gi
+Swap:          2.0Gi          0B       2.0Gi
+"""
+
+FREE_KIB = """               total        used        free      shared  buff/cache   available
+Mem:         8000000     3000000     1000000      500000     4000000     4500000
+Swap:              0           0           0
+"""
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("980B", 980),
+    ("0B", 0),
+    ("512M", 512 * 1024 ** 2),
+    ("512Mi", 512 * 1024 ** 2),
+    ("7.5Gi", 7.5 * 1024 ** 3),
+    ("1.5GB", 1.5 * 1024 ** 3),
+    ("2Ki", 2048),
+    ("1T", 1024 ** 4),
+    ("12345", 12345 * 1024),
+])
+def test_parse_size(value, expected):
+    assert parse_size(value) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("value", ["", "abc", "12X", "Gi"])
+def test_parse_size_rejects_junk(value):
+    with pytest.raises(ValueError):
+        parse_size(value)
+
+
+def test_parse_free_human_readable():
+    parsed = parse_free_output(FREE_H)
+
+    assert parsed["mem"]["total"] == pytest.approx(7.7 * 1024 ** 3)
+    assert parsed["mem"]["shared"] == 512 * 1024 ** 2
+    assert parsed["swap"]["used"] == 0
+    assert set(parsed["swap"]) == {"total", "used", "free"}
+
+
+def test_parse_free_kibibytes():
+    parsed = parse_free_output(FREE_KIB)
+
+    assert parsed["mem"]["available"] == 4500000 * 1024
+    assert parsed["swap"]["total"] == 0
+
+
+def test_parse_free_empty_output():
+    assert parse_free_output("") == {}
+
+
+class EchoAgent(BaseAgent):
+    """Answers with the request text; fails on requests containing 'boom'"""
+
+    NAME = "Echo"
+
+    def __init__(self):
+        super().__init__(self.NAME, "Echoes requests", [])
+
+    def process_request(self, request, context=None):
+        if "boom" in request:
+            raise RuntimeError("exploded")
+        self.add_to_history(request, request)
+        return {"success": True, "response": request, "agent": self.name, "context": context}
+
+
+class ComposeAgent(EchoAgent):
+    NAME = "Compose"
+
+
+class DockerAgent(EchoAgent):
+    NAME = "Docker"
+
+
+def echo_router():
+    specs = [
+        AgentSpec("Compose", f"{__name__}:ComposeAgent", keywords=["docker compose"], priority=5),
+        AgentSpec("Docker", f"{__name__}:DockerAgent", keywords=["docker"], priority=10),
+        AgentSpec("Echo", f"{__name__}:EchoAgent", priority=1000),
+    ]
+    return AgentRouter(AgentRegistry(specs=specs, discover=False, default_agent="Echo"))
+
+
+ROUTING_CASES = [
+    ("Docker   Compose up", "Compose"),
+    ("docker\tcompose logs", "Compose"),
+    ("  DOCKER\n compose  ", "Compose"),
+    ("docker ps", "Docker"),
+    ("hello there", "Echo"),
+]
+
+
+def test_batch_and_single_routing_agree():
+    requests = [request for request, _ in ROUTING_CASES]
+    batch = echo_router().route_many(requests)
+
+    for (request, expected), result in zip(ROUTING_CASES, batch):
+        assert echo_router()._select_agent(request) == expected
+        assert result["agent"] == echo_router()._select_agent(request)
+
+
+def test_route_many_keeps_input_order_and_adds_latency():
+    requests = [f"docker {index}" if index % 2 else f"hello {index}" for index in range(10)]
+    contexts = [{"index": index} for index in range(10)]
+
+    results = echo_router().route_many(requests, contexts)
+
+    assert [result["response"] for result in results] == requests
+    assert [result["context"] for result in results] == contexts
+    assert all(result["latency_ms"] >= 0 for result in results)
+
+
+def test_route_many_keeps_order_within_an_agent():
+    router = echo_router()
+    requests = ["docker a", "hello", "docker b", "docker c"]
+    router.route_many(requests)
+
+    history = [item["request"] for item in router.registry.get("Docker").conversation_history]
+    assert history == ["docker a", "docker b", "docker c"]
+
+
+def test_route_many_reports_agent_failures():
+    results = echo_router().route_many(["docker ok", "docker boom"])
+
+    assert results[0]["success"] is True
+    assert results[1] == {"success": False, "response": "Request failed: exploded", "agent": "Docker",
+                          "latency_ms": results[1]["latency_ms"]}
+
+
+def test_route_many_validates_contexts():
+    with pytest.raises(ValueError):
+        echo_router().route_many(["a", "b"], [None])
+    assert echo_router().route_many([]) == []
+
+
+def test_load_requests_jsonl(tmp_path):
+    path = tmp_path / "requests.jsonl"
+    path.write_text("\n".join([
+        json.dumps("show docker containers"),
+        "",
+        json.dumps({"request": "check memory", "context": {"host": "web-1"}}),
+        json.dumps({"query": "explain this code"}),
+        json.dumps({"text": "list files"}),
+    ]) + "\n")
+
+    assert load_requests_jsonl(str(path)) == [
+        {"request": "show docker containers", "context": None},
+        {"request": "check memory", "context": {"host": "web-1"}},
+        {"request": "explain this code", "context": None},
+        {"request": "list files", "context": None},
+    ]
+
+
+def test_load_requests_jsonl_reports_missing_request(tmp_path):
+    path = tmp_path / "requests.jsonl"
+    path.write_text(json.dumps("ok") + "\n" + json.dumps({"context": {}}) + "\n")
+
+    with pytest.raises(ValueError, match=":2: missing 'request'"):
+        load_requests_jsonl(str(path))
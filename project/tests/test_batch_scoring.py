@@ -0,0 +1,46 @@
+import gzip
+import io
+import os
+import time
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from utils.batch_scoring import prune_outputs, read_chunks, score_to_csv, take_download
+
+def double(chunk):
+    scored = chunk.copy()
+    scored["pred"] = chunk["x"] * 2
+    return scored
+
+def test_scores_in_chunks_to_gzipped_csv(tmp_path):
+    source = io.StringIO("x\n" + "\n".join(str(i) for i in range(1000)))
+    report = score_to_csv(read_chunks(source, "input.csv", chunk_rows=100), double,
+                          output_path=tmp_path / "scored-test.csv.gz")
+    assert report["rows"] == 1000
+    with gzip.open(report["path"], "rt") as scored:
+        frame = pd.read_csv(scored)
+    assert list(frame["pred"][:3]) == [0, 2, 4]
+    assert report["bytes"] == os.path.getsize(report["path"])
+
+def test_take_download_deletes_file(tmp_path):
+    path = tmp_path / "scored-a.csv.gz"
+    path.write_bytes(b"data")
+    assert take_download(str(path)) == b"data"
+    assert not path.exists()
+
+def test_take_download_refuses_oversized_file(tmp_path):
+    path = tmp_path / "scored-b.csv.gz"
+    path.write_bytes(b"x" * 100)
+    assert take_download(str(path), max_bytes=10) is None
+    assert path.exists()
+
+def test_prune_removes_only_expired_outputs(tmp_path):
+    old, new = tmp_path / "scored-old.csv.gz", tmp_path / "scored-new.csv.gz"
+    old.write_bytes(b"old")
+    new.write_bytes(b"new")
+    stale = time.time() - 7200
+    os.utime(old, (stale, stale))
+    assert prune_outputs(str(tmp_path), ttl=3600) == 1
+    assert not old.exists() and new.exists()
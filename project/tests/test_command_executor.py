@@ -0,0 +1,250 @@
+import json
+import sys
+import time
+
+import pytest
+
+from utils.command_executor import CommandExecutor, ProcessTable
+from utils.ssh_runner import is_safe_command
+
+PS_OUTPUT = """USER         PID %CPU %MEM    VSZ   RSS TTY      STAT START   TIME COMMAND
+root           1  0.0  0.1 167000 11000 ?        Ss   10:00   0:01 /sbin/init splash
+app          200 45.5 12.0 900000 500000 ?       Sl   10:01  12:00 python server.py --port 8000
+app          300  5.0 30.5 2000000 1200000 ?     Sl   10:02   3:00 java -jar service.jar
+broken line
+db           400 20.0  8.0 600000 300000 ?       Ss   10:03   5:00 postgres: writer
+"""
+
+
+class FakeSSHRunner:
+    """Runner that answers commands with canned output and records what ran where"""
+
+    def __init__(self, outputs=None, success=True, hostname=None):
+        self.outputs = outputs or {}
+        self.success = success
+        self.hostname = hostname
+        self.client = object() if hostname else None
+        self.commands = []
+
+    def connect_to(self, hostname):
+        self.hostname = hostname
+        self.client = object() if hostname else None
+
+    def execute_command(self, command, timeout=30):
+        return self._answer(self.hostname, command)
+
+    def execute_local_command(self, command, timeout=30):
+        return self._answer("localhost", command)
+
+    def _answer(self, host, command):
+        self.commands.append((host, command))
+        output = self.outputs.get(command.split()[0], "")
+        if callable(output):
+            output = output(host)
+        return {"success": self.success, "output": output,
+                "error": "" if self.success else "command failed", "exit_code": 0 if self.success else 1}
+
+
+def docker_ps_line(**overrides):
+    row = {"ID": "0123456789abcdef", "Names": "web", "Image": "nginx:latest", "Status": "Up 2 hours",
+           "Ports": "0.0.0.0:8080->80/tcp, :::8080->80/tcp", "CreatedAt": "2024-01-01 10:00:00 +0000 UTC",
+           "Command": '"nginx -g daemon off;"'}
+    row.update(overrides)
+    return json.dumps(row)
+
+
+class ConnectedRunner:
+    connected = True
+
+    def list_containers(self, all_containers=False):
+        return [{"id": "abc", "name": "sdk"}]
+
+
+@pytest.fixture
+def no_docker_sdk(monkeypatch):
+    # A None entry makes ``import docker`` raise ImportError
+    monkeypatch.setitem(sys.modules, "docker", None)
+    monkeypatch.delitem(sys.modules, "utils.docker_runner", raising=False)
+
+
+@pytest.mark.parametrize("command, safe", [
+    ("ls -la", True),
+    ("free -h", True),
+    ("rm -rf /", False),
+    ("sudo reboot", False),
+    ("echo hi > /etc/passwd", False),
+    ("systemctl status nginx", True),
+])
+def test_is_safe_command(command, safe):
+    assert is_safe_command(command) is safe
+
+
+def test_unsafe_command_is_refused_without_running():
+    ssh = FakeSSHRunner()
+    result = CommandExecutor(ssh_runner=ssh).run("rm -rf /tmp/x")
+
+    assert not result["success"]
+    assert "not allowed" in result["error"]
+    assert ssh.commands == []
+
+
+def test_empty_command_is_refused():
+    assert not CommandExecutor(ssh_runner=FakeSSHRunner()).run("   ")["success"]
+
+
+def test_successful_output_is_cached_within_ttl():
+    ssh = FakeSSHRunner({"uptime": "up 3 days"})
+    executor = CommandExecutor(ssh_runner=ssh, ttl=60)
+
+    first = executor.run("uptime")
+    second = executor.run("uptime")
+
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert second["output"] == "up 3 days"
+    assert len(ssh.commands) == 1
+    assert executor.run("uptime", use_cache=False)["cached"] is False
+    assert len(ssh.commands) == 2
+
+
+def test_cached_output_expires():
+    ssh = FakeSSHRunner({"uptime": "up"})
+    executor = CommandExecutor(ssh_runner=ssh, ttl=0.05)
+    executor.run("uptime")
+    time.sleep(0.06)
+    executor.run("uptime")
+    assert len(ssh.commands) == 2
+
+
+def test_failures_are_not_cached():
+    ssh = FakeSSHRunner(success=False)
+    executor = CommandExecutor(ssh_runner=ssh)
+    executor.run("uptime")
+    executor.run("uptime")
+    assert len(ssh.commands) == 2
+
+
+def test_cache_is_per_host():
+    ssh = FakeSSHRunner({"hostname": lambda host: host})
+    executor = CommandExecutor(ssh_runner=ssh)
+
+    assert executor.run("hostname")["output"] == "localhost"
+    ssh.connect_to("web-1")
+    assert executor.run("hostname")["output"] == "web-1"
+    ssh.connect_to("web-2")
+    assert executor.run("hostname")["output"] == "web-2"
+    assert ssh.commands == [("localhost", "hostname"), ("web-1", "hostname"), ("web-2", "hostname")]
+
+
+def test_process_table_parse_skips_malformed_lines():
+    table = ProcessTable.parse(PS_OUTPUT)
+
+    assert len(table) == 4
+    assert table.row(1) == {"pid": 200, "cpu": 45.5, "mem": 12.0, "vsz": 900000, "rss": 500000,
+                            "user": "app", "tty": "?", "stat": "Sl", "start": "10:01", "time": "12:00",
+                            "command": "python server.py --port 8000"}
+
+
+def test_process_table_top():
+    table = ProcessTable.parse(PS_OUTPUT)
+
+    assert [row["pid"] for row in table.top(2, by="cpu")] == [200, 400]
+    assert [row["pid"] for row in table.top(1, by="mem")] == [300]
+    with pytest.raises(ValueError):
+        table.top(by="user")
+
+
+def test_process_table_find_and_totals():
+    table = ProcessTable.parse(PS_OUTPUT)
+
+    assert [row["pid"] for row in table.find("POSTGRES")] == [400]
+    assert table.totals() == {"cpu": pytest.approx(70.5), "mem": pytest.approx(50.6), "count": 4}
+
+
+def test_process_table_is_cached_per_host():
+    ssh = FakeSSHRunner({"ps": PS_OUTPUT})
+    executor = CommandExecutor(ssh_runner=ssh)
+
+    assert executor.process_table() is executor.process_table()
+    ssh.connect_to("web-1")
+    executor.process_table()
+    assert [host for host, _ in ssh.commands] == ["localhost", "web-1"]
+
+
+def test_falls_back_to_cli_without_docker_sdk(no_docker_sdk):
+    ssh = FakeSSHRunner({"docker": docker_ps_line() + "\n" + docker_ps_line(ID="fedcba9876543210", Names="db", Ports="") + "\n"})
+    executor = CommandExecutor(ssh_runner=ssh)
+
+    containers = executor.docker_containers()
+
+    assert executor.docker_runner is None
+    assert [c["name"] for c in containers] == ["web", "db"]
+    assert containers[0]["id"] == "0123456789ab"
+    assert containers[0]["ports"] == ["0.0.0.0:8080->80/tcp", ":::8080->80/tcp"]
+    assert containers[0]["command"] == "nginx -g daemon off;"
+    assert containers[1]["ports"] == []
+
+
+def test_cli_result_is_cached(no_docker_sdk):
+    ssh = FakeSSHRunner({"docker": docker_ps_line()})
+    executor = CommandExecutor(ssh_runner=ssh)
+
+    executor.docker_containers()
+    executor.docker_containers()
+
+    assert len(ssh.commands) == 1
+
+
+def test_all_containers_passes_flag(no_docker_sdk):
+    ssh = FakeSSHRunner()
+    executor = CommandExecutor(ssh_runner=ssh)
+
+    assert executor.docker_containers(all_containers=True) == []
+    assert ssh.commands[0][1].endswith("--all")
+
+
+def test_cli_failure_returns_none(no_docker_sdk):
+    executor = CommandExecutor(ssh_runner=FakeSSHRunner(success=False))
+
+    assert executor.docker_containers() is None
+
+
+def test_unparseable_cli_output_returns_none(no_docker_sdk):
+    executor = CommandExecutor(ssh_runner=FakeSSHRunner({"docker": "not json"}))
+
+    assert executor.docker_containers() is None
+
+
+def test_disconnected_sdk_falls_back_to_cli():
+    class DisconnectedRunner:
+        connected = False
+
+        def list_containers(self, all_containers=False):
+            raise AssertionError("should not be called while disconnected")
+
+    ssh = FakeSSHRunner({"docker": docker_ps_line()})
+    executor = CommandExecutor(ssh_runner=ssh, docker_runner=DisconnectedRunner())
+
+    assert [c["name"] for c in executor.docker_containers()] == ["web"]
+
+
+def test_connected_sdk_is_used_locally():
+    ssh = FakeSSHRunner({"docker": docker_ps_line()})
+    executor = CommandExecutor(ssh_runner=ssh, docker_runner=ConnectedRunner())
+
+    assert executor.docker_containers() == [{"id": "abc", "name": "sdk"}]
+    assert ssh.commands == []
+
+
+def test_docker_containers_run_and_cache_per_host():
+    ssh = FakeSSHRunner({"docker": lambda host: docker_ps_line(Names=f"app-on-{host}")})
+    executor = CommandExecutor(ssh_runner=ssh, docker_runner=ConnectedRunner())
+
+    assert executor.docker_containers() == [{"id": "abc", "name": "sdk"}]
+    ssh.connect_to("web-1")
+    # The local SDK can't see web-1's containers, so docker ps runs over SSH
+    assert [c["name"] for c in executor.docker_containers()] == ["app-on-web-1"]
+    ssh.connect_to("web-2")
+    assert [c["name"] for c in executor.docker_containers()] == ["app-on-web-2"]
+    ssh.connect_to("web-1")
+    assert [c["name"] for c in executor.docker_containers()] == ["app-on-web-1"]
+    assert [host for host, _ in ssh.commands] == ["web-1", "web-2"]
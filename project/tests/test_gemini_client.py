@@ -0,0 +1,135 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from utils.gemini_client import GeminiClient, create_session
+
+MESSAGES = [{"role": "user", "content": "How do I hire a CTO?"}]
+
+def payload(text: str) -> dict:
+    return {"candidates": [{"content": {"parts": [{"text": text}]}, "finishReason": "STOP"}]}
+
+class StubGemini:
+    """Local stand-in for the Gemini REST API
+
+    ``failures`` requests are answered with ``failure_status`` before the
+    real answer; ``delay`` stalls every answer. Each request's path and
+    client port are recorded.
+    """
+
+    def __init__(self):
+        self.failures = 0
+        self.failure_status = 503
+        self.delay = 0.0
+        self.requests = []
+        self.ports = set()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                stub.requests.append(self.path)
+                stub.ports.add(self.client_address[1])
+                time.sleep(stub.delay)
+                if stub.failures > 0:
+                    stub.failures -= 1
+                    self._send(stub.failure_status, b'{"error": "unavailable"}', "application/json")
+                elif ":streamGenerateContent" in self.path:
+                    events = "".join(f"data: {json.dumps(payload(word))}\n\n" for word in ["Hire ", "slowly."])
+                    self._send(200, events.encode("utf-8"), "text/event-stream")
+                else:
+                    self._send(200, json.dumps(payload("Hire slowly.")).encode("utf-8"), "application/json")
+
+            def _send(self, status, body, content_type):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/v1beta"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def stub():
+    stub = StubGemini()
+    yield stub
+    stub.close()
+
+def make_client(stub, **session_kwargs):
+    session_kwargs.setdefault("backoff_factor", 0.01)
+    return GeminiClient("test-key", base_url=stub.url, session=create_session(**session_kwargs), timeout=(2, 1))
+
+def test_completion_reuses_one_connection(stub):
+    client = make_client(stub)
+    for _ in range(3):
+        response = client.chat.completions.create("gemini-2.5-flash", MESSAGES)
+        assert response.choices[0].message.content == "Hire slowly."
+    assert len(stub.requests) == 3
+    assert len(stub.ports) == 1
+    client.close()
+
+def test_transient_errors_are_retried(stub):
+    stub.failures = 2
+    client = make_client(stub, retries=2)
+    response = client.chat.completions.create("gemini-2.5-flash", MESSAGES)
+    assert response.choices[0].message.content == "Hire slowly."
+    assert len(stub.requests) == 3
+    client.close()
+
+def test_retries_give_up_with_http_error(stub):
+    stub.failures = 10
+    client = make_client(stub, retries=2)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.chat.completions.create("gemini-2.5-flash", MESSAGES)
+    assert len(stub.requests) == 3
+    client.close()
+
+def test_client_errors_are_not_retried(stub):
+    stub.failures = 1
+    stub.failure_status = 400
+    client = make_client(stub)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.chat.completions.create("gemini-2.5-flash", MESSAGES)
+    assert len(stub.requests) == 1
+    client.close()
+
+def test_read_timeout_fails_fast_without_retry(stub):
+    stub.delay = 1.5
+    client = make_client(stub)
+    started = time.monotonic()
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        client.chat.completions.create("gemini-2.5-flash", MESSAGES)
+    assert time.monotonic() - started < 1.5
+    assert len(stub.requests) == 1
+    client.close()
+
+def test_streaming_yields_chunks(stub):
+    client = make_client(stub)
+    chunks = list(client.chat.completions.create("gemini-2.5-flash", MESSAGES, stream=True))
+    assert chunks == ["Hire ", "slowly."]
+    assert stub.requests[0].startswith("/v1beta/models/gemini-2.5-flash:streamGenerateContent")
+    client.close()
+
+def test_streaming_raises_before_first_chunk(stub):
+    stub.failures = 10
+    client = make_client(stub, retries=1)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.chat.completions.create("gemini-2.5-flash", MESSAGES, stream=True)
+    assert len(stub.requests) == 2
+    client.close()
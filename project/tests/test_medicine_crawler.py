@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("bs4")
+
+from utils.medicine_catalog import CatalogStore
+from utils.medicine_crawler import MedicineCrawler
+
+def product(name: str) -> str:
+    return f"<html><body><h1>{name}</h1><p>Salt composition: Paracetamol (500mg).</p></body></html>"
+
+class FixtureSite:
+    """Small local site: a listing page, product pages and a robots.txt"""
+
+    def __init__(self, robots_delay: float = 0.0, robots_status: int = 200):
+        self.pages = {
+            "/": '<a href="/drugs/alpha">a</a><a href="/drugs/alpha#top">a</a><a href="/drugs/beta">b</a>'
+                 '<a href="/private/secret">p</a><a href="/">home</a>',
+            "/drugs/alpha": product("Alpha 500") + '<a href="/drugs/beta">b</a><a href="/">home</a>',
+            "/drugs/beta": product("Beta 650") + '<a href="/drugs/alpha">a</a>',
+            "/private/secret": product("Secret")
+        }
+        self.robots = "User-agent: *\nDisallow: /private/\n"
+        self.robots_delay = robots_delay
+        self.robots_status = robots_status
+        self.always_not_modified = set()
+        self.hits = Counter()
+        self.conditional = Counter()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path
+                site.hits[path] += 1
+                if path == "/robots.txt":
+                    time.sleep(site.robots_delay)
+                    self._reply(site.robots_status, site.robots, "text/plain")
+                    return
+                if path not in site.pages:
+                    self._reply(404, "missing", "text/plain")
+                    return
+                etag = f'"{hash(site.pages[path]) & 0xffffffff:x}"'
+                if self.headers.get("If-None-Match") is not None:
+                    site.conditional[path] += 1
+                if self.headers.get("If-None-Match") == etag or path in site.always_not_modified:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self._reply(200, f"<html><body>{site.pages[path]}</body></html>", "text/html", etag)
+
+            def _reply(self, status, body, content_type, etag=None):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                if etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def site():
+    site = FixtureSite()
+    yield site
+    site.close()
+
+@pytest.fixture
+def store(tmp_path):
+    store = CatalogStore(str(tmp_path / "catalog.db"))
+    yield store
+    store.close()
+
+def crawl(store, seeds, **kwargs):
+    kwargs.setdefault("min_interval", 0.0)
+    crawler = MedicineCrawler(store, **kwargs)
+    return crawler, asyncio.run(crawler.crawl(seeds))
+
+def test_robots_disallowed_pages_are_never_fetched(site, store):
+    _, stats = crawl(store, [site.url + "/"])
+    assert site.hits["/private/secret"] == 0
+    assert stats["blocked"] == 1
+    assert stats["medicines"] == 2
+
+def test_robots_loads_before_concurrent_workers_fetch(store):
+    site = FixtureSite(robots_delay=0.3)
+    try:
+        seeds = [f"{site.url}/private/page-{index}" for index in range(8)]
+        _, stats = crawl(store, seeds, concurrency=8, per_host_concurrency=8)
+        assert site.hits["/robots.txt"] == 1
+        assert not any(path.startswith("/private/") for path in site.hits)
+        assert stats["blocked"] == 8
+    finally:
+        site.close()
+
+def test_links_are_deduplicated(site, store):
+    _, stats = crawl(store, [site.url + "/", site.url + "/#again"])
+    for path in ("/", "/drugs/alpha", "/drugs/beta"):
+        assert site.hits[path] == 1
+    assert stats["fetched"] == 3
+
+def test_recrawl_uses_conditional_get(site, store):
+    crawl(store, [site.url + "/"])
+    site.hits.clear()
+    _, stats = crawl(store, [site.url + "/"], recrawl_after=0)
+    assert site.conditional["/"] == 1
+    assert site.conditional["/drugs/alpha"] == 1
+    assert stats["not_modified"] == 3
+    assert stats["fetched"] == 0
+
+def test_recrawl_reaches_new_pages_behind_unchanged_ones(site, store):
+    crawl(store, [site.url + "/"])
+    # New product linked only from an unchanged product page
+    site.pages["/drugs/gamma"] = product("Gamma 250")
+    site.pages["/drugs/beta"] += '<a href="/drugs/gamma">g</a>'
+    _, stats = crawl(store, [site.url + "/"], recrawl_after=0)
+    assert site.hits["/drugs/gamma"] == 1
+    assert stats["not_modified"] == 2
+    assert store.count() == 3
+
+def test_fresh_pages_still_lead_to_stale_pages_behind_them(site, store):
+    crawl(store, [site.url + "/"])
+    site.pages["/drugs/gamma"] = product("Gamma 250")
+    site.pages["/drugs/beta"] += '<a href="/drugs/gamma">g</a>'
+    with store._conn:
+        store._conn.execute("UPDATE pages SET crawled_at = 0 WHERE url = ?", (site.url + "/drugs/beta",))
+    site.hits.clear()
+    _, stats = crawl(store, [site.url + "/"])
+    assert stats["skipped_fresh"] == 2
+    assert site.hits["/"] == 0
+    assert site.hits["/drugs/beta"] == 1
+    assert site.hits["/drugs/gamma"] == 1
+
+def test_not_modified_without_stored_state_is_handled(site, store):
+    # A misbehaving server answering 304 to an unconditional GET
+    site.always_not_modified.add("/drugs/beta")
+    _, stats = crawl(store, [site.url + "/"])
+    assert stats["errors"] == 0
+    assert stats["not_modified"] == 1
+    assert stats["medicines"] == 1
+
+@pytest.mark.parametrize("status", [401, 403])
+def test_protected_robots_txt_disallows_everything(store, status):
+    site = FixtureSite(robots_status=status)
+    try:
+        _, stats = crawl(store, [site.url + "/", site.url + "/drugs/alpha"])
+        assert set(site.hits) == {"/robots.txt"}
+        assert stats["blocked"] == 2
+    finally:
+        site.close()
+
+def test_missing_robots_txt_allows_everything(store):
+    site = FixtureSite(robots_status=404)
+    try:
+        _, stats = crawl(store, [site.url + "/"])
+        assert site.hits["/private/secret"] == 1
+        assert stats["blocked"] == 0
+    finally:
+        site.close()
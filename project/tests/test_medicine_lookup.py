@@ -0,0 +1,58 @@
+import pytest
+
+from utils.medicine_lookup import MedicineLookup
+
+RECORDS = [
+    {"url": "u1", "name": "Crocin Advance Tablet", "salts": "Paracetamol (500mg)", "available": True},
+    {"url": "u2", "name": "Crocin Cold & Flu Max Tablet", "salts": "Paracetamol + Phenylephrine + Caffeine",
+     "available": True},
+    {"url": "u3", "name": "Dolo 650 Tablet", "salts": "Paracetamol (650mg)", "price": "30.91", "available": True}
+]
+
+@pytest.fixture
+def lookup():
+    lookup = MedicineLookup()
+    lookup.build("v1", RECORDS)
+    return lookup
+
+def test_unique_brand_resolves(lookup):
+    score, record = lookup.match("dolo")
+    assert score == 1.0
+    assert record["url"] == "u3"
+
+def test_shared_brand_is_not_a_match(lookup):
+    assert lookup.match("crocin") is None
+    assert lookup.match("crocin cold") is None
+    assert lookup.lookup("salts in crocin") is None
+
+def test_ambiguous_brand_never_picks_a_product(lookup):
+    assert lookup.lookup("crocin cold salts") is None
+
+def test_full_name_still_resolves(lookup):
+    result = lookup.lookup("crocin cold flu max composition")
+    assert result["record"]["url"] == "u2"
+    assert result["intent"] == "salts"
+    assert result["answer"] == "**Crocin Cold & Flu Max Tablet** contains Paracetamol + Phenylephrine + Caffeine."
+
+@pytest.mark.parametrize("question, intent, answer", [
+    ("dolo salts", "salts", "**Dolo 650 Tablet** contains Paracetamol (650mg)."),
+    ("price of dolo 650", "price", "**Dolo 650 Tablet** is listed at MRP ₹30.91."),
+    ("is dolo available", "availability", "**Dolo 650 Tablet** is currently available on 1mg."),
+])
+def test_catalog_questions_are_answered(lookup, question, intent, answer):
+    result = lookup.lookup(question)
+    assert result["record"]["url"] == "u3"
+    assert result["intent"] == intent
+    assert result["answer"] == answer
+
+@pytest.mark.parametrize("question", [
+    "what is dolo 650 used for",
+    "what is the use of dolo",
+    "dolo side effects",
+    "dolo 650 dosage for kids",
+])
+def test_usage_questions_go_to_the_llm(lookup, question):
+    assert lookup.lookup(question) is None
+
+def test_missing_field_goes_to_the_llm(lookup):
+    assert lookup.lookup("price of crocin advance") is None
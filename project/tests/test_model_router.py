@@ -0,0 +1,190 @@
+import gc
+import threading
+import time
+
+import pytest
+
+from utils.model_router import CircuitBreaker, LatencyTracker, ModelRouter, ModelUnavailableError
+
+
+class Flaky:
+    """Model function that fails for the listed models"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def __call__(self, model):
+        self.calls.append(model)
+        if model in self.failing:
+            raise RuntimeError(f"{model} is down")
+        return f"answer from {model}"
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=2, base_backoff=60)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+def test_breaker_lets_one_probe_through_when_backoff_expires():
+    breaker = CircuitBreaker(failure_threshold=1, base_backoff=0.01)
+    open_breaker(breaker)
+    time.sleep(0.02)
+
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens_with_doubled_backoff():
+    breaker = CircuitBreaker(failure_threshold=1, base_backoff=0.05)
+    open_breaker(breaker)
+    time.sleep(0.06)
+    assert breaker.allow()
+
+    before = time.monotonic()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.open_until - before == pytest.approx(0.1, abs=0.02)
+
+
+def test_lost_probe_times_out():
+    breaker = CircuitBreaker(failure_threshold=1, base_backoff=0.01, probe_timeout=0.05)
+    open_breaker(breaker)
+    time.sleep(0.02)
+    assert breaker.allow()
+    assert not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()
+
+
+def test_release_probe_allows_another_probe():
+    breaker = CircuitBreaker(failure_threshold=1, base_backoff=0.01)
+    open_breaker(breaker)
+    time.sleep(0.02)
+    assert breaker.allow()
+    breaker.release_probe()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_latency_percentile():
+    tracker = LatencyTracker()
+    assert tracker.percentile(95) == 0.0
+    for seconds in range(1, 101):
+        tracker.record(seconds)
+    assert tracker.percentile(50) == 50
+    assert tracker.percentile(95) == 95
+
+
+def test_fails_over_to_next_model():
+    router = ModelRouter(["a", "b"], failure_threshold=1, base_backoff=60)
+    fn = Flaky(failing={"a"})
+
+    assert router.call(fn) == ("answer from b", "b")
+    assert router.breakers["a"].state == CircuitBreaker.OPEN
+
+    # The open circuit skips "a" without calling it
+    assert router.call(fn) == ("answer from b", "b")
+    assert fn.calls == ["a", "b", "b"]
+
+
+def test_all_models_failing_raises():
+    router = ModelRouter(["a", "b"], failure_threshold=1, base_backoff=60)
+
+    with pytest.raises(ModelUnavailableError, match="All models failed"):
+        router.call(Flaky(failing={"a", "b"}))
+    with pytest.raises(ModelUnavailableError, match="circuits open"):
+        router.call(Flaky())
+
+
+def test_untried_model_sorts_after_measured_ones():
+    router = ModelRouter(["a", "b"])
+    router.latencies["b"].record(0.01)
+    assert router.ordered_models() == ["b", "a"]
+
+
+def test_hedge_fires_second_model_when_primary_is_slow():
+    release = threading.Event()
+
+    def fn(model):
+        if model == "slow":
+            release.wait(2)
+            return "slow answer"
+        return "fast answer"
+
+    router = ModelRouter(["slow", "fast"], hedge=True, hedge_min_delay=0.05)
+    try:
+        assert router.call(fn) == ("fast answer", "fast")
+    finally:
+        release.set()
+
+
+def test_hedge_not_fired_when_primary_is_quick():
+    fn = Flaky()
+    router = ModelRouter(["a", "b"], hedge=True, hedge_min_delay=1.0)
+    assert router.call(fn) == ("answer from a", "a")
+    assert fn.calls == ["a"]
+
+
+def test_stream_success_records_first_chunk_latency():
+    def chunks():
+        yield "first"
+        time.sleep(0.2)
+        yield "second"
+
+    router = ModelRouter(["a"])
+    stream, model = router.call(lambda model: chunks(), stream=True)
+    assert list(stream) == ["first", "second"]
+
+    assert router.latencies["a"].percentile(95) < 0.1
+    assert router.breakers["a"].state == CircuitBreaker.CLOSED
+
+
+def test_stream_error_counts_as_failure():
+    def chunks():
+        yield "partial"
+        raise RuntimeError("connection reset")
+
+    router = ModelRouter(["a"], failure_threshold=1, base_backoff=60)
+    stream, _ = router.call(lambda model: chunks(), stream=True)
+    with pytest.raises(RuntimeError):
+        list(stream)
+    assert router.breakers["a"].state == CircuitBreaker.OPEN
+
+
+@pytest.mark.parametrize("abandon", ["close", "drop"])
+def test_abandoned_streamed_probe_releases_half_open_circuit(abandon):
+    def chunks():
+        yield "one"
+        yield "two"
+
+    router = ModelRouter(["a"], failure_threshold=1, base_backoff=0.01)
+    with pytest.raises(ModelUnavailableError):
+        router.call(Flaky(failing={"a"}))
+    time.sleep(0.02)
+
+    stream, _ = router.call(lambda model: chunks(), stream=True)
+    assert router.breakers["a"].state == CircuitBreaker.HALF_OPEN
+    next(stream)
+    if abandon == "close":
+        stream.close()
+    else:
+        del stream
+        gc.collect()
+
+    assert router.call(lambda model: "recovered") == ("recovered", "a")
+    assert router.breakers["a"].state == CircuitBreaker.CLOSED
@@ -0,0 +1,136 @@
+import threading
+import time
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+
+from utils.model_server import MicroBatcher
+
+
+class RecordingPredict:
+    """Doubles ``x``; remembers each batch size and can hold a batch until released"""
+
+    def __init__(self, hold: threading.Event = None):
+        self.hold = hold
+        self.sizes = []
+        self.lock = threading.Lock()
+
+    def __call__(self, frame):
+        if self.hold is not None:
+            self.hold.wait(2)
+        if (frame["x"] < 0).any():
+            raise ValueError("negative x")
+        with self.lock:
+            self.sizes.append(len(frame))
+        return [{"y": int(x) * 2} for x in frame["x"]]
+
+
+def submit_concurrently(batcher, values):
+    futures = [None] * len(values)
+    barrier = threading.Barrier(len(values))
+
+    def client(index):
+        barrier.wait()
+        futures[index] = batcher.submit({"x": values[index]})
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(len(values))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return futures
+
+
+def test_concurrent_requests_share_batches_across_workers():
+    hold = threading.Event()
+    predict = RecordingPredict(hold)
+    batcher = MicroBatcher(predict, max_batch=64, max_wait=0.05, workers=8)
+    try:
+        futures = submit_concurrently(batcher, list(range(32)))
+        hold.set()
+        assert [future.result(2) for future in futures] == [{"y": x * 2} for x in range(32)]
+    finally:
+        batcher.close()
+
+    # One collector means one batch holds everything queued within max_wait
+    assert sum(predict.sizes) == 32
+    assert len(predict.sizes) <= 2
+    assert batcher.records / batcher.batches >= 16
+
+
+def test_batches_fill_while_workers_are_busy():
+    hold = threading.Event()
+    predict = RecordingPredict(hold)
+    batcher = MicroBatcher(predict, max_batch=64, max_wait=0.001, workers=1)
+    try:
+        first = batcher.submit({"x": 0})
+        time.sleep(0.05)  # the single worker is now blocked on the first batch
+        rest = [batcher.submit({"x": x}) for x in range(1, 21)]
+        hold.set()
+        assert first.result(2) == {"y": 0}
+        assert [future.result(2) for future in rest] == [{"y": x * 2} for x in range(1, 21)]
+    finally:
+        batcher.close()
+
+    assert predict.sizes == [1, 20]
+
+
+def test_max_batch_caps_batch_size():
+    hold = threading.Event()
+    predict = RecordingPredict(hold)
+    batcher = MicroBatcher(predict, max_batch=4, max_wait=0.05, workers=2)
+    try:
+        futures = submit_concurrently(batcher, list(range(10)))
+        hold.set()
+        for future in futures:
+            future.result(2)
+    finally:
+        batcher.close()
+
+    assert sum(predict.sizes) == 10
+    assert max(predict.sizes) <= 4
+
+
+def test_lone_request_flushes_after_max_wait():
+    predict = RecordingPredict()
+    batcher = MicroBatcher(predict, max_batch=64, max_wait=0.02, workers=2)
+    try:
+        started = time.monotonic()
+        assert batcher.submit({"x": 3}).result(2) == {"y": 6}
+        elapsed = time.monotonic() - started
+    finally:
+        batcher.close()
+
+    assert predict.sizes == [1]
+    assert elapsed < 0.5
+
+
+def test_bad_record_fails_alone():
+    hold = threading.Event()
+    predict = RecordingPredict(hold)
+    batcher = MicroBatcher(predict, max_batch=64, max_wait=0.05, workers=1)
+    try:
+        futures = submit_concurrently(batcher, [1, -1, 2])
+        hold.set()
+        results = {}
+        for value, future in zip([1, -1, 2], futures):
+            try:
+                results[value] = future.result(2)
+            except ValueError as e:
+                results[value] = str(e)
+    finally:
+        batcher.close()
+
+    assert results == {1: {"y": 2}, -1: "negative x", 2: {"y": 4}}
+
+
+def test_close_answers_queued_requests():
+    predict = RecordingPredict()
+    batcher = MicroBatcher(predict, max_batch=64, max_wait=0.01, workers=2)
+    futures = [batcher.submit({"x": x}) for x in range(5)]
+    batcher.close()
+
+    assert [future.result(0) for future in futures] == [{"y": x * 2} for x in range(5)]
@@ -0,0 +1,120 @@
+import json
+import time
+
+import pytest
+
+from utils.response_cache import ResponseCache, normalize_question, token_key
+
+
+def test_normalize_question():
+    assert normalize_question("  How do I   list files?! ") == "how do i list files"
+
+
+def test_token_key_drops_filler_but_keeps_order():
+    assert token_key("please tell me the capital of france") == "capital of france"
+    assert token_key("convert celsius to fahrenheit") != token_key("convert fahrenheit to celsius")
+
+
+def test_exact_hit():
+    cache = ResponseCache()
+    cache.put("code", "How do I list files?", "Use ls", latency=1.5)
+
+    assert cache.get("code", "how do i list files") == "Use ls"
+    stats = cache.stats()
+    assert stats["exact_hits"] == 1
+    assert stats["saved_seconds"] == 1.5
+
+
+def test_near_hit_ignores_filler():
+    cache = ResponseCache()
+    cache.put("code", "How do I list files?", "Use ls")
+
+    assert cache.get("code", "Please, how do I list the files") == "Use ls"
+    assert cache.stats()["near_hits"] == 1
+
+
+@pytest.mark.parametrize("cached, asked", [
+    ("convert celsius to fahrenheit", "convert fahrenheit to celsius"),
+    ("is python bigger than java", "is java bigger than python"),
+    ("is this safe", "is this not safe"),
+    ("how to install docker", "how to uninstall docker"),
+])
+def test_different_questions_miss(cached, asked):
+    cache = ResponseCache()
+    cache.put("general", cached, "answer")
+
+    assert cache.get("general", asked) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_domains_are_separate():
+    cache = ResponseCache()
+    cache.put("health", "is coffee bad", "answer")
+    assert cache.get("finance", "is coffee bad") is None
+
+
+def test_expired_entries_miss():
+    cache = ResponseCache(ttl=0.05)
+    cache.put("code", "list files", "Use ls")
+    time.sleep(0.06)
+
+    assert cache.get("code", "list files") is None
+    assert cache.get("code", "the list files") is None
+
+
+def test_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.put("code", "one", "1")
+    cache.put("code", "two", "2")
+    cache.get("code", "one")
+    cache.put("code", "three", "3")
+
+    assert cache.get("code", "two") is None
+    assert cache.get("code", "one") == "1"
+    assert cache.get("code", "please two") is None
+
+
+def test_persists_and_reloads(tmp_path):
+    path = tmp_path / "responses.json"
+    cache = ResponseCache(path=str(path), save_interval=0)
+    cache.put("code", "list files", "Use ls")
+
+    reloaded = ResponseCache(path=str(path))
+    assert reloaded.get("code", "list files") == "Use ls"
+    assert reloaded.get("code", "please list the files") == "Use ls"
+
+
+def test_put_defers_save_until_interval(tmp_path):
+    path = tmp_path / "responses.json"
+    cache = ResponseCache(path=str(path), save_interval=60)
+    cache.put("code", "list files", "Use ls")
+    assert not path.exists()
+
+    cache.flush()
+    assert json.loads(path.read_text())["entries"][0]["answer"] == "Use ls"
+
+
+@pytest.mark.parametrize("content", [
+    "not json",
+    json.dumps({"no_entries": []}),
+    json.dumps([1, 2]),
+])
+def test_load_tolerates_bad_files(tmp_path, content):
+    path = tmp_path / "responses.json"
+    path.write_text(content)
+    assert ResponseCache(path=str(path)).stats()["entries"] == 0
+
+
+def test_load_skips_malformed_entries(tmp_path):
+    path = tmp_path / "responses.json"
+    good = {"domain": "code", "question": "list files", "answer": "Use ls", "created": time.time()}
+    path.write_text(json.dumps({"entries": [
+        {"domain": "code", "question": "no answer", "created": time.time()},
+        {"question": "no domain", "answer": "x", "created": time.time()},
+        "not an object",
+        good,
+    ]}))
+
+    cache = ResponseCache(path=str(path))
+    assert cache.stats()["entries"] == 1
+    assert cache.get("code", "list files") == "Use ls"
@@ -0,0 +1,129 @@
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+from utils.scrape_cache import ScrapeCache
+
+class FixtureServer:
+    """Serves one page with an ETag; can be made slow or failing"""
+
+    def __init__(self):
+        self.body = "<html><body>Paracetamol</body></html>"
+        self.etag = '"v1"'
+        self.status = 200
+        self.delay = 0.0
+        self.requests = Counter()
+        self.conditional = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests[self.path] += 1
+                time.sleep(server.delay)
+                if self.headers.get("If-None-Match") is not None:
+                    server.conditional += 1
+                if server.status != 200:
+                    self._reply(server.status, b"error")
+                elif self.headers.get("If-None-Match") == server.etag:
+                    self._reply(304, b"")
+                else:
+                    self._reply(200, server.body.encode("utf-8"))
+
+            def _reply(self, status, data):
+                self.send_response(status)
+                self.send_header("ETag", server.etag)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/page"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def server():
+    server = FixtureServer()
+    yield server
+    server.close()
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+def test_fresh_pages_are_served_without_network(server, tmp_path):
+    cache = ScrapeCache(str(tmp_path), ttl=60)
+    assert "Paracetamol" in cache.get(server.url).text
+    cache.get(server.url)
+    assert server.requests["/page"] == 1
+
+def test_cache_survives_restart(server, tmp_path):
+    ScrapeCache(str(tmp_path), ttl=60).get(server.url)
+    page = ScrapeCache(str(tmp_path), ttl=60).get(server.url)
+    assert "Paracetamol" in page.text
+    assert server.requests["/page"] == 1
+
+def test_stale_page_is_revalidated_with_etag(server, tmp_path):
+    cache = ScrapeCache(str(tmp_path), ttl=0.05)
+    first = cache.get(server.url)
+    time.sleep(0.1)
+    assert cache.get(server.url) is first
+    assert wait_for(lambda: cache._pages[server.url] is not first)
+    assert server.conditional == 1
+    assert cache._pages[server.url].text == first.text
+
+def test_failed_refresh_backs_off_and_serves_stale(server, tmp_path):
+    cache = ScrapeCache(str(tmp_path), ttl=0.05, retry_after=60)
+    first = cache.get(server.url)
+    server.status = 500
+    time.sleep(0.1)
+    cache.get(server.url)
+    assert wait_for(lambda: not cache._refreshing)
+    for _ in range(20):
+        assert cache.get(server.url).text == first.text
+    time.sleep(0.1)
+    assert server.requests["/page"] == 2
+
+def test_retry_after_backoff_expires(server, tmp_path):
+    cache = ScrapeCache(str(tmp_path), ttl=0.05, retry_after=0.2)
+    cache.get(server.url)
+    server.status = 500
+    time.sleep(0.1)
+    cache.get(server.url)
+    assert wait_for(lambda: not cache._refreshing)
+    server.status = 200
+    server.body = "<html><body>Ibuprofen</body></html>"
+    server.etag = '"v2"'
+    time.sleep(0.25)
+    cache.get(server.url)
+    assert wait_for(lambda: "Ibuprofen" in cache._pages[server.url].text)
+
+def test_refresher_does_not_duplicate_in_flight_refresh(server, tmp_path):
+    cache = ScrapeCache(str(tmp_path), ttl=0.05)
+    cache.get(server.url)
+    server.delay = 1.0
+    time.sleep(0.1)
+    cache.get(server.url)  # on-demand background refresh, now in flight
+    cache.start_refresher(interval=0.05)
+    try:
+        assert wait_for(lambda: server.requests["/page"] == 2)
+        time.sleep(0.3)
+        assert server.requests["/page"] == 2
+    finally:
+        cache.stop_refresher()
@@ -0,0 +1,96 @@
+import json
+import os
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from utils import titanic_model
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    data_path = tmp_path / "titanic.csv"
+    data_path.write_text("PassengerId\n1\n")
+    monkeypatch.setattr(titanic_model, "DATA_PATH", str(data_path))
+    monkeypatch.setattr(titanic_model, "PROMOTED_PATH", tmp_path / "promoted.json")
+    monkeypatch.setattr(titanic_model, "_training_inputs", None)
+    return data_path
+
+
+def count_calls(monkeypatch, module, name):
+    calls = []
+    original = getattr(module, name)
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(module, name, counted)
+    return calls
+
+
+def test_training_inputs_touch_disk_once_per_interval(paths, monkeypatch):
+    stats = count_calls(monkeypatch, os.path, "getmtime")
+    reads = count_calls(monkeypatch, titanic_model, "load_promoted")
+    inputs = titanic_model.TrainingInputs(check_interval=60)
+
+    first = inputs.get()
+    for _ in range(5):
+        assert inputs.get() == first
+
+    assert first == (os.stat(paths).st_mtime, titanic_model.DEFAULT_PARAMS)
+    assert (len(stats), len(reads)) == (1, 1)
+
+
+def test_training_inputs_recheck_after_interval(paths):
+    inputs = titanic_model.TrainingInputs(check_interval=0)
+    assert "model_type" not in inputs.get()[1]
+
+    titanic_model.PROMOTED_PATH.write_text(json.dumps({"model_type": "random_forest", "model_params": {"n_estimators": 50}}))
+    assert inputs.get()[1]["model_type"] == "random_forest"
+
+
+def test_promote_invalidates_shared_inputs(paths):
+    inputs = titanic_model.get_training_inputs(check_interval=60)
+    assert "model_type" not in inputs.get()[1]
+
+    titanic_model.promote("random_forest", {"n_estimators": 50}, 0.81)
+
+    _, params = inputs.get()
+    assert params["model_type"] == "random_forest"
+    assert params["model_params"] == {"n_estimators": 50}
+
+
+def test_returned_params_are_a_copy(paths):
+    inputs = titanic_model.TrainingInputs(check_interval=60)
+    inputs.get()[1]["max_iter"] = -1
+    assert inputs.get()[1]["max_iter"] == titanic_model.DEFAULT_PARAMS["max_iter"]
+
+
+def test_import_defers_heavy_dependencies():
+    code = ("import sys; import utils.titanic_model, utils.batch_scoring, utils.model_registry; "
+            "print(sorted(name for name in ('pandas', 'numpy', 'sklearn', 'joblib') if name in sys.modules))")
+    completed = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == "[]"
+
+
+def test_pipeline_names_resolve_through_titanic_model():
+    pytest.importorskip("sklearn")
+    from utils import titanic_pipeline
+
+    assert titanic_model.TitanicPreprocessor is titanic_pipeline.TitanicPreprocessor
+    assert titanic_model.make_pipeline is titanic_pipeline.make_pipeline
+    # Artifacts pickled before the split reference the class on utils.titanic_model
+    legacy = pickle.dumps(titanic_pipeline.TitanicPreprocessor, protocol=0).replace(
+        b"utils.titanic_pipeline", b"utils.titanic_model")
+    assert pickle.loads(legacy) is titanic_pipeline.TitanicPreprocessor
+
+
+def test_unknown_attribute_still_raises():
+    with pytest.raises(AttributeError):
+        titanic_model.no_such_name
@@ -0,0 +1,221 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from typing import Dict, Any, List, Optional, Tuple
+
+from utils.ai_agents import AgentRouter, BaseAgent
+
+# Keywords that turn a single request into parallel diagnostic sub-tasks
+PERFORMANCE_KEYWORDS = ["slow", "lag", "performance", "hang", "stuck", "high cpu", "high memory"]
+
+class CancellationToken:
+    """Cooperative cancellation flag shared with running handlers"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Mark the request as cancelled"""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+class AgentPipeline:
+    """Run agent handlers asynchronously with deadlines and cancellation
+
+    The pipeline owns an event loop on a background thread, so a Streamlit
+    script can submit a request, keep rendering and poll the returned future.
+    Submitting again with the same ``session_id`` (e.g. on a rerun after the
+    user navigates away) cancels the previous request for that session.
+
+    Sync handlers run in worker threads via ``BaseAgent.aprocess_request``;
+    cancelling stops waiting on them and sets the ``cancel_token`` passed in
+    the context, but cannot interrupt a thread that ignores it.
+    """
+
+    def __init__(self, router: AgentRouter = None, default_timeout: float = 30.0):
+        self.router = router or AgentRouter()
+        self.default_timeout = default_timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="agent-pipeline", daemon=True)
+        self._thread.start()
+        self._sessions: Dict[str, Tuple[Future, CancellationToken]] = {}
+        self._lock = threading.Lock()
+
+    async def run_agent(self, agent: BaseAgent, request: str, context: Dict[str, Any] = None,
+                        timeout: float = None) -> Dict[str, Any]:
+        """Run one agent with a deadline"""
+        timeout = self.default_timeout if timeout is None else timeout
+        started = time.perf_counter()
+        try:
+            result = dict(await asyncio.wait_for(agent.aprocess_request(request, context), timeout))
+        except asyncio.TimeoutError:
+            result = {
+                "success": False,
+                "response": f"{agent.name} did not answer within {timeout:.1f} seconds",
+                "agent": agent.name,
+                "timed_out": True
+            }
+        except Exception as e:
+            logging.error(f"Agent {agent.name} failed: {str(e)}")
+            result = {
+                "success": False,
+                "response": f"{agent.name} failed: {str(e)}",
+                "agent": agent.name
+            }
+        result["latency_ms"] = (time.perf_counter() - started) * 1000
+        return result
+
+    async def run_subtasks(self, subtasks: List[Tuple[str, str]], context: Dict[str, Any] = None,
+                           timeout: float = None) -> List[Dict[str, Any]]:
+        """Run (agent_name, request) sub-tasks concurrently under one deadline"""
+        return await asyncio.gather(*[
+            self.run_agent(self.router.agents[agent_name], sub_request, context, timeout)
+            for agent_name, sub_request in subtasks
+        ])
+
+    async def handle(self, request: str, context: Dict[str, Any] = None,
+                     timeout: float = None) -> Dict[str, Any]:
+        """Handle a request, fanning out to parallel sub-tasks when useful"""
+        subtasks = self._plan_subtasks(request)
+        if len(subtasks) == 1:
+            agent_name, sub_request = subtasks[0]
+            if agent_name is None:
+                return dict(self.router._no_agent_result(), latency_ms=0.0)
+            return await self.run_agent(self.router.agents[agent_name], sub_request, context, timeout)
+
+        started = time.perf_counter()
+        results = await self.run_subtasks(subtasks, context, timeout)
+        sections = [f"### {result['agent']}\n\n{result['response']}" for result in results]
+        return {
+            "success": all(result["success"] for result in results),
+            "response": "\n\n".join(sections),
+            "agent": "+".join(dict.fromkeys(result["agent"] for result in results)),
+            "subtasks": results,
+            "latency_ms": (time.perf_counter() - started) * 1000
+        }
+
+    def _plan_subtasks(self, request: str) -> List[Tuple[str, str]]:
+        """Split a request into independent (agent_name, request) sub-tasks"""
+        request_lower = self.router._normalize(request)
+        agent_name = self.router._select_agent_normalized(request_lower)
+
+        # "Why is my container slow" needs container and host diagnostics
+        if agent_name == "DockerAssistant" and any(word in request_lower for word in PERFORMANCE_KEYWORDS):
+            return [
+                ("DockerAssistant", "show running containers"),
+                ("LinuxExpert", "check memory usage"),
+                ("LinuxExpert", "show top cpu processes")
+            ]
+
+        return [(agent_name, request)]
+
+    def submit(self, request: str, context: Dict[str, Any] = None, timeout: float = None,
+               session_id: str = None) -> Future:
+        """Schedule a request on the pipeline loop and return a Future
+
+        The overall deadline also bounds the wait for the future, so callers
+        can use ``future.result()`` without their own timeout.
+        """
+        token = CancellationToken()
+        context = dict(context or {}, cancel_token=token)
+        timeout = self.default_timeout if timeout is None else timeout
+
+        if session_id is not None:
+            self.cancel(session_id)
+
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(self.handle(request, context, timeout), timeout),
+            self._loop
+        )
+        future.add_done_callback(lambda _: token.cancel() if future.cancelled() else None)
+
+        if session_id is not None:
+            with self._lock:
+                self._sessions[session_id] = (future, token)
+            # Registered after storing the entry, so a future that is already done still removes it
+            future.add_done_callback(lambda _: self._forget(session_id, future))
+
+        return future
+
+    def run(self, request: str, context: Dict[str, Any] = None, timeout: float = None,
+            session_id: str = None) -> Dict[str, Any]:
+        """Blocking helper around submit() for synchronous callers
+
+        Always returns a result dict with ``latency_ms``, including when the
+        deadline passes or a later submit for the same session supersedes
+        this request.
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        started = time.perf_counter()
+        future = self.submit(request, context, timeout, session_id)
+        try:
+            return future.result()
+        except asyncio.TimeoutError:
+            result = {
+                "success": False,
+                "response": f"Request did not finish within {timeout:.1f} seconds",
+                "agent": self.router._select_agent(request),
+                "timed_out": True
+            }
+        except CancelledError:
+            result = {
+                "success": False,
+                "response": "Request was superseded by a newer request",
+                "agent": self.router._select_agent(request),
+                "superseded": True
+            }
+        result["latency_ms"] = (time.perf_counter() - started) * 1000
+        return result
+
+    def cancel(self, session_id: str) -> bool:
+        """Cancel the in-flight request for a session, if any"""
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return False
+        future, token = entry
+        token.cancel()
+        return future.cancel()
+
+    def _forget(self, session_id: str, future: Future):
+        """Drop a finished request's session entry unless a newer request replaced it"""
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is not None and entry[0] is future:
+                del self._sessions[session_id]
+
+    def shutdown(self):
+        """Cancel pending work and stop the background loop"""
+        with self._lock:
+            session_ids = list(self._sessions)
+        for session_id in session_ids:
+            self.cancel(session_id)
+        asyncio.run_coroutine_threadsafe(self._cancel_all(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+
+    async def _cancel_all(self):
+        """Cancel every task still running on the pipeline loop"""
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+# Example usage and testing
+if __name__ == "__main__":
+    pipeline = AgentPipeline(default_timeout=5.0)
+
+    for request in ["Why is my container slow?", "Can you run the ls command?"]:
+        result = pipeline.run(request)
+        print(f"\nRequest: {request}")
+        print(f"Agent: {result['agent']} ({result['latency_ms']:.2f} ms)")
+        print(f"Response: {result['response'][:100]}...")
+
+    pipeline.shutdown()
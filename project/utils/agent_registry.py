@@ -0,0 +1,234 @@
+import importlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Plugin manifests (*.json) are discovered here and in COMMANDHUB_AGENT_PATH
+DEFAULT_PLUGIN_DIR = Path(__file__).parent / "agents.d"
+ENTRY_POINT_GROUP = "commandhub.agents"
+DEFAULT_AGENT = "CommandRunner"
+
+class AgentSpec:
+    """Import-free description of an agent
+
+    ``target`` is a "module:Class" path that is only imported when the agent
+    is first routed to. Lower ``priority`` values are matched first.
+    """
+
+    def __init__(self, name: str, target: str, description: str = "", specialties: List[str] = None,
+                 keywords: List[str] = None, priority: int = 100):
+        self.name = name
+        self.target = target
+        self.description = description
+        self.specialties = specialties or []
+        self.keywords = [keyword.lower() for keyword in (keywords or [])]
+        self.priority = priority
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgentSpec":
+        return cls(
+            name=data["name"],
+            target=data["target"],
+            description=data.get("description", ""),
+            specialties=data.get("specialties"),
+            keywords=data.get("keywords"),
+            priority=data.get("priority", 100)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "target": self.target,
+            "description": self.description,
+            "specialties": self.specialties,
+            "keywords": self.keywords,
+            "priority": self.priority
+        }
+
+    def load_class(self):
+        """Import the agent module and return the agent class"""
+        module_name, _, class_name = self.target.partition(":")
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)
+
+# Built-in agents, in routing order. Static metadata, so the index is built
+# without importing utils.ai_agents; the agent classes read their name,
+# description and specialties from here through builtin_spec().
+BUILTIN_AGENTS = [
+    AgentSpec(
+        name="DockerAssistant",
+        target="utils.ai_agents:DockerAssistantAgent",
+        description="Manages Docker containers and images",
+        specialties=["Container management", "Docker Compose", "Image building", "Docker networking"],
+        keywords=["docker", "container", "image", "compose"],
+        priority=10
+    ),
+    AgentSpec(
+        name="CodeExplainer",
+        target="utils.ai_agents:CodeExplainerAgent",
+        description="Analyzes and explains code across various programming languages",
+        specialties=["Python", "JavaScript", "Code review", "Best practices", "Debugging"],
+        keywords=["code", "python", "javascript", "function", "programming", "debug"],
+        priority=20
+    ),
+    AgentSpec(
+        name="LinuxExpert",
+        target="utils.ai_agents:LinuxExpertAgent",
+        description="Linux system administration and troubleshooting specialist",
+        specialties=["System administration", "Shell scripting", "Performance tuning", "Troubleshooting"],
+        keywords=["linux", "system", "memory", "process", "network", "admin"],
+        priority=30
+    ),
+    AgentSpec(
+        name="CommandRunner",
+        target="utils.ai_agents:CommandRunnerAgent",
+        description="Executes and explains system commands across platforms",
+        specialties=["Linux commands", "Windows commands", "Command explanation", "System administration"],
+        keywords=[],
+        priority=1000
+    )
+]
+
+def builtin_spec(name: str) -> AgentSpec:
+    """The built-in spec called ``name``"""
+    for spec in BUILTIN_AGENTS:
+        if spec.name == name:
+            return spec
+    raise KeyError(f"Unknown built-in agent: {name}")
+
+class AgentRegistry:
+    """Registry that indexes agents by metadata and instantiates them lazily
+
+    Agents come from the built-in specs, JSON manifests in plugin
+    directories and the ``commandhub.agents`` entry point group. Only the
+    metadata is read at startup; an agent's module is imported and the
+    agent constructed the first time it is requested, then cached.
+    """
+
+    def __init__(self, specs: List[AgentSpec] = None, plugin_dirs: List[str] = None,
+                 discover: bool = True, default_agent: str = DEFAULT_AGENT):
+        self.default_agent = default_agent
+        self._specs: Dict[str, AgentSpec] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._routing_order: Optional[List[AgentSpec]] = None
+
+        for spec in (BUILTIN_AGENTS if specs is None else specs):
+            self.register(spec)
+
+        if discover:
+            if plugin_dirs is None:
+                plugin_dirs = [str(DEFAULT_PLUGIN_DIR)]
+                plugin_dirs += [path for path in os.getenv("COMMANDHUB_AGENT_PATH", "").split(os.pathsep) if path]
+            self.discover_manifests(plugin_dirs)
+            self.discover_entry_points()
+
+    def register(self, spec: AgentSpec):
+        """Add or replace an agent spec"""
+        with self._lock:
+            self._specs[spec.name] = spec
+            self._instances.pop(spec.name, None)
+            self._routing_order = None
+
+    def discover_manifests(self, plugin_dirs: List[str]):
+        """Register agents described by JSON manifests, without importing them
+
+        A manifest holds one spec object or a list of them, using the
+        AgentSpec.to_dict() layout.
+        """
+        for plugin_dir in plugin_dirs:
+            directory = Path(plugin_dir)
+            if not directory.is_dir():
+                continue
+            for manifest in sorted(directory.glob("*.json")):
+                try:
+                    data = json.loads(manifest.read_text(encoding="utf-8"))
+                    for item in (data if isinstance(data, list) else [data]):
+                        self.register(AgentSpec.from_dict(item))
+                except (OSError, ValueError, KeyError) as e:
+                    logging.error(f"Invalid agent manifest {manifest}: {str(e)}")
+
+    def discover_entry_points(self, group: str = ENTRY_POINT_GROUP):
+        """Register agents published by installed packages
+
+        Entry points are indexed by name and target only; keywords and other
+        metadata should be supplied by a manifest with the same name.
+        """
+        try:
+            from importlib.metadata import entry_points
+            discovered = entry_points(group=group)
+        except Exception as e:
+            logging.error(f"Agent entry point discovery failed: {str(e)}")
+            return
+
+        for entry_point in discovered:
+            if entry_point.name not in self._specs:
+                self.register(AgentSpec(name=entry_point.name, target=entry_point.value))
+
+    def metadata(self) -> List[Dict[str, Any]]:
+        """Metadata index for all agents; never imports agent modules"""
+        return [spec.to_dict() for spec in self._ordered_specs()]
+
+    def spec(self, name: str) -> Optional[AgentSpec]:
+        return self._specs.get(name)
+
+    def get(self, name: str):
+        """Return the agent instance, importing and constructing it on first use"""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                spec = self._specs[name]
+                instance = spec.load_class()()
+                self._instances[name] = instance
+            return instance
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def loaded(self) -> Dict[str, Any]:
+        """Agents that have been instantiated so far"""
+        return dict(self._instances)
+
+    def select(self, request_lower: str) -> Optional[str]:
+        """Pick the first agent (by priority) whose keywords match
+
+        Falls back to ``default_agent``; returns None when nothing matches
+        and the default agent isn't registered (e.g. an empty registry).
+        """
+        for spec in self._ordered_specs():
+            if any(keyword in request_lower for keyword in spec.keywords):
+                return spec.name
+        return self.default_agent if self.default_agent in self._specs else None
+
+    def _ordered_specs(self) -> List[AgentSpec]:
+        order = self._routing_order
+        if order is None:
+            with self._lock:
+                order = sorted(self._specs.values(), key=lambda spec: spec.priority)
+                self._routing_order = order
+        return order
+
+    # Mapping-style access so callers can keep using router.agents[name]
+    def __getitem__(self, name: str):
+        if name not in self._specs:
+            raise KeyError(name)
+        return self.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def keys(self) -> List[str]:
+        return [spec.name for spec in self._ordered_specs()]
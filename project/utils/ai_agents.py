@@ -1,9 +1,15 @@
+import asyncio
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Iterable
 from datetime import datetime
 import random
 
+from utils.agent_registry import AgentRegistry, builtin_spec
+
 # Mock AI agents for demonstration
 # In a real implementation, you would integrate with:
 # - OpenAI API
@@ -15,16 +21,25 @@ import random
 class BaseAgent:
     """Base class for all AI agents"""
     
-    def __init__(self, name: str, description: str, specialties: List[str]):
+    def __init__(self, name: str, description: str, specialties: List[str], executor=None):
         self.name = name
         self.description = description
         self.specialties = specialties
         self.conversation_history = []
+        self.executor = executor
     
     def process_request(self, request: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Process user request and return response"""
         raise NotImplementedError("Subclasses must implement process_request")
     
+    async def aprocess_request(self, request: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Async variant of process_request
+        
+        Runs the synchronous handler in a worker thread so it never blocks the
+        event loop. Agents with native async tools can override this.
+        """
+        return await asyncio.to_thread(self.process_request, request, context)
+    
     def add_to_history(self, request: str, response: str):
         """Add interaction to conversation history"""
         self.conversation_history.append({
@@ -33,6 +48,13 @@ class BaseAgent:
             "response": response
         })
     
+    def get_executor(self):
+        """Return the command executor, falling back to the shared local one"""
+        if self.executor is None:
+            from utils.command_executor import get_default_executor
+            self.executor = get_default_executor()
+        return self.executor
+    
     def get_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent conversation history"""
         return self.conversation_history[-limit:]
@@ -44,12 +66,20 @@ class BaseAgent:
 class CommandRunnerAgent(BaseAgent):
     """Agent specialized in command execution and explanation"""
     
-    def __init__(self):
-        super().__init__(
-            name="CommandRunner",
-            description="Executes and explains system commands across platforms",
-            specialties=["Linux commands", "Windows commands", "Command explanation", "System administration"]
-        )
+    # Name, description and specialties come from the registry's static metadata
+    SPEC = builtin_spec("CommandRunner")
+    
+    # Full command lines run for each detected command
+    COMMAND_LINES = {
+        "ls": "ls -la",
+        "ps": "ps aux",
+        "top": "top -b -n 1",
+        "df": "df -h",
+        "free": "free -h"
+    }
+    
+    def __init__(self, executor=None):
+        super().__init__(self.SPEC.name, self.SPEC.description, list(self.SPEC.specialties), executor=executor)
     
     def process_request(self, request: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Process command-related requests"""
@@ -79,27 +109,22 @@ class CommandRunnerAgent(BaseAgent):
                 break
         
         if detected_command:
-            # Mock command execution
-            mock_outputs = {
-                "ls": "total 24\ndrwxr-xr-x 5 user user 4096 Dec  1 10:30 .\ndrwxr-xr-x 3 user user 4096 Dec  1 10:25 ..\n-rw-r--r-- 1 user user  156 Dec  1 10:30 app.py",
-                "pwd": "/home/user/commandhub",
-                "whoami": "commandhub-user",
-                "date": "Mon Dec  1 10:35:42 UTC 2025",
-                "ps": "PID TTY          TIME CMD\n1234 pts/0    00:00:01 bash\n5678 pts/0    00:00:00 python3",
-                "df": "Filesystem     1K-blocks    Used Available Use% Mounted on\n/dev/sda1       20971520 8388608  11534336  42% /",
-                "free": "              total        used        free      shared\nMem:        8147160     2097152     6050008      256000"
-            }
-            
-            output = mock_outputs.get(detected_command, f"Mock output for {detected_command}")
+            command = self.COMMAND_LINES.get(detected_command, detected_command)
+            result = self.get_executor().run(command)
             
-            response = f"I'll execute the `{detected_command}` command for you:\n\n```\n{output}\n```\n\nThis command {self._explain_command(detected_command)}"
+            if result["success"]:
+                response = f"I'll execute the `{command}` command for you:\n\n```\n{result['output'].rstrip()}\n```\n\nThis command {self._explain_command(detected_command)}"
+            else:
+                response = f"I couldn't run `{command}`:\n\n```\n{result['error'].rstrip()}\n```"
             
             self.add_to_history(request, response)
             
             return {
                 "success": True,
                 "response": response,
-                "command_executed": detected_command,
+                "command_executed": command,
+                "command_success": result["success"],
+                "cached": result["cached"],
                 "agent": self.name
             }
         
@@ -197,12 +222,11 @@ What would you like help with?"""
 class DockerAssistantAgent(BaseAgent):
     """Agent specialized in Docker operations"""
     
-    def __init__(self):
-        super().__init__(
-            name="DockerAssistant",
-            description="Manages Docker containers and images",
-            specialties=["Container management", "Docker Compose", "Image building", "Docker networking"]
-        )
+    # Name, description and specialties come from the registry's static metadata
+    SPEC = builtin_spec("DockerAssistant")
+    
+    def __init__(self, executor=None):
+        super().__init__(self.SPEC.name, self.SPEC.description, list(self.SPEC.specialties), executor=executor)
     
     def process_request(self, request: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Process Docker-related requests"""
@@ -222,27 +246,27 @@ class DockerAssistantAgent(BaseAgent):
     
     def _handle_container_info(self, request: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle container-related requests"""
-        # Mock container data
-        containers = [
-            {"name": "web-server", "image": "nginx:latest", "status": "running", "ports": "80:80"},
-            {"name": "database", "image": "postgres:13", "status": "running", "ports": "5432:5432"},
-            {"name": "cache", "image": "redis:alpine", "status": "running", "ports": "6379:6379"}
-        ]
-        
-        response = "Here are the currently running Docker containers:\n\n"
-        response += "```\n"
-        response += "CONTAINER    IMAGE           STATUS     PORTS\n"
-        response += "-" * 45 + "\n"
+        containers = self.get_executor().docker_containers()
         
-        for container in containers:
-            response += f"{container['name']:<12} {container['image']:<15} {container['status']:<10} {container['ports']}\n"
-        
-        response += "```\n\nAll containers are running healthy. Would you like me to check logs or perform any operations?"
+        if containers is None:
+            response = "I couldn't reach the Docker daemon. Make sure Docker is running and that you have permission to access it."
+        elif not containers:
+            response = "There are no running Docker containers right now. Would you like me to help you start one?"
+        else:
+            response = "Here are the currently running Docker containers:\n\n"
+            response += "```\n"
+            response += "CONTAINER    IMAGE           STATUS     PORTS\n"
+            response += "-" * 45 + "\n"
+            
+            for container in containers:
+                response += f"{container['name']:<12} {container['image']:<15} {container['status']:<10} {', '.join(container['ports'])}\n"
+            
+            response += "```\n\nWould you like me to check logs or perform any operations?"
         
         self.add_to_history(request, response)
         
         return {
-            "success": True,
+            "success": containers is not None,
             "response": response,
             "agent": self.name
         }
@@ -369,12 +393,11 @@ What Docker task can I help you with?"""
 class CodeExplainerAgent(BaseAgent):
     """Agent specialized in code analysis and explanation"""
     
-    def __init__(self):
-        super().__init__(
-            name="CodeExplainer",
-            description="Analyzes and explains code across various programming languages",
-            specialties=["Python", "JavaScript", "Code review", "Best practices", "Debugging"]
-        )
+    # Name, description and specialties come from the registry's static metadata
+    SPEC = builtin_spec("CodeExplainer")
+    
+    def __init__(self, executor=None):
+        super().__init__(self.SPEC.name, self.SPEC.description, list(self.SPEC.specialties), executor=executor)
     
     def process_request(self, request: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Process code-related requests"""
@@ -566,15 +589,55 @@ What code would you like me to help you with?"""
             "agent": self.name
         }
 
+SIZE_UNITS = {"B": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4, "P": 1024 ** 5}
+SIZE_RE = re.compile(r"^(\d+(?:\.\d+)?)(?:([KMGTP])i?B?|(B))?$", re.IGNORECASE)
+
+def parse_size(value: str) -> float:
+    """Convert a `free -h` size such as '7.7Gi', '512M' or '980B' to bytes"""
+    match = SIZE_RE.match(value.strip())
+    if not match:
+        raise ValueError(f"Not a size: {value!r}")
+    number, unit, plain_bytes = match.groups()
+    if unit:
+        return float(number) * SIZE_UNITS[unit.upper()]
+    if plain_bytes:
+        return float(number)
+    # Plain numbers from `free` without -h are KiB
+    return float(number) * 1024
+
+def format_bytes(size: float) -> str:
+    """Format bytes as a short human readable size"""
+    for unit in ["B", "KB", "MB", "GB", "TB"]:
+        if size < 1024 or unit == "TB":
+            return f"{size:.1f}{unit}"
+        size /= 1024
+
+def parse_free_output(output: str) -> Dict[str, Dict[str, float]]:
+    """Parse `free` output into {"mem": {...}, "swap": {...}} in bytes"""
+    lines = output.strip().splitlines()
+    if not lines:
+        return {}
+    
+    header = lines[0].split()
+    parsed = {}
+    for line in lines[1:]:
+        label, _, values = line.partition(":")
+        try:
+            parsed[label.strip().lower()] = {
+                column: parse_size(value) for column, value in zip(header, values.split())
+            }
+        except ValueError:
+            continue
+    return parsed
+
 class LinuxExpertAgent(BaseAgent):
     """Agent specialized in Linux system administration"""
     
-    def __init__(self):
-        super().__init__(
-            name="LinuxExpert",
-            description="Linux system administration and troubleshooting specialist",
-            specialties=["System administration", "Shell scripting", "Performance tuning", "Troubleshooting"]
-        )
+    # Name, description and specialties come from the registry's static metadata
+    SPEC = builtin_spec("LinuxExpert")
+    
+    def __init__(self, executor=None):
+        super().__init__(self.SPEC.name, self.SPEC.description, list(self.SPEC.specialties), executor=executor)
     
     def process_request(self, request: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Process Linux-related requests"""
@@ -597,28 +660,31 @@ class LinuxExpertAgent(BaseAgent):
     
     def _handle_memory_info(self, request: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle memory-related requests"""
-        response = """Here's the current memory usage analysis:
+        result = self.get_executor().run("free -h")
+        
+        if not result["success"]:
+            response = f"I couldn't read memory usage:\n\n```\n{result['error'].rstrip()}\n```"
+            self.add_to_history(request, response)
+            return {
+                "success": False,
+                "response": response,
+                "agent": self.name
+            }
+        
+        memory = parse_free_output(result["output"])
+        response = f"""Here's the current memory usage analysis:
 
 ```bash
 $ free -h
-              total        used        free      shared  buff/cache   available
-Mem:           8.0Gi       2.1Gi       4.2Gi       256Mi       1.7Gi       5.5Gi
-Swap:          2.0Gi          0B       2.0Gi
+{result['output'].rstrip()}
 ```
 
-**Memory Analysis:**
-- **Total RAM**: 8GB installed
-- **Used**: 2.1GB (26% utilization)
-- **Available**: 5.5GB (69% available for applications)
-- **Buffer/Cache**: 1.7GB (used for filesystem caching)
-- **Swap**: 2GB configured, currently unused
-
-**Memory Status**: ✅ **Healthy** - Memory usage is normal
+{self._memory_analysis(memory)}
 
 **Optimization Tips:**
-- Current usage is optimal for system performance
-- Swap is available but not needed (good sign)
-- Buffer/cache is working efficiently
+- Buffer/cache is reclaimed automatically when applications need memory
+- Steady swap usage means the system is short on RAM
+- Find the biggest consumers with `ps aux --sort=-%mem | head`
 - Consider monitoring if usage approaches 80%
 
 **Monitoring Commands:**
@@ -636,29 +702,78 @@ Need help with memory optimization or troubleshooting?"""
         return {
             "success": True,
             "response": response,
+            "cached": result["cached"],
             "agent": self.name
         }
     
+    def _memory_analysis(self, memory: Dict[str, Dict[str, float]]) -> str:
+        """Summarize parsed `free` output"""
+        mem = memory.get("mem")
+        if not mem or not mem.get("total"):
+            return "**Memory Analysis:** Could not parse the memory figures above."
+        
+        total = mem["total"]
+        used_pct = mem.get("used", 0) / total * 100
+        available = mem.get("available", mem.get("free", 0))
+        lines = [
+            "**Memory Analysis:**",
+            f"- **Total RAM**: {format_bytes(total)} installed",
+            f"- **Used**: {format_bytes(mem.get('used', 0))} ({used_pct:.0f}% utilization)",
+            f"- **Available**: {format_bytes(available)} ({available / total * 100:.0f}% available for applications)",
+            f"- **Buffer/Cache**: {format_bytes(mem.get('buff/cache', 0))} (used for filesystem caching)"
+        ]
+        swap = memory.get("swap")
+        if swap and swap.get("total"):
+            lines.append(f"- **Swap**: {format_bytes(swap['total'])} configured, {format_bytes(swap.get('used', 0))} in use")
+        
+        if used_pct >= 90:
+            status = "🔴 **Critical** - Memory is nearly exhausted"
+        elif used_pct >= 80:
+            status = "⚠️ **High** - Memory usage is above 80%"
+        else:
+            status = "✅ **Healthy** - Memory usage is normal"
+        lines.append(f"\n**Memory Status**: {status}")
+        return "\n".join(lines)
+    
     def _handle_process_info(self, request: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle process-related requests"""
-        response = """Here are the top processes by resource usage:
+        table = self.get_executor().process_table()
+        
+        if table is None:
+            response = "I couldn't list the running processes on this system."
+            self.add_to_history(request, response)
+            return {
+                "success": False,
+                "response": response,
+                "agent": self.name
+            }
+        
+        sort_by = "mem" if any(word in request.lower() for word in ["mem", "ram"]) else "cpu"
+        top = table.top(5, by=sort_by)
+        totals = table.totals()
+        
+        rows = "\n".join(
+            f"{proc['user']:<10} {proc['pid']:>6} {proc['cpu']:>5.1f} {proc['mem']:>5.1f} {proc['command'][:40]}"
+            for proc in top
+        )
+        label = "memory" if sort_by == "mem" else "CPU"
+        highlights = "\n".join(
+            f"{index}. **{proc['command'][:40]}** (PID {proc['pid']}) - {proc['cpu']:.1f}% CPU, {proc['mem']:.1f}% memory"
+            for index, proc in enumerate(top[:3], 1)
+        )
+        status = "⚠️ **Busy** - Total CPU usage is high" if totals["cpu"] > 80 else "✅ **Normal** - CPU usage distributed appropriately"
+        
+        response = f"""Here are the top processes by {label} usage ({totals['count']} processes running):
 
 ```bash
-$ ps aux --sort=-%cpu | head -10
-USER       PID %CPU %MEM    VSZ   RSS TTY      STAT START   TIME COMMAND
-root      1234 12.5  3.2 123456 65536 ?       S    10:00   0:05 python3 app.py
-www-data  5678  8.1  2.1  98765 43210 ?       S    09:30   0:12 nginx: worker
-postgres  9012  4.3  1.8  87654 32109 ?       S    09:00   0:08 postgres: server
-user      3456  2.1  0.8  45678 16384 pts/0   S+   10:15   0:02 bash
-systemd      1  0.1  0.3  12345  6789 ?       S    08:00   0:01 /sbin/init
+USER          PID  %CPU  %MEM COMMAND
+{rows}
 ```
 
 **Process Analysis:**
-1. **python3 app.py** (PID 1234) - High CPU usage (12.5%)
-2. **nginx worker** (PID 5678) - Moderate CPU usage (8.1%)
-3. **postgres server** (PID 9012) - Database activity (4.3%)
+{highlights}
 
-**System Health**: ✅ **Normal** - CPU usage distributed appropriately
+**System Health**: {status}
 
 **Process Management Commands:**
 ```bash
@@ -870,68 +985,163 @@ What Linux system task can I help you with today?"""
             "agent": self.name
         }
 
+# Agents registered by default (AgentRegistry reads their metadata from the classes)
+BUILTIN_AGENT_CLASSES = [DockerAssistantAgent, CodeExplainerAgent, LinuxExpertAgent, CommandRunnerAgent]
+
 class AgentRouter:
     """Routes requests to appropriate AI agents"""
     
-    def __init__(self):
-        self.agents = {
-            "CommandRunner": CommandRunnerAgent(),
-            "DockerAssistant": DockerAssistantAgent(),
-            "CodeExplainer": CodeExplainerAgent(),
-            "LinuxExpert": LinuxExpertAgent()
-        }
+    def __init__(self, registry: AgentRegistry = None):
+        # Agents are imported and constructed lazily on first route
+        self.registry = registry if registry is not None else AgentRegistry()
+        self.agents = self.registry
     
     def route_request(self, request: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """Route request to most appropriate agent"""
         agent_name = self._select_agent(request)
+        if agent_name is None:
+            return self._no_agent_result()
         agent = self.agents[agent_name]
         
         return agent.process_request(request, context)
     
-    def _select_agent(self, request: str) -> str:
-        """Select most appropriate agent based on request content"""
-        request_lower = request.lower()
+    def route_many(self, requests: Iterable[str], contexts: List[Dict[str, Any]] = None,
+                   max_workers: int = None) -> List[Dict[str, Any]]:
+        """Route a batch of requests and return results in input order
         
-        # Docker-related keywords
-        if any(word in request_lower for word in ["docker", "container", "image", "compose"]):
-            return "DockerAssistant"
+        Every request is normalized once up front and grouped by the selected
+        agent. Groups run concurrently (one worker per agent), while requests
+        inside a group run sequentially so each agent's conversation history
+        keeps the input order. Each result carries its ``latency_ms``.
+        """
+        requests = list(requests)
+        if contexts is None:
+            contexts = [None] * len(requests)
+        elif len(contexts) != len(requests):
+            raise ValueError("contexts must have the same length as requests")
         
-        # Code-related keywords
-        elif any(word in request_lower for word in ["code", "python", "javascript", "function", "programming", "debug"]):
-            return "CodeExplainer"
+        # Normalize once and group request indices by agent
+        groups: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            agent_name = self._select_agent_normalized(self._normalize(request))
+            groups.setdefault(agent_name, []).append(index)
         
-        # Linux system keywords
-        elif any(word in request_lower for word in ["linux", "system", "memory", "process", "network", "admin"]):
-            return "LinuxExpert"
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
         
-        # Default to CommandRunner
-        else:
-            return "CommandRunner"
+        def run_group(agent_name: Optional[str], indices: List[int]):
+            if agent_name is None:
+                for index in indices:
+                    results[index] = dict(self._no_agent_result(), latency_ms=0.0)
+                return
+            agent = self.agents[agent_name]
+            for index in indices:
+                started = time.perf_counter()
+                try:
+                    result = dict(agent.process_request(requests[index], contexts[index]))
+                except Exception as e:
+                    logging.error(f"Agent {agent_name} failed on request {index}: {str(e)}")
+                    result = {
+                        "success": False,
+                        "response": f"Request failed: {str(e)}",
+                        "agent": agent_name
+                    }
+                result["latency_ms"] = (time.perf_counter() - started) * 1000
+                results[index] = result
+        
+        if not groups:
+            return []
+        
+        workers = max_workers or len(groups)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_group, name, indices) for name, indices in groups.items()]
+            for future in futures:
+                future.result()
+        
+        return results
+    
+    @staticmethod
+    def _no_agent_result() -> Dict[str, Any]:
+        return {
+            "success": False,
+            "response": "No agent is registered to handle this request.",
+            "agent": None
+        }
+    
+    @staticmethod
+    def _normalize(request: str) -> str:
+        """Normalize request text for keyword matching"""
+        return " ".join(request.lower().split())
+    
+    def _select_agent(self, request: str) -> Optional[str]:
+        """Select most appropriate agent based on request content
+
+        Uses the same normalization as route_many, so a request routes the
+        same way through either entry point.
+        """
+        return self._select_agent_normalized(self._normalize(request))
+    
+    def _select_agent_normalized(self, request_lower: str) -> Optional[str]:
+        """Select agent for a request already passed through _normalize"""
+        return self.registry.select(request_lower)
     
     def get_agent_info(self, agent_name: str) -> Dict[str, Any]:
         """Get information about specific agent"""
-        if agent_name in self.agents:
-            agent = self.agents[agent_name]
-            return {
-                "name": agent.name,
-                "description": agent.description,
-                "specialties": agent.specialties,
-                "history_count": len(agent.conversation_history)
-            }
-        return None
+        spec = self.registry.spec(agent_name)
+        if spec is None:
+            return None
+        
+        history_count = 0
+        if self.registry.is_loaded(agent_name):
+            history_count = len(self.registry.get(agent_name).conversation_history)
+        
+        return {
+            "name": spec.name,
+            "description": spec.description,
+            "specialties": spec.specialties,
+            "keywords": spec.keywords,
+            "history_count": history_count
+        }
     
     def list_agents(self) -> List[Dict[str, Any]]:
         """List all available agents"""
-        return [self.get_agent_info(name) for name in self.agents.keys()]
+        return [self.get_agent_info(name) for name in self.registry.keys()]
     
     def clear_agent_history(self, agent_name: str):
         """Clear conversation history for specific agent"""
-        if agent_name in self.agents:
-            self.agents[agent_name].clear_history()
+        if self.registry.is_loaded(agent_name):
+            self.registry.get(agent_name).clear_history()
 
-# Example usage and testing
-if __name__ == "__main__":
-    router = AgentRouter()
+def load_requests_jsonl(path: str) -> List[Dict[str, Any]]:
+    """Load requests from a JSONL file
+    
+    Each line is either a JSON string or an object with a ``request``
+    (or ``query``/``text``) field and an optional ``context`` object.
+    """
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            if isinstance(item, str):
+                records.append({"request": item, "context": None})
+                continue
+            request = item.get("request") or item.get("query") or item.get("text")
+            if not request:
+                raise ValueError(f"{path}:{line_number}: missing 'request' field")
+            records.append({"request": request, "context": item.get("context")})
+    return records
+
+def main(argv: List[str] = None):
+    """Command line entry point for single and batch routing"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Route requests through the CommandHub agents")
+    parser.add_argument("--jsonl", nargs="*", default=[], help="JSONL files with requests to replay")
+    parser.add_argument("--output", help="Write results as JSONL to this file instead of printing")
+    parser.add_argument("--workers", type=int, default=None, help="Maximum concurrent agent groups")
+    args = parser.parse_args(argv)
     
     # Test requests
     test_requests = [
@@ -943,8 +1153,33 @@ if __name__ == "__main__":
         "What does the ps command do?"
     ]
     
-    for request in test_requests:
-        print(f"\nRequest: {request}")
-        response = router.route_request(request)
-        print(f"Agent: {response['agent']}")
-        print(f"Response: {response['response'][:100]}...")
\ No newline at end of file
+    records = []
+    for path in args.jsonl:
+        records.extend(load_requests_jsonl(path))
+    if not records:
+        records = [{"request": request, "context": None} for request in test_requests]
+    
+    router = AgentRouter()
+    started = time.perf_counter()
+    results = router.route_many(
+        [record["request"] for record in records],
+        [record["context"] for record in records],
+        max_workers=args.workers
+    )
+    elapsed = time.perf_counter() - started
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for record, result in zip(records, results):
+                f.write(json.dumps({"request": record["request"], **result}, default=str) + "\n")
+    else:
+        for record, result in zip(records, results):
+            print(f"\nRequest: {record['request']}")
+            print(f"Agent: {result['agent']} ({result['latency_ms']:.2f} ms)")
+            print(f"Response: {result['response'][:100]}...")
+    
+    print(f"\nRouted {len(results)} requests in {elapsed:.3f}s")
+
+# Example usage and testing
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from utils.lazy_imports import lazy_import
+
+# Imported on first use, so pages can import this module without paying for pandas
+pd = lazy_import("pandas")
+
+DEFAULT_OUTPUT_DIR = Path(".cache/batch")
+DEFAULT_CHUNK_ROWS = 50_000
+DEFAULT_OUTPUT_TTL = 3600  # seconds a scored file is kept when it isn't downloaded
+MAX_DOWNLOAD_BYTES = 100 * 1024 * 1024  # compressed size the page will hand to the browser
+
+def read_chunks(source, name: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yield DataFrame chunks of a CSV or Parquet file without loading it whole"""
+    if name.lower().endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet scoring needs pyarrow (pip install pyarrow)")
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(source, chunksize=chunk_rows)
+
+def prune_outputs(output_dir: str = None, ttl: float = DEFAULT_OUTPUT_TTL) -> int:
+    """Delete scored files older than ``ttl`` seconds; returns how many were removed"""
+    removed = 0
+    cutoff = time.time() - ttl
+    for path in Path(output_dir or DEFAULT_OUTPUT_DIR).glob("scored-*"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError as e:
+            logging.error(f"Could not remove old batch output {path}: {str(e)}")
+    return removed
+
+def score_to_csv(chunks: Iterator[pd.DataFrame], score: Callable[[pd.DataFrame], pd.DataFrame],
+                 output_path: str = None, progress: Callable[[int, float], None] = None) -> Dict[str, Any]:
+    """Score chunk by chunk and append each result to a gzipped CSV on disk
+
+    Only one chunk is held in memory at a time, so memory stays flat
+    whatever the input size. ``progress(rows, seconds)`` is called after
+    every chunk. Outputs in the default directory older than
+    ``DEFAULT_OUTPUT_TTL`` are pruned first.
+    """
+    if output_path is None:
+        DEFAULT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        prune_outputs()
+        output_path = DEFAULT_OUTPUT_DIR / f"scored-{uuid.uuid4().hex[:12]}.csv.gz"
+    output_path = Path(output_path)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+
+    rows = 0
+    started = time.perf_counter()
+    with gzip.open(tmp_path, "wt", newline="", encoding="utf-8", compresslevel=6) as out:
+        for index, chunk in enumerate(chunks):
+            scored = score(chunk)
+            scored.to_csv(out, header=index == 0, index=False)
+            rows += len(scored)
+            if progress is not None:
+                progress(rows, time.perf_counter() - started)
+    os.replace(tmp_path, output_path)
+
+    seconds = time.perf_counter() - started
+    return {
+        "path": str(output_path),
+        "bytes": output_path.stat().st_size,
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds > 0 else 0.0
+    }
+
+def take_download(path: str, max_bytes: int = MAX_DOWNLOAD_BYTES) -> Optional[bytes]:
+    """Read a scored file for a download button and delete it
+
+    Returns None, leaving the file for ``prune_outputs``, when it is over
+    ``max_bytes``, so the page never pulls an unbounded file into memory.
+    """
+    path = Path(path)
+    if path.stat().st_size > max_bytes:
+        return None
+    data = path.read_bytes()
+    path.unlink()
+    return data
+
+def titanic_scorer(pipeline) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """Chunk scorer for the Titanic pipeline: adds predicted class and probability"""
+    from utils.titanic_model import FEATURES
+
+    def score(chunk: pd.DataFrame) -> pd.DataFrame:
+        missing = [column for column in FEATURES if column not in chunk.columns]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+        probabilities = pipeline.predict_proba(chunk[FEATURES])[:, 1]
+        scored = chunk.copy()
+        scored["Survived_pred"] = (probabilities >= 0.5).astype("int8")
+        scored["Survival_probability"] = probabilities.round(4)
+        return scored
+
+    return score
+
+def salary_scorer(model, feature: str = None) -> Callable[[pd.DataFrame], pd.DataFrame]:
+    """Chunk scorer for the salary model: adds the predicted salary"""
+    if feature is None:
+        from utils.salary_model import FEATURE as feature
+
+    def score(chunk: pd.DataFrame) -> pd.DataFrame:
+        if feature not in chunk.columns:
+            raise ValueError(f"Missing column: {feature}")
+        scored = chunk.copy()
+        scored["Predicted_salary"] = model.predict(chunk[[feature]])
+        return scored
+
+    return score
@@ -0,0 +1,166 @@
+import html
+import json
+import logging
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_CATALOG_PATH = Path("assets/catalog.json")
+
+# Shared by every page that renders catalog cards; injected once per render
+CARD_CSS = """<style>
+.card-grid {display: grid; grid-template-columns: repeat(var(--card-columns, 2), minmax(0, 1fr)); column-gap: 1rem;}
+@media (max-width: 640px) {.card-grid {grid-template-columns: 1fr;}}
+.feature-card {background: linear-gradient(145deg, #2d3748 0%, #4a5568 100%); padding: 1.5rem; border-radius: 15px;
+  border: 1px solid #4a5568; margin: 1rem 0; transition: transform 0.3s ease;}
+.feature-card:hover {transform: translateY(-5px); box-shadow: 0 10px 25px rgba(0,0,0,0.3);}
+.view-btn {display: inline-block; margin-top: 10px; width: 100%; padding: 0.6em; border: none; border-radius: 5px;
+  background-color: #00B2FF !important; color: white !important; font-weight: bold; text-align: center;
+  text-decoration: none; cursor: pointer;}
+.view-btn:hover {background-color: #0095d9 !important;}
+</style>"""
+
+# A rendered page is a list of blocks: ("grid", html) for a run of link-only cards sent as
+# one markdown element, or ("row", [(html, page), ...]) for a row with navigation buttons
+Block = Tuple[str, Any]
+
+def card_html(card: Dict[str, Any]) -> str:
+    """One feature card as HTML; all text from the catalog is escaped"""
+    parts = [f"<h3>{html.escape(card['title'])}</h3>"]
+    if card.get("description"):
+        parts.append(f"<p>{html.escape(card['description'])}</p>")
+    if card.get("bullets"):
+        parts.append("<ul>" + "".join(f"<li>{html.escape(item)}</li>" for item in card["bullets"]) + "</ul>")
+    for link in card.get("links", []):
+        parts.append(f'<a class="view-btn" href="{html.escape(link["url"])}" target="_blank" '
+                     f'rel="noopener noreferrer">{html.escape(link["label"])}</a>')
+    return '<div class="feature-card">' + "".join(parts) + "</div>"
+
+def grid_html(cards: List[str], columns: int) -> str:
+    return f'<div class="card-grid" style="--card-columns: {columns}">' + "".join(cards) + "</div>"
+
+def page_count(total: int, per_page: int) -> int:
+    return max(1, math.ceil(total / per_page))
+
+class ProjectCatalog:
+    """Project cards loaded from a JSON catalog, rendered to HTML once per catalog version
+
+    The catalog file is stat'ed at most once per ``check_interval`` seconds
+    and re-read only when its mtime or size moved. Rendered pages are cached
+    by (version, section, page, per_page, columns) and shared by every
+    session, so a rerun only looks up strings; a page is rendered the first
+    time someone opens it.
+    """
+
+    def __init__(self, path: str = None, check_interval: float = 5.0):
+        self.path = Path(path) if path else DEFAULT_CATALOG_PATH
+        self.check_interval = check_interval
+        self.version: Optional[str] = None
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        self._pages: Dict[Tuple, List[Block]] = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def section(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            return self._sections[name]
+
+    def page(self, name: str, page: int = 0, per_page: int = 20, columns: int = 2) -> List[Block]:
+        """Rendered blocks for one page of a section"""
+        with self._lock:
+            self._refresh()
+            key = (self.version, name, page, per_page, columns)
+            blocks = self._pages.get(key)
+            if blocks is None:
+                cards = self._sections[name]["cards"][page * per_page:(page + 1) * per_page]
+                blocks = self._pages[key] = self._render(cards, columns)
+            return blocks
+
+    def _render(self, cards: List[Dict[str, Any]], columns: int) -> List[Block]:
+        blocks: List[Block] = []
+        pending: List[str] = []
+        for start in range(0, len(cards), columns):
+            row = cards[start:start + columns]
+            if any("page" in card for card in row):
+                if pending:
+                    blocks.append(("grid", grid_html(pending, columns)))
+                    pending = []
+                blocks.append(("row", [(card_html(card), card.get("page")) for card in row]))
+            else:
+                pending.extend(card_html(card) for card in row)
+        if pending:
+            blocks.append(("grid", grid_html(pending, columns)))
+        return blocks
+
+    def _refresh(self):
+        now = time.monotonic()
+        if self.version is not None and now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        try:
+            stat = self.path.stat()
+            version = f"{stat.st_mtime_ns}-{stat.st_size}"
+            if version == self.version:
+                return
+            sections = json.loads(self.path.read_text(encoding="utf-8"))["sections"]
+        except (OSError, ValueError, KeyError) as e:
+            if self.version is None:
+                raise
+            logging.error(f"Could not reload project catalog, keeping loaded version: {str(e)}")
+            return
+        self._sections = sections
+        self._pages = {}
+        self.version = version
+
+_default_catalog = None
+_default_lock = threading.Lock()
+
+def get_default_catalog() -> ProjectCatalog:
+    """Process-wide catalog backed by ``assets/catalog.json``"""
+    global _default_catalog
+    with _default_lock:
+        if _default_catalog is None:
+            _default_catalog = ProjectCatalog()
+        return _default_catalog
+
+def render_section(name: str, per_page: int = 20, columns: int = 2, catalog: ProjectCatalog = None):
+    """Render one page of a catalog section into the current Streamlit page
+
+    Link-only cards go out as a single HTML grid; cards that open another
+    page keep a ``st.button`` so navigation stays inside the session.
+    """
+    import streamlit as st
+
+    catalog = catalog or get_default_catalog()
+    section = catalog.section(name)
+    pages = page_count(len(section["cards"]), per_page)
+    state_key = f"catalog_page_{name}"
+    page = min(st.session_state.get(state_key, 0), pages - 1)
+
+    st.markdown(CARD_CSS, unsafe_allow_html=True)
+    if section.get("title"):
+        st.markdown(section["title"])
+
+    for kind, content in catalog.page(name, page, per_page, columns):
+        if kind == "grid":
+            st.markdown(content, unsafe_allow_html=True)
+            continue
+        for column, (card, target) in zip(st.columns(columns), content):
+            with column:
+                st.markdown(card, unsafe_allow_html=True)
+                if target and st.button(target["label"], key=target["key"], use_container_width=True):
+                    st.switch_page(target["path"])
+
+    if pages > 1:
+        def go_to(target_page: int):
+            st.session_state[state_key] = target_page
+
+        previous_col, info_col, next_col = st.columns([1, 2, 1])
+        previous_col.button("← Previous", key=f"{state_key}_prev", disabled=page == 0,
+                            on_click=go_to, args=(page - 1,), use_container_width=True)
+        info_col.markdown(f"<p style='text-align: center'>Page {page + 1} of {pages}</p>", unsafe_allow_html=True)
+        next_col.button("Next →", key=f"{state_key}_next", disabled=page >= pages - 1,
+                        on_click=go_to, args=(page + 1,), use_container_width=True)
@@ -0,0 +1,121 @@
+import math
+import re
+from collections import deque
+from typing import Dict, List
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for Gemini/GPT tokenizers)"""
+    return max(1, math.ceil(len(text) / 4))
+
+def first_sentence(text: str, max_chars: int = 160) -> str:
+    """First sentence of a message, flattened and clipped for summaries"""
+    text = " ".join(text.replace("*", "").split())
+    match = re.match(r"(.+?[.!?])(\s|$)", text)
+    sentence = match.group(1) if match else text
+    if len(sentence) > max_chars:
+        sentence = sentence[:max_chars - 1].rstrip() + "…"
+    return sentence
+
+class ChatTurn:
+    """One chat message with its token count computed once"""
+
+    __slots__ = ("role", "content", "_tokens")
+
+    def __init__(self, role: str, content: str):
+        self.role = role
+        self.content = content
+        self._tokens = None
+
+    @property
+    def tokens(self) -> int:
+        if self._tokens is None:
+            self._tokens = estimate_tokens(self.content)
+        return self._tokens
+
+    def to_message(self) -> Dict[str, str]:
+        return {"role": self.role, "content": self.content}
+
+class ChatSession:
+    """Multi-turn conversation kept within a prompt token budget
+
+    Recent turns are sent verbatim. Once the prompt would exceed
+    ``token_budget``, the oldest turns are folded into a short extractive
+    summary (one line per turn), and summary lines beyond ``summary_budget``
+    are dropped. Compaction happens as turns are added, so building the
+    prompt stays cheap and its size stays bounded however long the chat gets.
+    """
+
+    def __init__(self, system_prompt: str = "", token_budget: int = 2000, min_recent: int = 2,
+                 summary_budget: int = 300):
+        self.system_prompt = system_prompt
+        self.token_budget = token_budget
+        self.min_recent = min_recent
+        self.summary_budget = summary_budget
+        self.turns: deque = deque()
+        self.transcript: List[ChatTurn] = []
+        self._summary_lines: deque = deque()
+        self._summary_tokens = 0
+        self._turn_tokens = 0
+        self._system_tokens = estimate_tokens(system_prompt) if system_prompt else 0
+
+    def add(self, role: str, content: str) -> ChatTurn:
+        """Append a turn and compact older history if over budget"""
+        turn = ChatTurn(role, content)
+        self.turns.append(turn)
+        self.transcript.append(turn)
+        self._turn_tokens += turn.tokens
+        self._compact()
+        return turn
+
+    @property
+    def prompt_tokens(self) -> int:
+        """Estimated size of the prompt build_messages() returns"""
+        return self._system_tokens + self._summary_tokens + self._turn_tokens
+
+    @property
+    def summary(self) -> str:
+        return "\n".join(self._summary_lines)
+
+    def build_messages(self) -> List[Dict[str, str]]:
+        """Messages to send: preamble (system prompt + summary) then recent turns"""
+        preamble_parts = []
+        if self.system_prompt:
+            preamble_parts.append(self.system_prompt)
+        if self._summary_lines:
+            preamble_parts.append(f"Summary of the earlier conversation:\n{self.summary}")
+        preamble = "\n\n".join(preamble_parts)
+
+        messages = [turn.to_message() for turn in self.turns]
+        if preamble:
+            if messages and messages[0]["role"] == "user":
+                messages[0] = {"role": "user", "content": f"{preamble}\n\n{messages[0]['content']}"}
+            else:
+                messages.insert(0, {"role": "user", "content": preamble})
+        return messages
+
+    def discard_last(self):
+        """Remove the most recent turn (e.g. a question that got no answer)"""
+        if self.turns:
+            turn = self.turns.pop()
+            self._turn_tokens -= turn.tokens
+            self.transcript.pop()
+
+    def clear(self):
+        self.turns.clear()
+        self.transcript.clear()
+        self._summary_lines.clear()
+        self._summary_tokens = 0
+        self._turn_tokens = 0
+
+    def _compact(self):
+        while self.prompt_tokens > self.token_budget and len(self.turns) > self.min_recent:
+            turn = self.turns.popleft()
+            self._turn_tokens -= turn.tokens
+            speaker = "User" if turn.role == "user" else "Assistant"
+            line = f"- {speaker}: {first_sentence(turn.content)}"
+            self._summary_lines.append(line)
+            self._summary_tokens += estimate_tokens(line)
+
+        while self._summary_lines and self._summary_tokens > self.summary_budget:
+            dropped = self._summary_lines.popleft()
+            self._summary_tokens -= estimate_tokens(dropped)
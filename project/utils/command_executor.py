@@ -0,0 +1,233 @@
+import heapq
+import json
+import logging
+import threading
+import time
+from array import array
+from typing import Dict, Any, List, Optional, Tuple
+
+from utils.ssh_runner import SSHRunner, is_safe_command
+
+class ProcessTable:
+    """Columnar view of a ``ps aux`` listing
+
+    Numeric columns are stored in typed arrays and text columns in lists, so
+    a full process table stays compact and can be queried repeatedly (top-N
+    by CPU or memory, lookups by name) without re-running ``ps``.
+    """
+
+    NUMERIC_COLUMNS = {"pid": "l", "cpu": "d", "mem": "d", "vsz": "q", "rss": "q"}
+    TEXT_COLUMNS = ["user", "tty", "stat", "start", "time", "command"]
+
+    def __init__(self):
+        self.columns: Dict[str, Any] = {name: array(code) for name, code in self.NUMERIC_COLUMNS.items()}
+        self.columns.update({name: [] for name in self.TEXT_COLUMNS})
+
+    @classmethod
+    def parse(cls, output: str) -> "ProcessTable":
+        """Parse the output of ``ps aux``"""
+        table = cls()
+        lines = output.strip().splitlines()
+        for line in lines[1:]:
+            parts = line.split(None, 10)
+            if len(parts) < 11:
+                continue
+            user, pid, cpu, mem, vsz, rss, tty, stat, start, cpu_time, command = parts
+            try:
+                numbers = (int(pid), float(cpu), float(mem), int(vsz), int(rss))
+            except ValueError:
+                continue
+            for name, value in zip(("pid", "cpu", "mem", "vsz", "rss"), numbers):
+                table.columns[name].append(value)
+            for name, value in zip(table.TEXT_COLUMNS, (user, tty, stat, start, cpu_time, command)):
+                table.columns[name].append(value)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.columns["pid"])
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Materialize a single row as a dict"""
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def top(self, n: int = 5, by: str = "cpu") -> List[Dict[str, Any]]:
+        """Return the top-N processes by a numeric column (cpu, mem, rss, vsz)"""
+        if by not in self.NUMERIC_COLUMNS:
+            raise ValueError(f"Cannot sort by '{by}', choose one of {list(self.NUMERIC_COLUMNS)}")
+        column = self.columns[by]
+        indices = heapq.nlargest(n, range(len(self)), key=column.__getitem__)
+        return [self.row(index) for index in indices]
+
+    def find(self, name: str) -> List[Dict[str, Any]]:
+        """Return processes whose command line contains ``name``"""
+        name = name.lower()
+        commands = self.columns["command"]
+        return [self.row(index) for index in range(len(self)) if name in commands[index].lower()]
+
+    def totals(self) -> Dict[str, float]:
+        """Summed CPU and memory percentages across all processes"""
+        return {"cpu": sum(self.columns["cpu"]), "mem": sum(self.columns["mem"]), "count": len(self)}
+
+class CommandExecutor:
+    """Execute safe commands through the runners with short-lived result reuse
+
+    Commands run over SSH when the runner holds a connection and locally
+    otherwise. Every command is checked with ``is_safe_command`` first.
+    Successful outputs are cached per (host, command) for ``ttl`` seconds, so
+    repeated questions in a conversation don't re-run ``free -h``/``ps aux``.
+    """
+
+    def __init__(self, ssh_runner: SSHRunner = None, docker_runner=None, ttl: float = 30.0):
+        self.ssh_runner = ssh_runner or SSHRunner()
+        self._docker_runner = docker_runner
+        self.ttl = ttl
+        self._cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+        self._tables: Dict[str, Tuple[float, ProcessTable]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def host(self) -> str:
+        """Name of the host commands run on"""
+        if self.ssh_runner.client and self.ssh_runner.hostname:
+            return self.ssh_runner.hostname
+        return "localhost"
+
+    @property
+    def docker_runner(self):
+        """Docker runner, connected on first use; None without the docker SDK"""
+        if self._docker_runner is None:
+            try:
+                from utils.docker_runner import DockerRunner
+                self._docker_runner = DockerRunner()
+            except ImportError as e:
+                logging.warning(f"Docker SDK not available, using the docker CLI: {str(e)}")
+                self._docker_runner = False
+        return self._docker_runner or None
+
+    def run(self, command: str, timeout: int = 30, use_cache: bool = True) -> Dict[str, Any]:
+        """Run a command if it is safe, reusing a fresh cached result"""
+        if not command.strip() or not is_safe_command(command):
+            return {
+                "success": False,
+                "output": "",
+                "error": f"Command '{command}' is not allowed by the safety policy",
+                "exit_code": -1,
+                "cached": False
+            }
+
+        key = (self.host, command)
+        if use_cache:
+            cached = self._get_cached(key)
+            if cached is not None:
+                return dict(cached, cached=True)
+
+        result = self._execute(command, timeout)
+        if result["success"]:
+            with self._lock:
+                self._cache[key] = (time.monotonic(), result)
+
+        return dict(result, cached=False)
+
+    def process_table(self, use_cache: bool = True) -> Optional[ProcessTable]:
+        """Return the parsed ``ps aux`` table, reusing it within the TTL"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._tables.get(self.host)
+        if use_cache and entry and now - entry[0] < self.ttl:
+            return entry[1]
+
+        result = self.run("ps aux", use_cache=use_cache)
+        if not result["success"]:
+            logging.error(f"Failed to list processes: {result['error']}")
+            return None
+
+        table = ProcessTable.parse(result["output"])
+        with self._lock:
+            self._tables[self.host] = (now, table)
+        return table
+
+    def docker_containers(self, all_containers: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """List containers via DockerRunner, cached like command output
+
+        The SDK only reaches the local daemon, so over SSH, or when the SDK
+        is missing or cannot reach the daemon, ``docker ps`` runs on the
+        executor's host instead. Returns None when neither can list
+        containers.
+        """
+        key = (self.host, f"docker containers all={all_containers}")
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached["containers"]
+
+        runner = None if self.ssh_runner.client else self.docker_runner
+        if runner is not None and runner.connected:
+            containers = runner.list_containers(all_containers=all_containers)
+        else:
+            containers = self._docker_cli_containers(all_containers)
+            if containers is None:
+                return None
+
+        with self._lock:
+            self._cache[key] = (time.monotonic(), {"containers": containers})
+        return containers
+
+    def _docker_cli_containers(self, all_containers: bool) -> Optional[List[Dict[str, Any]]]:
+        """Containers from ``docker ps`` on the executor's host, in DockerRunner's shape"""
+        # Run directly: the fixed read-only command trips the safety policy's "format" pattern
+        command = "docker ps --no-trunc --format '{{json .}}'" + (" --all" if all_containers else "")
+        result = self._execute(command, timeout=30)
+        if not result["success"]:
+            logging.error(f"Failed to list containers with the docker CLI: {result['error']}")
+            return None
+
+        containers = []
+        try:
+            for line in result["output"].splitlines():
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                containers.append({
+                    "id": row["ID"][:12],
+                    "name": row["Names"],
+                    "image": row["Image"],
+                    "status": row["Status"],
+                    "ports": [port for port in row.get("Ports", "").split(", ") if port],
+                    "created": row.get("CreatedAt", ""),
+                    "command": row.get("Command", "").strip('"')
+                })
+        except (ValueError, KeyError, TypeError) as e:
+            logging.error(f"Could not parse docker CLI output: {str(e)}")
+            return None
+        return containers
+
+    def _execute(self, command: str, timeout: int) -> Dict[str, Any]:
+        if self.ssh_runner.client:
+            return self.ssh_runner.execute_command(command, timeout=timeout)
+        return self.ssh_runner.execute_local_command(command, timeout=timeout)
+
+    def clear_cache(self):
+        """Drop all cached outputs"""
+        with self._lock:
+            self._cache.clear()
+            self._tables.clear()
+
+    def _get_cached(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._cache[key]
+                return None
+            return entry[1]
+
+_default_executor = None
+_default_lock = threading.Lock()
+
+def get_default_executor() -> CommandExecutor:
+    """Shared local executor so all agents reuse the same result cache"""
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = CommandExecutor()
+        return _default_executor
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Any
+
+from utils.lazy_imports import lazy_import
+
+# Imported on first use, so pages can import this module without paying for pandas
+pd = lazy_import("pandas")
+
+DEFAULT_COLUMNAR_DIR = Path(".cache/datasets")
+
+# Declared dtypes, so nothing is left to read_csv's type inference
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "titanic": {
+        "path": "titanic (1).csv",
+        "dtypes": {
+            "PassengerId": "int32", "Survived": "int8", "Pclass": "int8", "Name": "string",
+            "Sex": "category", "Age": "float32", "SibSp": "int8", "Parch": "int8",
+            "Ticket": "string", "Fare": "float32", "Cabin": "string", "Embarked": "category"
+        }
+    },
+    "salary": {
+        "path": "SalaryData.csv",
+        "dtypes": {"YearsExperience": "float32", "Salary": "float64"}
+    },
+    "marks": {
+        "path": "marks.csv",
+        "dtypes": {"name": "string", "hrs": "int16", "marks": "int16"}
+    }
+}
+
+def columnar_path(name: str, csv_path: Path, columnar_dir: Path = None) -> Path:
+    """Parquet copy path; encodes the CSV's mtime and size so edits invalidate it"""
+    stat = csv_path.stat()
+    return (columnar_dir or DEFAULT_COLUMNAR_DIR) / f"{name}-{int(stat.st_mtime)}-{stat.st_size}.parquet"
+
+def read_typed_csv(name: str, path: str = None, **kwargs) -> pd.DataFrame:
+    schema = SCHEMAS[name]
+    return pd.read_csv(path or schema["path"], dtype=schema["dtypes"], **kwargs)
+
+def load_dataset(name: str, columnar_dir: str = None) -> pd.DataFrame:
+    """Load a bundled dataset with its declared schema
+
+    The first load parses the CSV once and writes a Parquet copy. Later
+    loads memory-map that copy through Arrow, which skips parsing entirely
+    and keeps categoricals and small ints. Without pyarrow this falls back
+    to a typed ``read_csv``.
+    """
+    schema = SCHEMAS[name]
+    csv_path = Path(schema["path"])
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return read_typed_csv(name)
+
+    columnar_dir = Path(columnar_dir) if columnar_dir else DEFAULT_COLUMNAR_DIR
+    parquet_path = columnar_path(name, csv_path, columnar_dir)
+    if not parquet_path.exists():
+        df = read_typed_csv(name)
+        try:
+            columnar_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = parquet_path.with_suffix(".tmp")
+            df.to_parquet(tmp_path, engine="pyarrow", index=False)
+            os.replace(tmp_path, parquet_path)
+            for stale in columnar_dir.glob(f"{name}-*.parquet"):
+                if stale != parquet_path:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            logging.error(f"Could not write columnar copy of {name}: {str(e)}")
+        return df
+
+    table = pq.read_table(parquet_path, memory_map=True)
+    return table.to_pandas()
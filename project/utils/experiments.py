@@ -0,0 +1,177 @@
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_FOLD_CACHE = Path(".cache/experiments/folds.json")
+
+# Search spaces per model type; lists are enumerated by grid search and sampled by random search
+SEARCH_SPACES: Dict[str, Dict[str, List[Any]]] = {
+    "logistic_regression": {"C": [0.01, 0.1, 1.0, 10.0], "max_iter": [500]},
+    "random_forest": {"n_estimators": [100, 300], "max_depth": [None, 4, 8], "min_samples_leaf": [1, 3]},
+    "gradient_boosting": {"n_estimators": [100, 200], "learning_rate": [0.05, 0.1], "max_depth": [2, 3]}
+}
+
+def make_estimator(model_type: str, params: Dict[str, Any]):
+    """Unfitted sklearn estimator for a model type"""
+    if model_type == "logistic_regression":
+        from sklearn.linear_model import LogisticRegression
+        return LogisticRegression(**params)
+    if model_type == "random_forest":
+        from sklearn.ensemble import RandomForestClassifier
+        return RandomForestClassifier(n_jobs=1, random_state=0, **params)
+    if model_type == "gradient_boosting":
+        from sklearn.ensemble import GradientBoostingClassifier
+        return GradientBoostingClassifier(random_state=0, **params)
+    raise ValueError(f"Unknown model type: {model_type}")
+
+def grid_candidates(model_types: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Every parameter combination of each model type's search space"""
+    candidates = []
+    for model_type in model_types:
+        space = SEARCH_SPACES[model_type]
+        names = sorted(space)
+        for values in itertools.product(*(space[name] for name in names)):
+            candidates.append((model_type, dict(zip(names, values))))
+    return candidates
+
+def random_candidates(model_types: List[str], n_iter: int, seed: int = 0) -> List[Tuple[str, Dict[str, Any]]]:
+    """Up to ``n_iter`` distinct combinations per model type, sampled without replacement"""
+    rng = random.Random(seed)
+    candidates = []
+    for model_type in model_types:
+        grid = grid_candidates([model_type])
+        candidates.extend(rng.sample(grid, min(n_iter, len(grid))))
+    return candidates
+
+def fold_key(data_key: str, model_type: str, params: Dict[str, Any], k: int, seed: int, fold: int) -> str:
+    payload = json.dumps([data_key, model_type, params, k, seed, fold], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+class FoldCache:
+    """Fold scores keyed by hash of (data, model, params, fold), persisted as JSON"""
+
+    def __init__(self, path: str = None):
+        self.path = Path(path) if path else DEFAULT_FOLD_CACHE
+        self._scores: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        try:
+            self._scores = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    def get(self, key: str) -> Optional[float]:
+        return self._scores.get(key)
+
+    def put(self, key: str, score: float):
+        with self._lock:
+            self._scores[key] = score
+
+    def save(self):
+        with self._lock:
+            data = json.dumps(self._scores)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(data, encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+# Per-process training data, set once by the pool initializer instead of pickled per task
+_worker_state: Dict[str, Any] = {}
+
+def _init_worker(X, y, make_pipeline):
+    _worker_state.update(X=X, y=y, make_pipeline=make_pipeline)
+
+def _score_fold(model_type: str, params: Dict[str, Any], train_index, test_index) -> float:
+    from sklearn.metrics import accuracy_score
+
+    X, y = _worker_state["X"], _worker_state["y"]
+    pipeline = _worker_state["make_pipeline"](model_type, params)
+    pipeline.fit(X.iloc[train_index], y.iloc[train_index])
+    return float(accuracy_score(y.iloc[test_index], pipeline.predict(X.iloc[test_index])))
+
+class ExperimentRunner:
+    """k-fold cross-validation of many (model type, params) candidates in parallel
+
+    Every (candidate, fold) pair is an independent task on a process pool
+    sized to the CPU count; the training data is shipped to each worker once
+    through the pool initializer. Fold scores are cached by a hash of
+    (data, model, params, fold), so re-running a search only trains the
+    combinations it hasn't seen.
+    """
+
+    def __init__(self, X, y, data_key: str, make_pipeline: Callable[[str, Dict[str, Any]], Any],
+                 k: int = 5, seed: int = 42, cache: FoldCache = None, max_workers: int = None):
+        self.X = X
+        self.y = y
+        self.data_key = data_key
+        self.make_pipeline = make_pipeline
+        self.k = k
+        self.seed = seed
+        self.cache = cache or FoldCache()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    def folds(self) -> List[Tuple[Any, Any]]:
+        from sklearn.model_selection import StratifiedKFold
+
+        splitter = StratifiedKFold(n_splits=self.k, shuffle=True, random_state=self.seed)
+        return list(splitter.split(self.X, self.y))
+
+    def run(self, candidates: List[Tuple[str, Dict[str, Any]]],
+            progress: Callable[[int, int], None] = None) -> List[Dict[str, Any]]:
+        """Cross-validate candidates; returns the leaderboard, best first"""
+        started = time.perf_counter()
+        folds = self.folds()
+        scores: Dict[int, Dict[int, float]] = {index: {} for index in range(len(candidates))}
+        pending = []
+        for index, (model_type, params) in enumerate(candidates):
+            for fold, (train_index, test_index) in enumerate(folds):
+                key = fold_key(self.data_key, model_type, params, self.k, self.seed, fold)
+                cached = self.cache.get(key)
+                if cached is not None:
+                    scores[index][fold] = cached
+                else:
+                    pending.append((index, fold, key, model_type, params, train_index, test_index))
+
+        total, done = len(candidates) * len(folds), len(candidates) * len(folds) - len(pending)
+        if pending:
+            context = multiprocessing.get_context("spawn")  # fork is unsafe from a threaded server
+            workers = min(self.max_workers, len(pending))
+            with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                                     initargs=(self.X, self.y, self.make_pipeline)) as pool:
+                futures = {
+                    pool.submit(_score_fold, model_type, params, train_index, test_index): (index, fold, key)
+                    for index, fold, key, model_type, params, train_index, test_index in pending
+                }
+                for future in as_completed(futures):
+                    index, fold, key = futures[future]
+                    score = future.result()
+                    scores[index][fold] = score
+                    self.cache.put(key, score)
+                    done += 1
+                    if progress is not None:
+                        progress(done, total)
+            self.cache.save()
+
+        leaderboard = []
+        for index, (model_type, params) in enumerate(candidates):
+            fold_scores = [scores[index][fold] for fold in range(len(folds))]
+            leaderboard.append({
+                "model_type": model_type,
+                "params": params,
+                "mean_accuracy": statistics.fmean(fold_scores),
+                "std_accuracy": statistics.pstdev(fold_scores),
+                "folds": fold_scores
+            })
+        leaderboard.sort(key=lambda row: row["mean_accuracy"], reverse=True)
+        self.last_run = {"candidates": len(candidates), "fold_fits": len(pending),
+                         "cached_folds": total - len(pending), "seconds": time.perf_counter() - started}
+        return leaderboard
@@ -0,0 +1,159 @@
+import json
+import os
+from typing import Dict, Any, List, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Point GEMINI_API_BASE at a local mock server for offline testing
+DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
+DEFAULT_TIMEOUT = (5, 60)  # (connect, read) seconds
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+def create_session(pool_size: int = 10, retries: int = 2, backoff_factor: float = 0.5) -> requests.Session:
+    """HTTP session with a keep-alive connection pool
+
+    Connection errors and 429/5xx answers are retried up to ``retries``
+    times with exponential backoff (honouring Retry-After). Read timeouts
+    are not retried: a model that is slow to answer is left to the caller
+    (e.g. ModelRouter) to fail over.
+    """
+    session = requests.Session()
+    retry = Retry(total=retries, connect=retries, read=False, status=retries, backoff_factor=backoff_factor,
+                  status_forcelist=RETRY_STATUSES, allowed_methods=None, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def build_contents(messages: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """Convert chat messages to Gemini `contents`"""
+    contents = []
+    for m in messages:
+        role = "user" if m["role"] != "assistant" else "model"
+        contents.append({"role": role, "parts": [{"text": m["content"]}]})
+    return contents
+
+def extract_text(data: Dict[str, Any]) -> Optional[str]:
+    """Text of the first candidate, or None if the payload has none"""
+    try:
+        parts = data["candidates"][0]["content"]["parts"]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return "".join(part.get("text", "") for part in parts)
+
+class ChatMessage:
+    __slots__ = ("role", "content")
+
+    def __init__(self, content: str, role: str = "assistant"):
+        self.role = role
+        self.content = content
+
+class ChatChoice:
+    __slots__ = ("message", "finish_reason")
+
+    def __init__(self, message: ChatMessage, finish_reason: Optional[str] = None):
+        self.message = message
+        self.finish_reason = finish_reason
+
+class ChatResponse:
+    """OpenAI-style response; ``raw`` keeps the decoded payload for debugging"""
+
+    __slots__ = ("choices", "model", "usage", "raw")
+
+    def __init__(self, choices: List[ChatChoice], model: str, usage: Dict[str, Any], raw: Dict[str, Any]):
+        self.choices = choices
+        self.model = model
+        self.usage = usage
+        self.raw = raw
+
+    @classmethod
+    def from_payload(cls, data: Dict[str, Any], model: str) -> "ChatResponse":
+        text = extract_text(data)
+        if text is None:
+            text = data.get("promptFeedback", {}).get("blockReason", "⚠️ No valid response.")
+        candidates = data.get("candidates") or [{}]
+        choice = ChatChoice(ChatMessage(text), candidates[0].get("finishReason"))
+        return cls([choice], model, data.get("usageMetadata", {}), data)
+
+class GeminiClient:
+    """Minimal Gemini REST client with an OpenAI-style chat interface
+
+    The client holds one pooled ``requests.Session`` so TLS connections are
+    reused across questions; cache the client itself (e.g. with
+    ``st.cache_resource``) to keep the pool warm across Streamlit reruns.
+    """
+
+    def __init__(self, api_key: str, base_url: str = None, session: requests.Session = None,
+                 timeout=DEFAULT_TIMEOUT):
+        self.api_key = api_key
+        self.url = (base_url or os.getenv("GEMINI_API_BASE") or DEFAULT_BASE_URL).rstrip("/")
+        self.session = session or create_session()
+        self.timeout = timeout
+        self.chat = self.Chat(self)
+
+    class Chat:
+        def __init__(self, parent):
+            self.parent = parent
+            self.completions = self.Completions(parent)
+
+        class Completions:
+            def __init__(self, parent):
+                self.parent = parent
+
+            def create(self, model, messages, stream: bool = False,
+                       temperature: float = 0.7, max_output_tokens: int = 500):
+                """Generate a reply; with stream=True return an iterator of text chunks
+
+                HTTP errors are raised before the first chunk is yielded so
+                callers can fall back to another model.
+                """
+                payload = {
+                    "contents": build_contents(messages),
+                    "generationConfig": {"temperature": temperature, "maxOutputTokens": max_output_tokens}
+                }
+                if stream:
+                    return self.parent.stream_generate(model, payload)
+
+                r = self.parent.session.post(
+                    f"{self.parent.url}/models/{model}:generateContent",
+                    params={"key": self.parent.api_key},
+                    json=payload,
+                    timeout=self.parent.timeout
+                )
+
+                r.raise_for_status()
+                return ChatResponse.from_payload(r.json(), model)
+
+    def stream_generate(self, model: str, payload: Dict[str, Any]) -> Iterator[str]:
+        """Call streamGenerateContent (SSE) and return an iterator of text chunks"""
+        r = self.session.post(
+            f"{self.url}/models/{model}:streamGenerateContent",
+            params={"key": self.api_key, "alt": "sse"},
+            json=payload,
+            timeout=self.timeout,
+            stream=True
+        )
+        try:
+            r.raise_for_status()
+        except requests.exceptions.HTTPError:
+            r.close()
+            raise
+        return self._iter_sse_text(r)
+
+    def _iter_sse_text(self, response: requests.Response) -> Iterator[str]:
+        with response:
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                chunk = line[len("data:"):].strip()
+                if not chunk or chunk == "[DONE]":
+                    continue
+                text = extract_text(json.loads(chunk))
+                if text:
+                    yield text
+
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
@@ -0,0 +1,118 @@
+import ast
+import importlib
+import subprocess
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+from typing import Dict, List
+
+# Wall time (ms) spent importing each lazily-imported module, filled on first use
+IMPORT_TIMES: Dict[str, float] = {}
+_lock = threading.Lock()
+
+class LazyModule(types.ModuleType):
+    """Module placeholder that imports the real module on first attribute access"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_target"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_lazy_target"]
+                if module is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self.__name__)
+                    IMPORT_TIMES[self.__name__] = (time.perf_counter() - started) * 1000
+                    self.__dict__["_lazy_target"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_target"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+def lazy_import(name: str) -> types.ModuleType:
+    """The module if it is already imported, otherwise a placeholder that imports on first use
+
+    Use for heavy dependencies that only some code paths need, so a page
+    pays their import cost only when it actually reaches that code.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+def is_loaded(module: types.ModuleType) -> bool:
+    return not isinstance(module, LazyModule) or module.__dict__["_lazy_target"] is not None
+
+def page_import_statements(path: str) -> List[str]:
+    """Module-level import statements of a script, as source lines"""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+def parse_importtime(stderr: str) -> List[Dict[str, float]]:
+    """Rows of ``python -X importtime`` output as {module, self_ms, cumulative_ms}"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append({
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000
+            })
+        except ValueError:
+            continue
+    return rows
+
+def profile_imports(statements: List[str], cwd: str = None, timeout: float = 120.0) -> List[Dict[str, float]]:
+    """Per-module import cost of running ``statements`` in a fresh interpreter"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "\n".join(statements) or "pass"],
+        cwd=cwd, capture_output=True, text=True, timeout=timeout
+    )
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()
+        raise RuntimeError(error[-1] if error else f"exit code {completed.returncode}")
+    return parse_importtime(completed.stderr)
+
+def top_level_costs(rows: List[Dict[str, float]], top: int = 15) -> List[Dict[str, float]]:
+    """Heaviest top-level packages by cumulative time"""
+    totals: Dict[str, float] = {}
+    for row in rows:
+        name = row["module"]
+        if "." not in name:
+            totals[name] = max(totals.get(name, 0.0), row["cumulative_ms"])
+    ordered = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+    return [{"module": name, "cumulative_ms": round(ms, 2)} for name, ms in ordered]
+
+def main(argv: List[str] = None):
+    """Print the import-time report for a page script"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Per-module import cost of a page's top-level imports")
+    parser.add_argument("page", help="Page script, e.g. pages/streamlit_titanic_model.py")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    rows = profile_imports(page_import_statements(args.page))
+    print(f"{'module':40} {'cumulative ms':>14}")
+    for row in top_level_costs(rows, args.top):
+        print(f"{row['module']:40} {row['cumulative_ms']:>14.2f}")
+    total = sum(row["self_ms"] for row in rows)
+    print(f"{'total':40} {total:>14.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import atexit
+import hashlib
+import logging
+import os
+import threading
+from typing import Any, Dict, Tuple
+
+from utils.gemini_client import GeminiClient, create_session
+
+# Pool settings can be tuned per deployment without code changes
+DEFAULT_POOL_SIZE = int(os.getenv("LLM_POOL_SIZE", "10"))
+DEFAULT_KEEPALIVE = float(os.getenv("LLM_KEEPALIVE_SECONDS", "120"))
+
+OPENAI_COMPAT_GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/openai/"
+
+_clients: Dict[Tuple[str, str, str], Any] = {}
+_lock = threading.Lock()
+
+def client_key(provider: str, base_url: str, api_key: str) -> Tuple[str, str, str]:
+    """Registry key; the API key is hashed so it never sits in the key itself"""
+    key_hash = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+    return provider, base_url or "", key_hash
+
+def _build_gemini(api_key: str, base_url: str, pool_size: int, keepalive: float) -> GeminiClient:
+    # requests keeps pooled connections open until the server closes them
+    return GeminiClient(api_key=api_key, base_url=base_url, session=create_session(pool_size))
+
+def _build_openai(api_key: str, base_url: str, pool_size: int, keepalive: float):
+    import httpx
+    from openai import OpenAI
+
+    http_client = httpx.Client(limits=httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+        keepalive_expiry=keepalive
+    ))
+    return OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+BUILDERS = {
+    "gemini": _build_gemini,
+    "openai": _build_openai
+}
+
+def get_client(provider: str, api_key: str, base_url: str = None, pool_size: int = None,
+               keepalive: float = None):
+    """Shared LLM client for (provider, base_url, api key)
+
+    Clients live for the whole process, so every page and every rerun
+    reuses the same warm connection pool instead of opening new TLS
+    connections. Pool settings apply when a client is first built.
+    """
+    if provider not in BUILDERS:
+        raise ValueError(f"Unknown LLM provider: {provider}")
+    key = client_key(provider, base_url, api_key)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = BUILDERS[provider](
+                api_key,
+                base_url,
+                pool_size or DEFAULT_POOL_SIZE,
+                keepalive if keepalive is not None else DEFAULT_KEEPALIVE
+            )
+            _clients[key] = client
+    return client
+
+def close_all():
+    """Close every shared client and release its connections"""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logging.error(f"Failed to close LLM client: {str(e)}")
+
+atexit.register(close_all)
@@ -0,0 +1,123 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+DEFAULT_CATALOG_PATH = Path(".cache/medicine_catalog.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    status INTEGER,
+    crawled_at REAL,
+    outlinks TEXT
+);
+CREATE TABLE IF NOT EXISTS medicines (
+    url TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    salts TEXT,
+    manufacturer TEXT,
+    price TEXT,
+    available INTEGER,
+    updated_at REAL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS medicines_fts USING fts5(url UNINDEXED, name, salts, manufacturer);
+"""
+
+def fts_query(text: str) -> str:
+    """Turn free text into a safe FTS5 prefix query (OR of words)"""
+    words = re.findall(r"\w+", text.lower())
+    return " OR ".join(f'"{word}"*' for word in words if len(word) > 1)
+
+class CatalogStore:
+    """SQLite medicine catalog with an FTS5 index
+
+    Holds crawl state per URL (validators for incremental recrawl) and one
+    row per medicine page. Queries go through the FTS index, so lookups stay
+    in the microsecond-to-millisecond range however large the catalog grows.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = Path(path) if path else DEFAULT_CATALOG_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(pages)")}
+        if "outlinks" not in columns:  # catalogs created before outlinks were stored
+            self._conn.execute("ALTER TABLE pages ADD COLUMN outlinks TEXT")
+        self._lock = threading.Lock()
+
+    def page_state(self, url: str) -> Optional[Dict[str, Any]]:
+        """Stored validators, crawl time and outlinks for a URL"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM pages WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        state = dict(row)
+        state["outlinks"] = json.loads(state["outlinks"]) if state["outlinks"] else []
+        return state
+
+    def record_page(self, url: str, status: int, etag: str = None, last_modified: str = None,
+                    content_hash: str = None, outlinks: List[str] = None):
+        """Store crawl state; fields passed as None keep their previous value"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO pages (url, etag, last_modified, content_hash, status, crawled_at, outlinks) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET etag = COALESCE(excluded.etag, etag), "
+                "last_modified = COALESCE(excluded.last_modified, last_modified), "
+                "content_hash = COALESCE(excluded.content_hash, content_hash), "
+                "status = excluded.status, crawled_at = excluded.crawled_at, "
+                "outlinks = COALESCE(excluded.outlinks, outlinks)",
+                (url, etag, last_modified, content_hash, status, time.time(),
+                 json.dumps(outlinks) if outlinks is not None else None)
+            )
+
+    def upsert_medicine(self, url: str, name: str, salts: str = "", manufacturer: str = "",
+                        price: str = "", available: bool = True):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO medicines (url, name, salts, manufacturer, price, available, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, name, salts, manufacturer, price, int(available), time.time())
+            )
+            self._conn.execute("DELETE FROM medicines_fts WHERE url = ?", (url,))
+            self._conn.execute(
+                "INSERT INTO medicines_fts (url, name, salts, manufacturer) VALUES (?, ?, ?, ?)",
+                (url, name, salts, manufacturer)
+            )
+
+    def search(self, text: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """Best FTS matches for free text, ranked by bm25"""
+        query = fts_query(text)
+        if not query:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT m.* FROM medicines_fts f JOIN medicines m ON m.url = f.url "
+                "WHERE medicines_fts MATCH ? ORDER BY bm25(medicines_fts, 0.0, 10.0, 3.0, 1.0) LIMIT ?",
+                (query, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def all_medicines(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM medicines").fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM medicines").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,274 @@
+import asyncio
+import hashlib
+import logging
+import math
+import re
+import time
+from typing import Dict, Any, List, Optional
+from urllib.parse import urljoin, urldefrag, urlparse
+from urllib.robotparser import RobotFileParser
+
+import httpx
+from bs4 import BeautifulSoup
+
+from utils.medicine_catalog import CatalogStore
+
+USER_AGENT = "CommandHubCatalogBot/1.0"
+
+# 1mg product pages live under these paths
+DEFAULT_PRODUCT_PATTERN = r"/(drugs|otc)/[^/?#]+"
+
+class BloomFilter:
+    """Fixed-size Bloom filter for the URL seen-set"""
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+class HostPolicy:
+    """Per-host concurrency limit, robots.txt rules and request spacing"""
+
+    def __init__(self, max_concurrency: int, min_interval: float):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.min_interval = min_interval
+        self.robots: Optional[RobotFileParser] = None
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait_turn(self):
+        """Sleep until this host's next request slot"""
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+def parse_medicine(url: str, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+    """Extract name, salts and availability from a product page"""
+    heading = soup.find("h1")
+    if heading is None:
+        return None
+    name = " ".join(heading.get_text(" ").split())
+    if not name:
+        return None
+
+    text = " ".join(soup.get_text(" ").split())
+    salts = ""
+    match = re.search(r"(?:salt composition|composition|contains)\s*:?\s*(.{3,200}?)(?:\s{2}|\.|manufacturer|$)", text, re.I)
+    if match:
+        salts = match.group(1).strip()
+    manufacturer = ""
+    match = re.search(r"(?:manufacturer|marketer)\s*:?\s*([A-Z][\w&.,' -]{2,80}?)(?:\s{2}|\.|salt|$)", text, re.I)
+    if match:
+        manufacturer = match.group(1).strip()
+    price = ""
+    match = re.search(r"(?:₹|MRP\s*)\s*([\d,]+(?:\.\d+)?)", text)
+    if match:
+        price = match.group(1)
+    available = not re.search(r"out of stock|not available|discontinued", text, re.I)
+
+    return {"url": url, "name": name, "salts": salts, "manufacturer": manufacturer,
+            "price": price, "available": available}
+
+class MedicineCrawler:
+    """Polite async crawler that builds the local medicine catalog
+
+    Fetches run concurrently, capped per host, spaced by ``min_interval``
+    (or the robots.txt Crawl-delay) and filtered through robots.txt. URLs
+    are de-duplicated through a Bloom filter, so memory stays flat on large
+    crawls (a false positive only skips a page). Pages crawled within
+    ``recrawl_after`` seconds are skipped, older ones are revalidated with
+    their stored ETag / Last-Modified, and unchanged bodies are not
+    re-parsed. Each page's outlinks are stored with its crawl state, so a
+    skipped, 304 or unchanged page still leads the crawl on to new and
+    changed pages behind it.
+    """
+
+    def __init__(self, store: CatalogStore, max_pages: int = 200, concurrency: int = 8,
+                 per_host_concurrency: int = 2, min_interval: float = 1.0, recrawl_after: float = 7 * 86400,
+                 product_pattern: str = DEFAULT_PRODUCT_PATTERN, timeout: float = 20.0):
+        self.store = store
+        self.max_pages = max_pages
+        self.concurrency = concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.min_interval = min_interval
+        self.recrawl_after = recrawl_after
+        self.product_re = re.compile(product_pattern)
+        self.timeout = timeout
+        self.seen = BloomFilter(capacity=max(10_000, max_pages * 50))
+        self._enqueued = 0
+        self._hosts: Dict[str, "asyncio.Future[HostPolicy]"] = {}
+        self.stats = {"fetched": 0, "not_modified": 0, "skipped_fresh": 0, "blocked": 0,
+                      "errors": 0, "medicines": 0}
+
+    async def crawl(self, seeds: List[str]) -> Dict[str, int]:
+        """Crawl from the seed URLs, staying on the seeds' hosts"""
+        self.allowed_hosts = {urlparse(seed).netloc for seed in seeds}
+        queue: asyncio.Queue = asyncio.Queue()
+        for seed in seeds:
+            self._enqueue(queue, seed)
+
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        async with httpx.AsyncClient(headers={"User-Agent": USER_AGENT}, timeout=self.timeout,
+                                     limits=limits, follow_redirects=True) as client:
+            self.client = client
+            workers = [asyncio.create_task(self._worker(queue)) for _ in range(self.concurrency)]
+            await queue.join()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return self.stats
+
+    def _enqueue(self, queue: asyncio.Queue, url: str):
+        url = urldefrag(url)[0]
+        if self._enqueued >= self.max_pages or url in self.seen:
+            return
+        self.seen.add(url)
+        self._enqueued += 1
+        queue.put_nowait(url)
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            url = await queue.get()
+            try:
+                for link in await self._process(url):
+                    self._enqueue(queue, link)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logging.error(f"Crawl failed for {url}: {str(e)}")
+            finally:
+                queue.task_done()
+
+    async def _process(self, url: str) -> List[str]:
+        state = self.store.page_state(url)
+        if state and state["status"] == 200 and time.time() - state["crawled_at"] < self.recrawl_after:
+            self.stats["skipped_fresh"] += 1
+            return self._known_links(state)
+
+        host = await self._host_policy(url)
+        if host.robots is not None and not host.robots.can_fetch(USER_AGENT, url):
+            self.stats["blocked"] += 1
+            return []
+
+        headers = {}
+        if state:
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
+
+        async with host.semaphore:
+            await host.wait_turn()
+            response = await self.client.get(url, headers=headers)
+
+        if response.status_code == 304:
+            self.stats["not_modified"] += 1
+            self.store.record_page(url, 200)
+            return self._known_links(state)
+        if response.status_code != 200 or "html" not in response.headers.get("content-type", ""):
+            self.store.record_page(url, response.status_code)
+            return []
+
+        self.stats["fetched"] += 1
+        html = response.text
+        content_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        if state and state.get("content_hash") == content_hash:
+            self.store.record_page(url, 200, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+            return self._known_links(state)
+
+        soup = BeautifulSoup(html, "html.parser")
+        if self.product_re.search(urlparse(url).path):
+            record = parse_medicine(url, soup)
+            if record:
+                self.store.upsert_medicine(**record)
+                self.stats["medicines"] += 1
+
+        links = []
+        for anchor in soup.find_all("a", href=True):
+            link = urldefrag(urljoin(url, anchor["href"]))[0]
+            parsed = urlparse(link)
+            if parsed.scheme in ("http", "https") and parsed.netloc in self.allowed_hosts:
+                links.append(link)
+        links = list(dict.fromkeys(links))
+        self.store.record_page(url, 200, response.headers.get("ETag"),
+                               response.headers.get("Last-Modified"), content_hash, links)
+        return links
+
+    def _known_links(self, state: Optional[Dict[str, Any]]) -> List[str]:
+        """Outlinks stored on the last full crawl of a page; none for a page never crawled"""
+        if state is None:
+            return []
+        return [link for link in state.get("outlinks") or [] if urlparse(link).netloc in self.allowed_hosts]
+
+    async def _host_policy(self, url: str) -> HostPolicy:
+        """Policy for the URL's host, once its robots.txt has been read
+
+        Every worker hitting a new host awaits the same future, so none of
+        them fetches a page before the robots rules are known.
+        """
+        parsed = urlparse(url)
+        future = self._hosts.get(parsed.netloc)
+        if future is None:
+            future = asyncio.ensure_future(self._load_host_policy(parsed.scheme, parsed.netloc))
+            self._hosts[parsed.netloc] = future
+        return await future
+
+    async def _load_host_policy(self, scheme: str, netloc: str) -> HostPolicy:
+        host = HostPolicy(self.per_host_concurrency, self.min_interval)
+        try:
+            response = await self.client.get(f"{scheme}://{netloc}/robots.txt")
+            if response.status_code in (401, 403):
+                # Same rule as RobotFileParser.read(): a protected robots.txt disallows everything
+                robots = RobotFileParser()
+                robots.disallow_all = True
+                host.robots = robots
+            elif response.status_code == 200:
+                robots = RobotFileParser()
+                robots.parse(response.text.splitlines())
+                host.robots = robots
+                delay = robots.crawl_delay(USER_AGENT)
+                if delay:
+                    host.min_interval = max(host.min_interval, float(delay))
+        except httpx.HTTPError as e:
+            logging.warning(f"Could not read robots.txt for {netloc}: {str(e)}")
+        return host
+
+def main(argv: List[str] = None):
+    """Command line entry point: crawl and report catalog size"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the local medicine catalog")
+    parser.add_argument("--seed", action="append", default=[], help="Seed URL (repeatable)")
+    parser.add_argument("--db", default=None, help="SQLite catalog path")
+    parser.add_argument("--max-pages", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--per-host", type=int, default=2)
+    parser.add_argument("--interval", type=float, default=1.0, help="Minimum seconds between requests per host")
+    args = parser.parse_args(argv)
+
+    store = CatalogStore(args.db)
+    crawler = MedicineCrawler(store, max_pages=args.max_pages, concurrency=args.concurrency,
+                              per_host_concurrency=args.per_host, min_interval=args.interval)
+    started = time.perf_counter()
+    stats = asyncio.run(crawler.crawl(args.seed or ["https://www.1mg.com"]))
+    print(f"Crawl finished in {time.perf_counter() - started:.1f}s: {stats}")
+    print(f"Catalog now holds {store.count()} medicines")
+    store.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+import re
+import threading
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from utils.text_index import tokenize
+
+# Words that describe the question rather than name a medicine. Usage and
+# side-effect words ("used", "use", "side", "effects") are deliberately absent:
+# they are leftover question words the catalog can't answer, so the LLM does
+INTENT_WORDS = {
+    "salt", "salts", "composition", "ingredient", "ingredients", "contain", "contains", "inside",
+    "available", "availability", "stock", "buy", "sold", "price", "cost", "mrp", "info", "information",
+    "medicine", "drug", "tablet", "tablets", "capsule", "capsules", "syrup", "there", "has", "have",
+    "does", "please", "know", "give", "details", "made"
+}
+SALT_WORDS = {"salt", "salts", "composition", "ingredient", "ingredients", "contain", "contains", "inside", "made"}
+AVAILABILITY_WORDS = {"available", "availability", "stock", "buy", "sold"}
+PRICE_WORDS = {"price", "cost", "mrp"}
+
+PRODUCT_PATH_RE = re.compile(r"/(drugs|otc)/[^/?#]+")
+
+def normalize_name(text: str) -> str:
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+def trigrams(text: str) -> Counter:
+    """Character trigrams of a normalized string, padded at word edges"""
+    padded = f"  {text} "
+    return Counter(padded[i:i + 3] for i in range(len(padded) - 2))
+
+def detect_intent(question: str) -> str:
+    words = set(re.findall(r"[a-z]+", question.lower()))
+    if words & SALT_WORDS:
+        return "salts"
+    if words & PRICE_WORDS:
+        return "price"
+    if words & AVAILABILITY_WORDS:
+        return "availability"
+    return "summary"
+
+def query_phrases(question: str, max_words: int = 4) -> List[str]:
+    """Candidate medicine names in a question: word windows left after dropping intent words"""
+    words = [word for word in tokenize(question) if word not in INTENT_WORDS]
+    phrases = []
+    for size in range(min(max_words, len(words)), 0, -1):
+        for start in range(len(words) - size + 1):
+            phrases.append(" ".join(words[start:start + size]))
+    return phrases
+
+def records_from_soup(soup, base_url: str) -> List[Dict[str, Any]]:
+    """Medicine names linked from a scraped page (product links only)"""
+    records = {}
+    for anchor in soup.find_all("a", href=True):
+        url = urljoin(base_url, anchor["href"])
+        if not PRODUCT_PATH_RE.search(urlparse(url).path):
+            continue
+        name = " ".join(anchor.get_text(" ").split())
+        if name and url not in records:
+            records[url] = {"url": url, "name": name, "salts": "", "manufacturer": "", "price": "", "available": None}
+    return list(records.values())
+
+class MedicineLookup:
+    """Name → record table with exact and trigram fuzzy lookup
+
+    Every record is indexed under its full name, and under its brand (first
+    word) when that brand belongs to only one record, so "Dolo" finds "Dolo
+    650 Tablet". A brand shared by several products ("Crocin" for Crocin
+    Advance and Crocin Cold & Flu) is ambiguous: it matches nothing on its
+    own, so the question falls through to the LLM. Exact hits are dictionary
+    lookups; fuzzy hits score candidates that share trigrams with the query
+    via an inverted index, so only a handful of names are ever compared.
+    """
+
+    def __init__(self, min_score: float = 0.75):
+        self.min_score = min_score
+        self.version = None
+        self._records: List[Dict[str, Any]] = []
+        self._exact: Dict[str, List[int]] = {}
+        self._keys: List[Tuple[str, int, Counter]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._ambiguous: set = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def build(self, version: str, records: List[Dict[str, Any]]):
+        """Replace the table; a no-op when ``version`` is unchanged"""
+        with self._lock:
+            if version is not None and version == self.version:
+                return
+            # Richer rows (e.g. crawled catalog rows) win over bare scraped links
+            merged: Dict[str, Dict[str, Any]] = {}
+            for record in records:
+                name = normalize_name(record["name"])
+                current = merged.get(name)
+                if current is None or (record.get("salts") and not current.get("salts")):
+                    merged[name] = record
+            self._records = list(merged.values())
+            names = [normalize_name(record["name"]) for record in self._records]
+            brands = Counter(name.split(" ")[0] for name in names)
+            full_names = set(names)
+            self._ambiguous = {brand for brand, count in brands.items() if count > 1}
+            self._exact, self._keys, self._postings = {}, [], {}
+            for record_id, name in enumerate(names):
+                brand = name.split(" ")[0]
+                keys = {name}
+                if brand not in self._ambiguous and (brand == name or brand not in full_names):
+                    keys.add(brand)
+                for key in keys:
+                    self._exact.setdefault(key, []).append(record_id)
+                    key_id = len(self._keys)
+                    grams = trigrams(key)
+                    self._keys.append((key, record_id, grams))
+                    for gram in grams:
+                        self._postings.setdefault(gram, []).append(key_id)
+            self.version = version
+
+    def match(self, phrase: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Best (score, record) for a name, or None below ``min_score``"""
+        phrase = normalize_name(phrase)
+        if not phrase:
+            return None
+        exact = self._exact.get(phrase)
+        if exact:
+            return 1.0, self._records[exact[0]]
+        if phrase in self._ambiguous:
+            return None
+
+        query = trigrams(phrase)
+        query_size = sum(query.values())
+        overlaps: Counter = Counter()
+        for gram, count in query.items():
+            for key_id in self._postings.get(gram, ()):
+                overlaps[key_id] += min(count, self._keys[key_id][2][gram])
+        best_score, best_record = 0.0, None
+        for key_id, overlap in overlaps.most_common(50):
+            key_size = sum(self._keys[key_id][2].values())
+            score = 2 * overlap / (query_size + key_size)  # Dice coefficient
+            if score > best_score:
+                best_score, best_record = score, self._records[self._keys[key_id][1]]
+        if best_record is None or best_score < self.min_score:
+            return None
+        return best_score, best_record
+
+    def lookup(self, question: str) -> Optional[Dict[str, Any]]:
+        """Confident structured answer for a question, or None to fall back to the LLM"""
+        intent = detect_intent(question)
+        best, best_phrase = None, ""
+        for phrase in query_phrases(question):
+            found = self.match(phrase)
+            if found and (best is None or found[0] > best[0]):
+                best, best_phrase = found, phrase
+                if found[0] == 1.0:
+                    break
+        if best is None:
+            return None
+        score, record = best
+        # Leftover words ("side effects", "dosage") ask for something the table can't answer
+        leftover = set(query_phrases(question, max_words=1)) - set(best_phrase.split())
+        if leftover - set(normalize_name(record["name"]).split()):
+            return None
+        answer = format_answer(record, intent)
+        if answer is None:
+            return None
+        return {"answer": answer, "record": record, "score": score, "intent": intent}
+
+def format_answer(record: Dict[str, Any], intent: str) -> Optional[str]:
+    """Answer text from a record, or None when the record lacks the asked-for field"""
+    name = record["name"]
+    available = record.get("available")
+    availability = None if available is None else ("available" if available else "not available")
+    if intent == "salts":
+        if not record.get("salts"):
+            return None
+        return f"**{name}** contains {record['salts']}."
+    if intent == "price":
+        if not record.get("price"):
+            return None
+        return f"**{name}** is listed at MRP ₹{record['price']}."
+    if intent == "availability":
+        if availability is None:
+            return None
+        return f"**{name}** is currently {availability} on 1mg."
+
+    if not record.get("salts"):
+        return None
+    lines = [f"**{name}**", f"- Salt composition: {record['salts']}"]
+    if record.get("manufacturer"):
+        lines.append(f"- Manufacturer: {record['manufacturer']}")
+    if record.get("price"):
+        lines.append(f"- MRP: ₹{record['price']}")
+    if availability:
+        lines.append(f"- Availability: {availability}")
+    return "\n".join(lines)
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from utils.lazy_imports import lazy_import
+
+# Imported on first load or save; joblib pulls in numpy
+joblib = lazy_import("joblib")
+
+DEFAULT_MODEL_DIR = Path(".cache/models")
+
+def fingerprint(df, params: Dict[str, Any]) -> str:
+    """Stable hash of a DataFrame's contents plus the training hyperparameters"""
+    import pandas as pd
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(column) for column in df.columns]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+class ModelCache:
+    """Trained model artifacts keyed by a fingerprint of (data, hyperparameters)
+
+    Lookups go memory → disk → train. Training for a key runs at most once
+    even when several sessions ask for it concurrently, and the result is
+    written to ``cache_dir`` so a restart loads the artifact instead of
+    retraining.
+    """
+
+    def __init__(self, cache_dir: str = None, max_memory: int = 8):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_MODEL_DIR
+        self.max_memory = max_memory
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.joblib"
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        try:
+            artifact = joblib.load(self.path(key))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.error(f"Failed to load cached model {key}: {str(e)}")
+            return None
+        self._remember(key, artifact)
+        return artifact
+
+    def put(self, key: str, artifact: Any, remember: bool = True):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        joblib.dump(artifact, tmp_path)
+        os.replace(tmp_path, path)
+        if remember:
+            self._remember(key, artifact)
+
+    def get_or_train(self, key: str, train: Callable[[], Any]) -> Any:
+        """Cached artifact for ``key``, calling ``train()`` only on a miss"""
+        artifact = self.get(key)
+        if artifact is not None:
+            return artifact
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            artifact = self.get(key)
+            if artifact is None:
+                artifact = train()
+                self.put(key, artifact)
+        return artifact
+
+    def ensure(self, key: str, train: Callable[[], Any]) -> Path:
+        """Path of the persisted artifact for ``key``, training it on a miss
+
+        For callers that load artifacts through a ``ModelRegistry``; the
+        artifact is written to disk but not kept in this cache's memory.
+        """
+        path = self.path(key)
+        if path.exists():
+            return path
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if not path.exists():
+                self.put(key, train(), remember=False)
+        return path
+
+    def _remember(self, key: str, artifact: Any):
+        with self._lock:
+            self._memory[key] = artifact
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory:
+                self._memory.popitem(last=False)
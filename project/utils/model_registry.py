@@ -0,0 +1,130 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.lazy_imports import lazy_import
+
+# Imported on first load or save; joblib pulls in numpy
+joblib = lazy_import("joblib")
+
+# Models shipped with the app, relative to the project directory
+BUILTIN_MODELS = {
+    "salary": "my_salary_model.pkl"
+}
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ModelEntry:
+    """A loaded model artifact and the file state it was loaded from"""
+
+    __slots__ = ("name", "path", "model", "mtime", "size", "digest", "loaded_at", "checked_at")
+
+    def __init__(self, name: str, path: Path):
+        self.name = name
+        self.path = path
+        self.model = None
+        self.mtime = None
+        self.size = None
+        self.digest = None
+        self.loaded_at = 0.0
+        self.checked_at = 0.0
+
+    @property
+    def version(self) -> Optional[str]:
+        """Short content hash; changes only when the artifact's bytes change"""
+        return self.digest[:12] if self.digest else None
+
+class ModelRegistry:
+    """Loads each model artifact once per process and hot-reloads it on change
+
+    ``get()`` serves the in-memory model. At most once per
+    ``check_interval`` seconds it stats the file; only when mtime or size
+    moved is the file hashed, and only when the hash differs is it
+    reloaded, so a touched-but-identical file costs no reload. Arrays are
+    memory-mapped (``mmap_mode``) where joblib stored them uncompressed, so
+    large models are paged in on demand and shared between processes.
+    """
+
+    def __init__(self, check_interval: float = 5.0, mmap_mode: Optional[str] = "r"):
+        self.check_interval = check_interval
+        self.mmap_mode = mmap_mode
+        self._entries: Dict[str, ModelEntry] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, path: str):
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or entry.path != Path(path):
+                self._entries[name] = ModelEntry(name, Path(path))
+
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def get(self, name: str) -> Any:
+        """The current model for ``name``, loading or reloading only when needed"""
+        entry = self._entry(name)
+        now = time.monotonic()
+        if entry.model is not None and now - entry.checked_at < self.check_interval:
+            return entry.model
+        with self._lock:
+            if entry.model is None or now - entry.checked_at >= self.check_interval:
+                self._refresh(entry)
+                entry.checked_at = time.monotonic()
+        return entry.model
+
+    def version(self, name: str) -> Optional[str]:
+        self.get(name)
+        return self._entry(name).version
+
+    def info(self) -> List[Dict[str, Any]]:
+        return [
+            {"name": entry.name, "path": str(entry.path), "version": entry.version,
+             "loaded": entry.model is not None, "loaded_at": entry.loaded_at}
+            for entry in self._entries.values()
+        ]
+
+    def _entry(self, name: str) -> ModelEntry:
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"Unknown model: {name}")
+        return entry
+
+    def _refresh(self, entry: ModelEntry):
+        try:
+            stat = os.stat(entry.path)
+        except OSError as e:
+            if entry.model is None:
+                raise
+            logging.error(f"Model file for {entry.name} unavailable, keeping loaded version: {str(e)}")
+            return
+        if entry.model is not None and (stat.st_mtime, stat.st_size) == (entry.mtime, entry.size):
+            return
+
+        digest = file_digest(entry.path)
+        if entry.model is None or digest != entry.digest:
+            entry.model = joblib.load(entry.path, mmap_mode=self.mmap_mode)
+            entry.digest = digest
+            entry.loaded_at = time.time()
+        entry.mtime, entry.size = stat.st_mtime, stat.st_size
+
+_default_registry = None
+_default_lock = threading.Lock()
+
+def get_default_registry() -> ModelRegistry:
+    """Process-wide registry with the built-in models registered"""
+    global _default_registry
+    with _default_lock:
+        if _default_registry is None:
+            _default_registry = ModelRegistry()
+            for name, path in BUILTIN_MODELS.items():
+                _default_registry.register(name, path)
+        return _default_registry
@@ -0,0 +1,306 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, Iterator, List, Callable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+class ModelUnavailableError(Exception):
+    """Raised when every model failed or is behind an open circuit"""
+
+class CircuitBreaker:
+    """Per-model circuit breaker with exponential backoff
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls are skipped until the backoff expires; then a single probe call is
+    let through (half-open). Each time the circuit re-opens the backoff
+    doubles, up to ``max_backoff`` seconds.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 3, base_backoff: float = 5.0, max_backoff: float = 300.0,
+                 probe_timeout: float = 120.0):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.probe_timeout = probe_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_count = 0
+        self.open_until = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may be made now
+
+        A probe that hasn't reported back within ``probe_timeout`` seconds
+        is given up on, so a lost probe can't hold the circuit half-open.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == self.OPEN and now >= self.open_until:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state != self.HALF_OPEN:
+                return False
+            if not self._probe_in_flight or now - self._probe_started >= self.probe_timeout:
+                self._probe_in_flight = True
+                self._probe_started = now
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_count = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                backoff = min(self.max_backoff, self.base_backoff * (2 ** self.opened_count))
+                self.state = self.OPEN
+                self.open_until = time.monotonic() + backoff
+                self.opened_count += 1
+                self._probe_in_flight = False
+
+    def release_probe(self):
+        """Give up an unfinished call without judging the model, letting another probe through"""
+        with self._lock:
+            self._probe_in_flight = False
+
+class LatencyTracker:
+    """Rolling window of successful call latencies"""
+
+    def __init__(self, window: int = 100):
+        self.samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile, or 0.0 with no samples"""
+        with self._lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return 0.0
+        index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+        return ordered[index]
+
+class MeteredStream:
+    """Iterator over a streamed response that reports how the stream ended
+
+    ``on_first_chunk`` runs when the first chunk arrives (or the stream ends
+    empty), ``on_success`` once the last chunk has been read and
+    ``on_failure`` if reading a chunk raises, so a stream that dies halfway
+    counts against the model. Closing it early, or dropping it unread (a
+    losing hedge, a Streamlit rerun mid-stream), runs ``on_abandon``.
+    """
+
+    def __init__(self, chunks: Iterator, on_first_chunk: Callable[[], None], on_success: Callable[[], None],
+                 on_failure: Callable[[], None], on_abandon: Callable[[], None]):
+        self._chunks = iter(chunks)
+        self._on_first_chunk = on_first_chunk
+        self._on_success = on_success
+        self._on_failure = on_failure
+        self._on_abandon = on_abandon
+        self._started = False
+        self._finished = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._mark_started()
+            self._finish(self._on_success)
+            raise
+        except Exception:
+            self._finish(self._on_failure)
+            raise
+        self._mark_started()
+        return chunk
+
+    def close(self):
+        self._finish(self._on_abandon)
+        close = getattr(self._chunks, "close", None)
+        if callable(close):
+            close()
+
+    def __del__(self):
+        self._finish(self._on_abandon)
+
+    def _mark_started(self):
+        if not self._started:
+            self._started = True
+            self._on_first_chunk()
+
+    def _finish(self, callback: Callable[[], None]):
+        if not self._finished:
+            self._finished = True
+            callback()
+
+class ModelRouter:
+    """Route calls across models with circuit breakers and optional hedging
+
+    Healthy models are tried fastest first (rolling p50, preference order
+    breaks ties; a model without samples sorts last), so a degraded model
+    stops being the primary once it is slower or its circuit opens. With hedging, a second model is fired when
+    the first hasn't answered within its p95 and the first success wins.
+    """
+
+    def __init__(self, models: List[str], hedge: bool = False, hedge_min_delay: float = 0.5,
+                 failure_threshold: int = 3, base_backoff: float = 5.0, max_backoff: float = 300.0,
+                 probe_timeout: float = 120.0, max_workers: int = 4):
+        self.models = list(models)
+        self.hedge = hedge
+        self.hedge_min_delay = hedge_min_delay
+        self.breakers = {
+            model: CircuitBreaker(failure_threshold, base_backoff, max_backoff, probe_timeout) for model in self.models
+        }
+        self.latencies = {model: LatencyTracker() for model in self.models}
+        self.calls = {model: 0 for model in self.models}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="model-router")
+
+    def ordered_models(self) -> List[str]:
+        """Models ordered by rolling p50 latency, preference order breaking ties
+
+        An untried model has no latency yet and sorts after every measured
+        one, so one fast call doesn't hand all traffic to a model never used.
+        """
+        def p50(model: str) -> float:
+            tracker = self.latencies[model]
+            return tracker.percentile(50) if len(tracker) else math.inf
+
+        return sorted(self.models, key=lambda model: (p50(model), self.models.index(model)))
+
+    def call(self, fn: Callable[[str], T], hedge: bool = None, stream: bool = False) -> Tuple[T, str]:
+        """Call ``fn(model)`` on the best available model; return (result, model)
+
+        With ``stream=True`` the result is wrapped in a MeteredStream: latency
+        is the time to the first chunk (whole-stream durations would inflate
+        the p95 that sets the hedge delay), success is recorded when the
+        stream ends, an error while reading it counts as a failure for the
+        model's breaker, and an abandoned stream releases a half-open probe.
+        """
+        hedge = self.hedge if hedge is None else hedge
+        candidates = self.ordered_models()
+        attempted = False
+        last_error = None
+
+        while candidates:
+            model = candidates.pop(0)
+            if not self.breakers[model].allow():
+                continue
+            attempted = True
+            if hedge and candidates:
+                try:
+                    return self._hedged_call(fn, model, candidates, stream)
+                except ModelUnavailableError as e:
+                    last_error = e.__cause__ or e
+                    continue
+            try:
+                return self._timed_call(fn, model, stream), model
+            except Exception as e:
+                logging.warning(f"Model {model} failed: {str(e)}")
+                last_error = e
+
+        if not attempted:
+            raise ModelUnavailableError("All models are temporarily unavailable (circuits open)")
+        raise ModelUnavailableError(f"All models failed: {last_error}") from last_error
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Breaker state, call counts and latency percentiles per model"""
+        return {
+            model: {
+                "state": self.breakers[model].state,
+                "failures": self.breakers[model].failures,
+                "calls": self.calls[model],
+                "p50": self.latencies[model].percentile(50),
+                "p95": self.latencies[model].percentile(95)
+            }
+            for model in self.models
+        }
+
+    def _timed_call(self, fn: Callable[[str], T], model: str, stream: bool = False) -> T:
+        self.calls[model] += 1
+        started = time.monotonic()
+        try:
+            result = fn(model)
+        except Exception:
+            self.breakers[model].record_failure()
+            raise
+        breaker = self.breakers[model]
+        if stream:
+            return MeteredStream(result, lambda: self._record_latency(model, started), breaker.record_success,
+                                 breaker.record_failure, breaker.release_probe)
+        self._record_latency(model, started)
+        breaker.record_success()
+        return result
+
+    def _record_latency(self, model: str, started: float):
+        self.latencies[model].record(time.monotonic() - started)
+
+    def _hedged_call(self, fn: Callable[[str], T], primary: str, candidates: List[str],
+                     stream: bool = False) -> Tuple[T, str]:
+        """Run ``primary``; fire the next candidate if it is slower than its p95
+
+        Consumes the hedge model (and any skipped ones) from ``candidates``. Raises
+        ModelUnavailableError (chained to the last error) if both fail.
+        """
+        delay = max(self.hedge_min_delay, self.latencies[primary].percentile(95))
+        futures = {self._executor.submit(self._timed_call, fn, primary, stream): primary}
+        done, _ = wait(futures, timeout=delay)
+
+        if not done:
+            while candidates:
+                hedge_model = candidates.pop(0)
+                if self.breakers[hedge_model].allow():
+                    futures[self._executor.submit(self._timed_call, fn, hedge_model, stream)] = hedge_model
+                    break
+
+        pending = set(futures)
+        last_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logging.warning(f"Model {futures[future]} failed: {str(e)}")
+                    last_error = e
+                    continue
+                for loser in pending:
+                    loser.add_done_callback(_discard_result)
+                return result, futures[future]
+
+        raise ModelUnavailableError(f"Hedged call failed: {last_error}") from last_error
+
+def _discard_result(future):
+    """Close a losing hedged result (e.g. an unread stream)"""
+    try:
+        result = future.result()
+    except Exception:
+        return
+    close = getattr(result, "close", None)
+    if callable(close):
+        close()
@@ -0,0 +1,250 @@
+"""HTTP inference service for the Titanic and Salary models
+
+Run from the project directory:
+
+    python -m utils.model_server --port 8600
+
+Endpoints:
+
+    GET  /health                 liveness check
+    GET  /models                 registered models and their versions
+    POST /predict/<model>        one JSON record -> one prediction (micro-batched)
+    POST /batch/<model>          {"rows": [records...]} -> predictions, one predict call
+
+Single-record requests are queued and coalesced into micro-batches, so many
+concurrent clients share one vectorized ``predict`` call. Models come from
+the same ``ModelRegistry`` the Streamlit pages use.
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from utils.model_cache import ModelCache
+from utils.model_registry import ModelRegistry, get_default_registry
+from utils import salary_model, titanic_model
+
+def predict_titanic(artifact, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    probabilities = artifact["model"].predict_proba(frame[titanic_model.FEATURES])[:, 1]
+    return [{"survived": int(p >= 0.5), "probability": round(float(p), 4)} for p in probabilities]
+
+def predict_salary(model, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    salaries = model.predict(frame[[salary_model.FEATURE]])
+    return [{"salary": float(salary)} for salary in salaries]
+
+PREDICTORS: Dict[str, Callable[[Any, pd.DataFrame], List[Dict[str, Any]]]] = {
+    "titanic": predict_titanic,
+    salary_model.MODEL_NAME: predict_salary
+}
+
+class MicroBatcher:
+    """Coalesces single-record requests into batched predict calls
+
+    One collector thread forms the batches: it waits for a free predict
+    worker, takes the first queued record, then keeps collecting until
+    ``max_batch`` records or ``max_wait`` seconds have passed, and hands the
+    batch to one of ``workers`` predict threads. While every worker is busy
+    requests pile up in the queue, so the next batch fills instantly; when
+    idle a request waits at most ``max_wait``.
+    """
+
+    def __init__(self, predict: Callable[[pd.DataFrame], List[Dict[str, Any]]], max_batch: int = 64,
+                 max_wait: float = 0.002, workers: int = None):
+        self.predict = predict
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.records = 0
+        self._stats_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        workers = workers or os.cpu_count() or 1
+        self._free_workers = threading.Semaphore(workers)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="micro-batch-predict")
+        self._collector = threading.Thread(target=self._collect, name="micro-batch-collector", daemon=True)
+        self._collector.start()
+
+    def submit(self, record: Dict[str, Any]) -> Future:
+        future: Future = Future()
+        self._queue.put((record, future))
+        return future
+
+    def _collect(self):
+        while True:
+            self._free_workers.acquire()
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            closing = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+            self._pool.submit(self._run_batch, batch)
+            if closing:
+                return
+
+    def _run_batch(self, batch):
+        try:
+            self._answer(batch)
+        finally:
+            self._free_workers.release()
+
+    def _answer(self, batch):
+        try:
+            results = self.predict(pd.DataFrame([record for record, _ in batch]))
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+            else:
+                # One malformed record must not fail its neighbours; retry them one by one
+                for item in batch:
+                    self._answer([item])
+            return
+        with self._stats_lock:
+            self.batches += 1
+            self.records += len(batch)
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def close(self):
+        """Answer what is already queued, then stop the collector and workers"""
+        self._queue.put(None)
+        self._collector.join()
+        self._pool.shutdown(wait=True)
+
+class ModelService:
+    """Registry-backed predictions with one micro-batcher per model"""
+
+    def __init__(self, registry: ModelRegistry = None, max_batch: int = 64, max_wait: float = 0.002,
+                 workers: int = None):
+        self.registry = registry or get_default_registry()
+        if "titanic" not in self.registry.names():
+            self.registry.register("titanic", titanic_model.ensure_trained(ModelCache(), params=titanic_model.load_promoted()))
+        self.batchers = {
+            name: MicroBatcher(self._predictor(name), max_batch, max_wait, workers)
+            for name in PREDICTORS
+        }
+
+    def _predictor(self, name: str) -> Callable[[pd.DataFrame], List[Dict[str, Any]]]:
+        predictor = PREDICTORS[name]
+        return lambda frame: predictor(self.registry.get(name), frame)
+
+    def predict_one(self, name: str, record: Dict[str, Any], timeout: float = 10.0) -> Dict[str, Any]:
+        return self.batchers[name].submit(record).result(timeout)
+
+    def predict_many(self, name: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not records:
+            return []
+        return PREDICTORS[name](self.registry.get(name), pd.DataFrame(records))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            name: {"batches": batcher.batches, "records": batcher.records,
+                   "avg_batch": round(batcher.records / batcher.batches, 2) if batcher.batches else 0.0}
+            for name, batcher in self.batchers.items()
+        }
+
+    def close(self):
+        for batcher in self.batchers.values():
+            batcher.close()
+
+class ModelRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so load tests don't pay a TCP handshake per request
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    service: ModelService = None
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"status": "ok"})
+        elif self.path == "/models":
+            self._send(200, {"models": self.service.registry.info(), "batching": self.service.stats()})
+        else:
+            self._send(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        # Always drain the body so the kept-alive connection stays in sync
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0) or 0))
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] not in ("predict", "batch") or parts[1] not in PREDICTORS:
+            self._send(404, {"error": f"Unknown path: {self.path}"})
+            return
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            self._send(400, {"error": "Body must be JSON"})
+            return
+
+        endpoint, name = parts
+        try:
+            if endpoint == "predict":
+                if not isinstance(payload, dict):
+                    raise ValueError("Expected a JSON object")
+                self._send(200, self.service.predict_one(name, payload))
+            else:
+                rows = payload.get("rows") if isinstance(payload, dict) else payload
+                if not isinstance(rows, list):
+                    raise ValueError("Expected {\"rows\": [...]}")
+                self._send(200, {"predictions": self.service.predict_many(name, rows)})
+        except (KeyError, ValueError, TypeError) as e:
+            self._send(400, {"error": f"Invalid input: {str(e)}"})
+        except Exception as e:
+            logging.error(f"Prediction failed for {name}: {str(e)}")
+            self._send(500, {"error": "Prediction failed"})
+
+    def _send(self, status: int, body: Dict[str, Any]):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logging.debug("%s - %s", self.address_string(), format % args)
+
+def create_server(host: str = "127.0.0.1", port: int = 8600, service: ModelService = None) -> ThreadingHTTPServer:
+    handler = type("BoundModelRequestHandler", (ModelRequestHandler,), {"service": service or ModelService()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def main(argv: List[str] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the Titanic and Salary models over HTTP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--workers", type=int, default=None, help="Predict workers per model (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    service = ModelService(max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000, workers=args.workers)
+    server = create_server(args.host, args.port, service)
+    print(f"Serving models on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import atexit
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+def normalize_question(question: str) -> str:
+    """Lower-case, drop punctuation and collapse whitespace"""
+    question = re.sub(r"[^\w\s]", " ", question.lower())
+    return " ".join(question.split())
+
+# Politeness and article words that don't change what is being asked. Negations
+# ("not", "no", "never", ...) are deliberately absent so they always count.
+FILLER_WORDS = frozenset({"a", "an", "the", "please", "pls", "kindly", "hey", "hi", "hello",
+                          "can", "could", "would", "you", "tell", "me"})
+
+def token_key(normalized: str) -> str:
+    """The question's content words in their original order
+
+    Order is kept on purpose: "celsius to fahrenheit" and "fahrenheit to
+    celsius" ask different things.
+    """
+    return " ".join(word for word in normalized.split() if word not in FILLER_WORDS)
+
+class ResponseCache:
+    """LRU response cache keyed by domain + normalized question
+
+    Lookups try an exact match first and then a near-duplicate match: a
+    cached question in the same domain with the same content words in the
+    same order, ignoring only filler like "please" or "the". Anything that
+    differs by a real word ("safe"/"unsafe", an added "not") or by word order
+    ("A bigger than B"/"B bigger than A") is a miss, so a near hit never
+    answers a different question. Entries
+    expire after ``ttl`` seconds and the oldest are evicted past
+    ``max_entries``. The cache is persisted to ``path`` as JSON at most every
+    ``save_interval`` seconds (and at exit) rather than on every insert.
+    """
+
+    def __init__(self, path: str = None, ttl: float = 24 * 3600, max_entries: int = 1000,
+                 save_interval: float = 5.0):
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.save_interval = save_interval
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._token_index: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._stats = {"exact_hits": 0, "near_hits": 0, "misses": 0, "saved_seconds": 0.0}
+        self._load()
+        if self.path:
+            atexit.register(self.flush)
+
+    def get(self, domain: str, question: str) -> Optional[str]:
+        """Return a cached answer or None"""
+        normalized = normalize_question(question)
+        key = (domain, normalized)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry["created"] < self.ttl:
+                self._entries.move_to_end(key)
+                self._record_hit("exact_hits", entry)
+                return entry["answer"]
+
+            match = self._nearest(domain, normalized, now)
+            if match is not None:
+                self._entries.move_to_end(match)
+                entry = self._entries[match]
+                self._record_hit("near_hits", entry)
+                return entry["answer"]
+
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, domain: str, question: str, answer: str, latency: float = 0.0):
+        """Store an answer along with the latency it took to produce"""
+        normalized = normalize_question(question)
+        key = (domain, normalized)
+        with self._lock:
+            self._entries[key] = {"answer": answer, "created": time.time(), "latency": latency}
+            self._entries.move_to_end(key)
+            self._token_index[(domain, token_key(normalized))] = key
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._unindex(evicted)
+            self._dirty = True
+            due = time.monotonic() - self._saved_at >= self.save_interval
+        if due:
+            self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit counts, hit rate and total API latency avoided"""
+        with self._lock:
+            hits = self._stats["exact_hits"] + self._stats["near_hits"]
+            lookups = hits + self._stats["misses"]
+            return dict(
+                self._stats,
+                hits=hits,
+                lookups=lookups,
+                hit_rate=hits / lookups if lookups else 0.0,
+                entries=len(self._entries)
+            )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._token_index.clear()
+            self._dirty = True
+        self.flush()
+
+    def flush(self):
+        """Write pending inserts to ``path``"""
+        if not self.path:
+            return
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                entries = [
+                    {"domain": domain, "question": question, **entry}
+                    for (domain, question), entry in self._entries.items()
+                ]
+                self._dirty = False
+                self._saved_at = time.monotonic()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+
+    def _record_hit(self, kind: str, entry: Dict[str, Any]):
+        self._stats[kind] += 1
+        self._stats["saved_seconds"] += entry.get("latency", 0.0)
+
+    def _nearest(self, domain: str, normalized: str, now: float) -> Optional[Tuple[str, str]]:
+        """Fresh entry in the same domain asking with the same content words"""
+        if not normalized:
+            return None
+        key = self._token_index.get((domain, token_key(normalized)))
+        if key is None or key not in self._entries or now - self._entries[key]["created"] >= self.ttl:
+            return None
+        return key
+
+    def _unindex(self, key: Tuple[str, str]):
+        index_key = (key[0], token_key(key[1]))
+        if self._token_index.get(index_key) == key:
+            del self._token_index[index_key]
+
+    def _load(self):
+        if not self.path or not self.path.exists():
+            return
+        try:
+            items = json.loads(self.path.read_text(encoding="utf-8"))["entries"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        now = time.time()
+        for item in items:
+            try:
+                if now - item["created"] >= self.ttl:
+                    continue
+                key = (item["domain"], item["question"])
+                entry = {"answer": item["answer"], "created": item["created"], "latency": item.get("latency", 0.0)}
+            except (KeyError, TypeError, AttributeError):
+                continue
+            self._entries[key] = entry
+            self._token_index[(key[0], token_key(key[1]))] = key
@@ -0,0 +1,19 @@
+import numpy as np
+import pandas as pd
+
+FEATURE = "YearsExperience"
+MODEL_NAME = "salary"
+
+def prediction_curve(model, start: float = 0.0, stop: float = 25.0, step: float = 0.1) -> pd.DataFrame:
+    """Predicted salary over an evenly spaced experience grid, in one predict call"""
+    count = int(round((stop - start) / step)) + 1
+    grid = np.round(start + step * np.arange(count), 6)
+    salaries = model.predict(pd.DataFrame({FEATURE: grid}))
+    return pd.DataFrame({FEATURE: grid, "Salary": np.asarray(salaries, dtype=np.float64)})
+
+def curve_lookup(curve: pd.DataFrame, experience: float) -> float:
+    """Salary at the grid point nearest to ``experience``"""
+    grid = curve[FEATURE].to_numpy()
+    step = grid[1] - grid[0] if len(grid) > 1 else 1.0
+    index = int(np.clip(round((experience - grid[0]) / step), 0, len(grid) - 1))
+    return float(curve["Salary"].iat[index])
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import requests
+
+DEFAULT_CACHE_DIR = Path(".cache/scrape")
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; CommandHub/1.0)"}
+
+class ScrapedPage:
+    """A cached page body with its validators"""
+
+    __slots__ = ("url", "text", "etag", "last_modified", "fetched_at", "content_hash")
+
+    def __init__(self, url: str, text: str, etag: str = None, last_modified: str = None,
+                 fetched_at: float = 0.0, content_hash: str = None):
+        self.url = url
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+        self.content_hash = content_hash or hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+class ScrapeCache:
+    """TTL cache for scraped pages with conditional revalidation
+
+    ``get()`` serves from memory, then from disk, and only touches the
+    network when nothing is cached. Stale entries are still served while a
+    background refresher revalidates them with If-None-Match /
+    If-Modified-Since, so the network is used at most once per TTL and a
+    304 costs no body transfer. After a failed refresh the stale copy keeps
+    being served and the URL is not retried for ``retry_after`` seconds.
+    """
+
+    def __init__(self, cache_dir: str = None, ttl: float = 3600, timeout=(5, 20),
+                 session: requests.Session = None, refresh_interval: float = None,
+                 retry_after: float = 300):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.session = session or requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self._pages: Dict[str, ScrapedPage] = {}
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._failed_at: Dict[str, float] = {}
+        self._stop = threading.Event()
+        self._refresher = None
+        if refresh_interval:
+            self.start_refresher(refresh_interval)
+
+    def get(self, url: str) -> ScrapedPage:
+        """Return the page, fetching synchronously only on a cold cache"""
+        page = self._pages.get(url) or self._load(url)
+        if page is None:
+            return self.refresh(url)
+
+        if self.is_stale(page):
+            self._refresh_in_background(url)
+        return page
+
+    def is_stale(self, page: ScrapedPage) -> bool:
+        return time.time() - page.fetched_at >= self.ttl
+
+    def refresh(self, url: str) -> ScrapedPage:
+        """Revalidate (or fetch) a page now and persist the result"""
+        cached = self._pages.get(url) or self._load(url)
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        unchanged = response.status_code == 304 and cached is not None
+        if unchanged:
+            page = ScrapedPage(url, cached.text, cached.etag, cached.last_modified, time.time(), cached.content_hash)
+        else:
+            response.raise_for_status()
+            page = ScrapedPage(
+                url,
+                response.text,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                time.time()
+            )
+
+        with self._lock:
+            self._pages[url] = page
+        self._save(page, write_body=not unchanged)
+        return page
+
+    def start_refresher(self, interval: float = 60.0):
+        """Periodically revalidate stale cached pages on a daemon thread"""
+        if self._refresher is not None:
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.wait(interval):
+                for url, page in list(self._pages.items()):
+                    if self.is_stale(page) and self._claim(url):
+                        self._safe_refresh(url)
+
+        self._refresher = threading.Thread(target=run, name="scrape-refresher", daemon=True)
+        self._refresher.start()
+
+    def stop_refresher(self):
+        self._stop.set()
+        self._refresher = None
+
+    def _refresh_in_background(self, url: str):
+        if self._claim(url):
+            threading.Thread(target=self._safe_refresh, args=(url,), daemon=True).start()
+
+    def _claim(self, url: str) -> bool:
+        """Reserve a background refresh of ``url``
+
+        False while another refresh of it is in flight or its last attempt
+        failed less than ``retry_after`` seconds ago. Both the on-demand and
+        the periodic refresher go through here, so they never overlap.
+        """
+        with self._lock:
+            if url in self._refreshing:
+                return False
+            if time.monotonic() - self._failed_at.get(url, -math.inf) < self.retry_after:
+                return False
+            self._refreshing.add(url)
+            return True
+
+    def _safe_refresh(self, url: str):
+        """Refresh a URL reserved by ``_claim`` and release it"""
+        failed = False
+        try:
+            self.refresh(url)
+        except Exception as e:
+            failed = True
+            logging.error(f"Failed to refresh {url}, serving stale copy for {self.retry_after:.0f}s: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(url)
+                if failed:
+                    self._failed_at[url] = time.monotonic()
+                else:
+                    self._failed_at.pop(url, None)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.html"
+
+    def _load(self, url: str) -> Optional[ScrapedPage]:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            text = body_path.read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return None
+        page = ScrapedPage(url, text, meta.get("etag"), meta.get("last_modified"),
+                           meta.get("fetched_at", 0.0), meta.get("content_hash"))
+        with self._lock:
+            self._pages[url] = page
+        return page
+
+    def _save(self, page: ScrapedPage, write_body: bool = True):
+        meta_path, body_path = self._paths(page.url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        meta: Dict[str, Any] = {
+            "url": page.url,
+            "etag": page.etag,
+            "last_modified": page.last_modified,
+            "fetched_at": page.fetched_at,
+            "content_hash": page.content_hash
+        }
+        # Body first, so metadata never points at a missing or partial body
+        writes = [(meta_path, json.dumps(meta))]
+        if write_body or not body_path.exists():
+            writes.insert(0, (body_path, page.text))
+        for path, content in writes:
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(tmp_path, path)
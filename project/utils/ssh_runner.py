@@ -1,8 +1,12 @@
-import paramiko
 import subprocess
 import sys
 from typing import Dict, Any, Optional
 
+from utils.lazy_imports import lazy_import
+
+# Only SSH connections need paramiko; local commands run without it
+paramiko = lazy_import("paramiko")
+
 class SSHRunner:
     """Handle SSH-based command execution for remote Linux systems"""
     
@@ -0,0 +1,114 @@
+import copy
+import hashlib
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Tuple
+
+# Markup whose text is never shown to a visitor
+INVISIBLE_TAGS = ["script", "style", "noscript", "svg", "iframe", "head", "template", "meta", "link"]
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "for", "from", "how", "i", "in",
+    "is", "it", "me", "my", "of", "on", "or", "tell", "that", "the", "this", "to", "what", "which",
+    "with", "about", "any", "you", "your"
+}
+
+def extract_visible_text(soup) -> str:
+    """Visible text of a BeautifulSoup document, one block per line"""
+    soup = copy.copy(soup)
+    for tag in soup(INVISIBLE_TAGS):
+        tag.decompose()
+    lines = (" ".join(line.split()) for line in soup.get_text(separator="\n").splitlines())
+    return "\n".join(line for line in lines if line)
+
+def chunk_text(text: str, chunk_words: int = 120, overlap: int = 30) -> List[str]:
+    """Split text into overlapping windows of ``chunk_words`` words"""
+    words = text.split()
+    if not words:
+        return []
+    step = max(1, chunk_words - overlap)
+    chunks = []
+    for start in range(0, len(words), step):
+        chunks.append(" ".join(words[start:start + chunk_words]))
+        if start + chunk_words >= len(words):
+            break
+    return chunks
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+class BM25Index:
+    """Incremental BM25 index over text chunks
+
+    Chunks are keyed by content hash, so ``sync()`` with a new scrape only
+    tokenizes chunks that weren't indexed before and removes the ones that
+    disappeared; unchanged chunks are left alone.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.version = None
+        self._chunks: Dict[str, str] = {}
+        self._lengths: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def sync(self, version: str, chunks: List[str]) -> Tuple[int, int]:
+        """Make the index match ``chunks``; returns (added, removed)"""
+        with self._lock:
+            if version is not None and version == self.version:
+                return 0, 0
+            wanted = {hashlib.sha1(chunk.encode("utf-8")).hexdigest(): chunk for chunk in chunks}
+            removed = [chunk_id for chunk_id in self._chunks if chunk_id not in wanted]
+            added = [chunk_id for chunk_id in wanted if chunk_id not in self._chunks]
+            for chunk_id in removed:
+                self._remove(chunk_id)
+            for chunk_id in added:
+                self._add(chunk_id, wanted[chunk_id])
+            self.version = version
+            return len(added), len(removed)
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[float, str]]:
+        """Top-k (score, chunk) pairs for the query"""
+        terms = set(tokenize(query))
+        with self._lock:
+            count = len(self._chunks)
+            if not count or not terms:
+                return []
+            average_length = self._total_length / count or 1.0
+            scores: Counter = Counter()
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for chunk_id, frequency in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[chunk_id] / average_length)
+                    scores[chunk_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+            return [(score, self._chunks[chunk_id]) for chunk_id, score in scores.most_common(k)]
+
+    def _add(self, chunk_id: str, chunk: str):
+        tokens = tokenize(chunk)
+        self._chunks[chunk_id] = chunk
+        self._lengths[chunk_id] = len(tokens)
+        self._total_length += len(tokens)
+        for term, frequency in Counter(tokens).items():
+            self._postings.setdefault(term, {})[chunk_id] = frequency
+
+    def _remove(self, chunk_id: str):
+        chunk = self._chunks.pop(chunk_id)
+        self._total_length -= self._lengths.pop(chunk_id)
+        for term in set(tokenize(chunk)):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(chunk_id, None)
+                if not postings:
+                    del self._postings[term]
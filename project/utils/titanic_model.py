@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from utils.datasets import SCHEMAS, load_dataset
+from utils.lazy_imports import lazy_import
+from utils.model_cache import fingerprint
+
+pd = lazy_import("pandas")
+# Only needed to train; inference with a cached pipeline never imports them
+sklearn_metrics = lazy_import("sklearn.metrics")
+sklearn_model_selection = lazy_import("sklearn.model_selection")
+
+DATA_PATH = SCHEMAS["titanic"]["path"]
+FEATURES = ["Pclass", "Sex", "Age", "SibSp", "Parch", "Fare", "Embarked"]
+TARGET = "Survived"
+SEX_CODES = {"male": 0, "female": 1}
+EMBARKED_CODES = {"S": 0, "C": 1, "Q": 2}
+
+DEFAULT_PARAMS = {"max_iter": 200, "test_size": 0.2, "random_state": 1}
+
+# Model chosen on the experiments leaderboard; absent until something is promoted
+PROMOTED_PATH = Path(".cache/models/titanic_promoted.json")
+
+# Bump when the artifact layout changes so stale cached models are not reused
+ARTIFACT_VERSION = 2
+
+# The sklearn pipeline lives in utils.titanic_pipeline so importing this module
+# doesn't import sklearn, numpy or pandas. Its names stay reachable here, which
+# also lets artifacts pickled before the split resolve TitanicPreprocessor.
+PIPELINE_NAMES = {"TitanicPreprocessor", "make_pipeline", "build_pipeline"}
+
+def __getattr__(name: str):
+    if name in PIPELINE_NAMES:
+        from utils import titanic_pipeline
+        return getattr(titanic_pipeline, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def load_promoted() -> Dict[str, Any]:
+    """Training params of the promoted model, or {} for the default model"""
+    try:
+        promoted = json.loads(PROMOTED_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {"model_type": promoted["model_type"], "model_params": promoted["model_params"]}
+
+def promote(model_type: str, model_params: Dict[str, Any], cv_accuracy: float = None):
+    """Make a leaderboard entry the model the page trains and serves"""
+    PROMOTED_PATH.parent.mkdir(parents=True, exist_ok=True)
+    record = {"model_type": model_type, "model_params": model_params,
+              "cv_accuracy": cv_accuracy, "promoted_at": time.time()}
+    tmp_path = PROMOTED_PATH.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(record), encoding="utf-8")
+    os.replace(tmp_path, PROMOTED_PATH)
+    if _training_inputs is not None:
+        _training_inputs.invalidate()
+
+class TrainingInputs:
+    """Dataset version and promoted params, re-read at most once per ``check_interval``
+
+    The page needs both on every rerun to pick the trained artifact; like
+    the registry's artifact stat, they are checked on disk only when the
+    interval has passed, so reruns in between touch no files.
+    """
+
+    def __init__(self, check_interval: float = 5.0):
+        self.check_interval = check_interval
+        self._value: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> Tuple[float, Dict[str, Any]]:
+        """(dataset mtime, training params including any promoted model)"""
+        with self._lock:
+            now = time.monotonic()
+            if self._value is None or now - self._checked_at >= self.check_interval:
+                self._value = (os.path.getmtime(DATA_PATH), {**DEFAULT_PARAMS, **load_promoted()})
+                self._checked_at = now
+            data_version, params = self._value
+            return data_version, dict(params)
+
+    def invalidate(self):
+        with self._lock:
+            self._value = None
+
+_training_inputs = None
+_training_inputs_lock = threading.Lock()
+
+def get_training_inputs(check_interval: float = 5.0) -> TrainingInputs:
+    """Process-wide TrainingInputs; ``promote`` invalidates it so a promotion shows at once"""
+    global _training_inputs
+    with _training_inputs_lock:
+        if _training_inputs is None:
+            _training_inputs = TrainingInputs(check_interval)
+        return _training_inputs
+
+def train(df: pd.DataFrame, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Fit preprocessing + model on raw rows; returns the artifact stored in the model cache"""
+    params = {**DEFAULT_PARAMS, **(params or {})}
+    X = df[FEATURES]
+    y = df[TARGET]
+    X_train, X_test, y_train, y_test = sklearn_model_selection.train_test_split(
+        X, y, test_size=params["test_size"], random_state=params["random_state"]
+    )
+    from utils.titanic_pipeline import build_pipeline
+
+    pipeline = build_pipeline(params)
+    pipeline.fit(X_train, y_train)
+    accuracy = sklearn_metrics.accuracy_score(y_test, pipeline.predict(X_test))
+    return {"model": pipeline, "accuracy": accuracy, "params": params, "features": FEATURES}
+
+def passenger_frame(pclass, sex, age, sibsp, parch, fare, embarked) -> pd.DataFrame:
+    """One raw passenger row in the shape the pipeline expects"""
+    return pd.DataFrame([[pclass, sex, age, sibsp, parch, fare, embarked]], columns=FEATURES)
+
+def ensure_trained(cache, df: pd.DataFrame = None, params: Dict[str, Any] = None) -> Path:
+    """Path of the trained artifact for (dataset, params), training it once if needed"""
+    if df is None:
+        df = load_dataset("titanic")
+    params = {**DEFAULT_PARAMS, **(params or {})}
+    key = fingerprint(df, {**params, "artifact_version": ARTIFACT_VERSION})
+    return cache.ensure(key, lambda: train(df, params))
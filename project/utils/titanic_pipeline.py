@@ -0,0 +1,49 @@
+from typing import Dict, Any
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.pipeline import Pipeline
+
+from utils.experiments import make_estimator
+from utils.titanic_model import EMBARKED_CODES, FEATURES, SEX_CODES
+
+class TitanicPreprocessor(BaseEstimator, TransformerMixin):
+    """Imputes and encodes raw passenger rows into the model's feature matrix
+
+    ``fit`` learns the imputation statistics (mean age, mean fare, most
+    common sex/port) from training data only; ``transform`` applies them to
+    whole columns at once, so one fitted object serves the single-row form,
+    batch files and the HTTP service alike.
+    """
+
+    def fit(self, X: pd.DataFrame, y=None):
+        self.age_mean_ = float(X["Age"].mean())
+        self.fare_mean_ = float(X["Fare"].mean())
+        self.sex_mode_ = str(X["Sex"].mode()[0])
+        self.embarked_mode_ = str(X["Embarked"].mode()[0])
+        return self
+
+    def transform(self, X: pd.DataFrame) -> np.ndarray:
+        out = np.empty((len(X), len(FEATURES)), dtype=np.float64)
+        out[:, 0] = pd.to_numeric(X["Pclass"], errors="coerce").fillna(3).to_numpy()
+        out[:, 1] = X["Sex"].astype(object).str.lower().map(SEX_CODES).fillna(SEX_CODES[self.sex_mode_]).to_numpy()
+        out[:, 2] = pd.to_numeric(X["Age"], errors="coerce").fillna(self.age_mean_).to_numpy()
+        out[:, 3] = pd.to_numeric(X["SibSp"], errors="coerce").fillna(0).to_numpy()
+        out[:, 4] = pd.to_numeric(X["Parch"], errors="coerce").fillna(0).to_numpy()
+        out[:, 5] = pd.to_numeric(X["Fare"], errors="coerce").fillna(self.fare_mean_).to_numpy()
+        out[:, 6] = X["Embarked"].astype(object).map(EMBARKED_CODES).fillna(EMBARKED_CODES[self.embarked_mode_]).to_numpy()
+        return out
+
+    def get_feature_names_out(self, input_features=None):
+        return np.asarray(FEATURES, dtype=object)
+
+def make_pipeline(model_type: str, model_params: Dict[str, Any]) -> Pipeline:
+    return Pipeline([
+        ("preprocess", TitanicPreprocessor()),
+        ("model", make_estimator(model_type, model_params))
+    ])
+
+def build_pipeline(params: Dict[str, Any]) -> Pipeline:
+    model_type = params.get("model_type", "logistic_regression")
+    return make_pipeline(model_type, params.get("model_params", {"max_iter": params["max_iter"]}))